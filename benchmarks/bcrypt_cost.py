@@ -0,0 +1,42 @@
+"""Measure bcrypt verify latency per cost on this host.
+
+    python -m benchmarks.bcrypt_cost --min 8 --max 13 --repeat 5
+"""
+
+import argparse
+import statistics
+import time
+
+from src.core.shared.infra.cryptography.bcrypt_hasher import BcryptHasher
+
+
+def measure(rounds: int, repeat: int) -> list[float]:
+    hasher = BcryptHasher(rounds=rounds)
+    hashed = hasher.hash("benchmark-password")
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        hasher.verify("benchmark-password", hashed)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--min", type=int, default=8, dest="min_rounds")
+    parser.add_argument("--max", type=int, default=13, dest="max_rounds")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'cost':>4}  {'median ms':>10}  {'min ms':>8}  {'max ms':>8}")
+    for rounds in range(args.min_rounds, args.max_rounds + 1):
+        timings = measure(rounds, args.repeat)
+        print(
+            f"{rounds:>4}  {statistics.median(timings):>10.1f}"
+            f"  {min(timings):>8.1f}  {max(timings):>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Measure list serialization throughput of the collection presenters.
+
+    python -m benchmarks.presenter_serialization --items 100 --iterations 200
+
+"before" compiles a TypeAdapter per item, as the presenters used to;
+"after" is the current serialize() with cached list adapters.
+"""
+
+import argparse
+import datetime
+import time
+import uuid
+from typing import Callable
+
+from pydantic import TypeAdapter
+
+from src.core.account.application.use_cases.common.user_output import UserOutput
+from src.core.account.application.use_cases.list_users import ListUsersOutput
+from src.core.category.application.use_cases.common.category_output import (
+    CategoryOutput,
+)
+from src.core.category.application.use_cases.list_categories import (
+    ListCategoriesOutput,
+)
+from src.django_app.account_app.presenters import UserCollectionPresenter
+from src.django_app.category_app.presenters import CategoryCollectionPresenter
+
+
+def users_output(count: int) -> ListUsersOutput:
+    now = datetime.datetime.now(datetime.timezone.utc)
+    items = [
+        UserOutput(
+            id=uuid.uuid4(),
+            name=f"User {index}",
+            email=f"user{index}@example.com",
+            is_staff=False,
+            is_superuser=False,
+            is_active=True,
+            created_at=now,
+            updated_at=now,
+        )
+        for index in range(count)
+    ]
+    return ListUsersOutput(
+        items=items, total=count, current_page=1, per_page=count, last_page=1
+    )
+
+
+def categories_output(count: int) -> ListCategoriesOutput:
+    now = datetime.datetime.now(datetime.timezone.utc)
+    items = [
+        CategoryOutput(
+            id=uuid.uuid4(),
+            name=f"Category {index}",
+            description="Description",
+            is_active=True,
+            created_at=now,
+            updated_at=now,
+        )
+        for index in range(count)
+    ]
+    return ListCategoriesOutput(
+        items=items, total=count, current_page=1, per_page=count, last_page=1
+    )
+
+
+def serialize_before(presenter) -> list:
+    return [TypeAdapter(item.__class__).dump_python(item) for item in presenter.data]
+
+
+def lists_per_second(fn: Callable[[], object], iterations: int) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return iterations / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    presenters = {
+        "UserCollectionPresenter": UserCollectionPresenter(users_output(args.items)),
+        "CategoryCollectionPresenter": CategoryCollectionPresenter(
+            categories_output(args.items)
+        ),
+    }
+
+    print(f"{args.items} items per list")
+    print(f"{'presenter':<28}  {'before lists/s':>14}  {'after lists/s':>13}  {'speedup':>7}")
+    for name, presenter in presenters.items():
+        before = lists_per_second(
+            lambda: serialize_before(presenter), max(1, args.iterations // 10)
+        )
+        after = lists_per_second(presenter.serialize, args.iterations)
+        print(f"{name:<28}  {before:>14.1f}  {after:>13.1f}  {after / before:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
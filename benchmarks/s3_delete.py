@@ -0,0 +1,76 @@
+"""Measure S3Storage deletes against an in-memory S3 client.
+
+    python -m benchmarks.s3_delete --objects 20000 --posts 200 --latency 0.002
+
+The bucket holds `--objects` keys spread over `--posts` post folders; the
+first and the last listed folder are deleted. "before" lists the first page of
+the whole bucket and deletes substring matches one request at a time, as
+S3Storage.delete used to; "after" is the current prefix listing with batched
+delete_objects calls.
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from src.core.shared.infra.storage.in_memory_s3_client import InMemoryS3Client
+from src.core.shared.infra.storage.s3_storage import S3Storage
+
+
+def fill(client: InMemoryS3Client, objects: int, posts: int) -> None:
+    client.objects = {
+        f"images/{index % posts}/{index}.png": {"Body": b"", "ContentType": ""}
+        for index in range(objects)
+    }
+    client.calls = {}
+
+
+def delete_before(client: InMemoryS3Client, bucket: str, file_path: Path) -> None:
+    list_paths = client.list_objects_v2(Bucket=bucket)
+    if "Contents" in list_paths:
+        for path in list_paths["Contents"]:
+            if str(file_path) in path["Key"]:
+                client.delete_object(Bucket=bucket, Key=path["Key"])
+
+
+def run(name, delete, client: InMemoryS3Client, target: str, args) -> None:
+    fill(client, args.objects, args.posts)
+    expected = sum(1 for key in client.objects if key.startswith(f"{target}/"))
+    client.latency = args.latency
+
+    start = time.perf_counter()
+    delete()
+    elapsed = (time.perf_counter() - start) * 1000
+
+    client.latency = 0.0
+    left = sum(1 for key in client.objects if key.startswith(f"{target}/"))
+    print(
+        f"{name:>6}  {elapsed:>9.1f}  {sum(client.calls.values()):>8}"
+        f"  {expected - left:>7}/{expected}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--objects", type=int, default=20000)
+    parser.add_argument("--posts", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.002)
+    args = parser.parse_args()
+
+    client = InMemoryS3Client()
+    storage = S3Storage(s3_client=client, bucket_name="bucket")
+
+    for target in ("images/0", f"images/{args.posts - 1}"):
+        print(f"\n{target}\n{'':>6}  {'ms':>9}  {'requests':>8}  {'deleted':>7}")
+        run(
+            "before",
+            lambda: delete_before(client, "bucket", Path(target)),
+            client,
+            target,
+            args,
+        )
+        run("after", lambda: storage.delete(Path(target)), client, target, args)
+
+
+if __name__ == "__main__":
+    main()
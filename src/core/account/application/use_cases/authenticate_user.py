@@ -59,6 +59,10 @@ class AuthenticateUserUseCase(UseCase):
         if not self.cryptography.verify(input.password, user.password):
             raise InvalidCredentialsException()
 
+        if self.cryptography.needs_rehash(user.password):
+            user.rehash_password(self.cryptography.hash(input.password))
+            self.user_repository.update(user)
+
         token = self.__generate_token(user)
 
         user_token = UserToken.create(
@@ -85,6 +89,7 @@ class AuthenticateUserUseCase(UseCase):
             "email": user.email,
             "is_staff": user.is_staff,
             "is_superuser": user.is_superuser,
+            "token_version": user.token_version,
             "exp": datetime.now(timezone.utc) + timedelta(seconds=3600),
         }
         return self.token_generator.generate(payload)
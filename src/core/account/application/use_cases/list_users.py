@@ -7,6 +7,7 @@ from src.core.account.application.use_cases.common.user_output import UserOutput
 from src.core.account.domain.user_repository import (
     IUserRepository,
     UserFilter,
+    UserReadModel,
     UserSearchParams,
     UserSearchResult,
 )
@@ -22,13 +23,26 @@ class ListUsersOutput(PaginationOutput[UserOutput]):
     pass
 
 
+@dataclass(slots=True)
+class ListUsersReadModelOutput(PaginationOutput[UserReadModel]):
+    pass
+
+
 class ListUsersUseCase(UseCase):
-    def __init__(self, user_repository: IUserRepository):
+    def __init__(self, user_repository: IUserRepository, use_read_model: bool = False):
         self.user_repository = user_repository
+        self.use_read_model = use_read_model
 
-    def execute(self, input: ListUsersInput) -> ListUsersOutput:
+    def execute(
+        self, input: ListUsersInput
+    ) -> ListUsersOutput | ListUsersReadModelOutput:
         params = UserSearchParams(**input.to_input())
 
+        if self.use_read_model:
+            # Read models already carry the output fields; no entities are built.
+            result = self.user_repository.search_read_models(params)
+            return ListUsersReadModelOutput.from_search_result(result.items, result)
+
         result = self.user_repository.search(params)
 
         return self.__to_output(result)
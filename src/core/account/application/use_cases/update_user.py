@@ -46,32 +46,33 @@ class UpdateUserUseCase(UseCase):
         if user is None:
             raise NotFoundException(input.id, User)
 
-        if input.name is not None:
-            user.change_name(input.name)
+        with user.changes():
+            if input.name is not None:
+                user.change_name(input.name)
 
-        if input.email != None and input.email != user.email:
-            user_with_same_email = self.user_repo.find_by_email(input.email)
+            if input.email != None and input.email != user.email:
+                user_with_same_email = self.user_repo.find_by_email(input.email)
 
-            if user_with_same_email:
-                raise UserAlreadyExistsException()
+                if user_with_same_email:
+                    raise UserAlreadyExistsException()
 
-            user.change_email(input.email)
+                user.change_email(input.email)
 
-        if input.password is not None:
-            hashed_password = self.cryptography.hash(input.password)
-            user.change_password(hashed_password)
+            if input.password is not None:
+                hashed_password = self.cryptography.hash(input.password)
+                user.change_password(hashed_password)
 
-        if input.is_staff is not None:
-            user.change_is_staff(input.is_staff)
+            if input.is_staff is not None:
+                user.change_is_staff(input.is_staff)
 
-        if input.is_superuser is not None:
-            user.change_is_superuser(input.is_superuser)
+            if input.is_superuser is not None:
+                user.change_is_superuser(input.is_superuser)
 
-        if input.is_active is True:
-            user.activate()
+            if input.is_active is True:
+                user.activate()
 
-        if input.is_active is False:
-            user.deactivate()
+            if input.is_active is False:
+                user.deactivate()
 
         if user.notification.has_errors():
             raise EntityValidationException(user.notification.errors)
@@ -30,6 +30,7 @@ class User(AggregateRoot):
     is_staff: bool | None = False
     is_superuser: bool | None = False
     is_active: bool | None = True
+    token_version: int = 0
     created_at: Annotated[datetime.datetime, Strict()] = field(
         default_factory=lambda: datetime.datetime.now(datetime.UTC)
     )
@@ -54,36 +55,51 @@ class User(AggregateRoot):
 
     def change_name(self, name: str):
         self.name = name
-        self.touch()
-        self.validate()
+        self._after_change()
 
     def change_email(self, email: str):
+        if email != self.email:
+            self.revoke_tokens()
         self.email = email
-        self.touch()
-        self.validate()
+        self._after_change()
 
     def change_password(self, password: str):
+        if password != self.password:
+            self.revoke_tokens()
         self.password = password
-        self.touch()
-        self.validate()
+        self._after_change()
+
+    def rehash_password(self, password: str):
+        # Same password under new hashing parameters: existing tokens stay valid.
+        self.password = password
+        self._after_change()
 
     def change_is_staff(self, is_staff: bool):
+        if is_staff != self.is_staff:
+            self.revoke_tokens()
         self.is_staff = is_staff
-        self.touch()
-        self.validate()
+        self._after_change()
 
     def change_is_superuser(self, is_superuser: bool):
+        if is_superuser != self.is_superuser:
+            self.revoke_tokens()
         self.is_superuser = is_superuser
-        self.touch()
-        self.validate()
+        self._after_change()
 
     def activate(self):
         self.is_active = True
-        self.touch()
+        self._after_change(validate=False)
 
     def deactivate(self):
+        if self.is_active:
+            self.revoke_tokens()
         self.is_active = False
-        self.touch()
+        self._after_change(validate=False)
+
+    def revoke_tokens(self):
+        # Tokens carry the version they were issued with; bumping it makes
+        # every token issued before the change stale.
+        self.token_version += 1
 
     def touch(self):
         self.updated_at = datetime.datetime.now(datetime.timezone.utc)
@@ -98,6 +114,7 @@ class User(AggregateRoot):
                 "is_staff": self.is_staff,
                 "is_superuser": self.is_superuser,
                 "is_active": self.is_active,
+                "token_version": self.token_version,
                 "created_at": self.created_at,
                 "updated_at": self.updated_at,
             }
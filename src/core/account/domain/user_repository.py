@@ -1,5 +1,7 @@
 from abc import ABC
 from dataclasses import dataclass, field
+import datetime
+from uuid import UUID
 
 from src.core.shared.domain.repositories.repository_interface import (
     ISearchableRepository,
@@ -18,6 +20,30 @@ class UserFilter:
     is_active: bool | None = field(default=None)
 
 
+@dataclass(slots=True)
+class UserReadModel:
+    id: UUID
+    name: str
+    email: str
+    is_staff: bool | None
+    is_superuser: bool | None
+    is_active: bool | None
+    created_at: datetime.datetime
+    updated_at: datetime.datetime
+
+    @classmethod
+    def from_entity(cls, entity: User):
+        return cls(
+            id=entity.id.value,
+            name=entity.name,
+            email=entity.email,
+            is_staff=entity.is_staff,
+            is_superuser=entity.is_superuser,
+            is_active=entity.is_active,
+            created_at=entity.created_at,
+            updated_at=entity.updated_at,
+        )
+
 
 class UserSearchParams(SearchParams[UserFilter]):
     pass
@@ -27,6 +53,13 @@ class UserSearchResult(SearchResult[User]):
     pass
 
 
+class UserReadModelSearchResult(SearchResult[UserReadModel]):
+    pass
+
+
 class IUserRepository(ISearchableRepository[User, UserId], ABC):
     def find_by_email(self, email: str) -> User | None:
         raise NotImplementedError()
+
+    def search_read_models(self, props: UserSearchParams) -> UserReadModelSearchResult:
+        raise NotImplementedError()
@@ -1,4 +1,5 @@
 from abc import ABC
+from datetime import date
 
 from src.core.account.domain.user_token import UserToken, UserTokenId
 
@@ -12,3 +13,6 @@ class IUserTokenRepository(ABC):
 
     def delete(self, entity_id: UserTokenId) -> None:
         raise NotImplementedError()
+
+    def delete_expired(self, today: date, batch_size: int = 1000) -> int:
+        raise NotImplementedError()
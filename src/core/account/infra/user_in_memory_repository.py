@@ -1,60 +1,56 @@
 from typing import List, Type
 from src.core.shared.domain.repositories.search_params import SortDirection
+from src.core.shared.infra.db.in_memory.in_memory_index import (
+    HashIndex,
+    InMemoryIndex,
+)
 from src.core.shared.infra.db.in_memory.in_memory_searchable_repository import (
     InMemorySearchableRepository,
 )
 from src.core.account.domain.user import User, UserId
-from src.core.account.domain.user_repository import IUserRepository, UserFilter
+from src.core.account.domain.user_repository import (
+    IUserRepository,
+    UserFilter,
+    UserReadModel,
+    UserReadModelSearchResult,
+    UserSearchParams,
+)
 
 
 class UserInMemoryRepository(
     IUserRepository, InMemorySearchableRepository[User, UserId, UserFilter]
 ):
+    default_sort: str | None = "created_at"
+    default_sort_dir: SortDirection | None = SortDirection.DESC
     sortable_fields: List[str] = ["name", "created_at"]
+    searchable_fields: List[str] = ["name", "email"]
+    secondary_indexes: List[InMemoryIndex] = [HashIndex("email", unique=True)]
 
     def find_by_email(self, email: str) -> User | None:
-        return next((user for user in self.items if user.email == email), None)
+        return self._find_one_by_index("email", email)
+
+    def search_read_models(self, props: UserSearchParams) -> UserReadModelSearchResult:
+        result = self.search(props)
+        return UserReadModelSearchResult(
+            items=list(map(UserReadModel.from_entity, result.items)),
+            total=result.total,
+            current_page=result.current_page,
+            per_page=result.per_page,
+            next_cursor=result.next_cursor,
+            total_is_exact=result.total_is_exact,
+        )
 
     def _apply_filter(
         self, items: List[User], filter_param: UserFilter | None
     ) -> List[User]:
         if filter_param:
-            filter_obj = filter(
-                lambda item: self._filter_logic(item, filter_param), items
-            )
-            return list(filter_obj)
-
-        return items
-
-    def _filter_logic(self, item: User, filter_param: UserFilter) -> bool:
-        if filter_param.name and filter_param.email and filter_param.role:
-            return self._clause_name(item, filter_param.name) and self._clause_email(
-                item, filter_param.email
-            )
+            if filter_param.name:
+                items = self._filter_contains(items, "name", filter_param.name)
 
-        return (
-            self._clause_name(item, filter_param.name)
-            if filter_param.name
-            else (self._clause_email(item, filter_param.email))
-        )
-
-    def _clause_name(self, item: User, name: str) -> bool:
-        return name.lower() in item.name.lower()
-
-    def _clause_email(self, item: User, email: str) -> bool:
-        return email.lower() in item.email.lower()
+            if filter_param.email:
+                items = self._filter_contains(items, "email", filter_param.email)
 
-    def _apply_sort(
-        self,
-        items: List[User],
-        sort: str | None = None,
-        sort_dir: SortDirection | None = None,
-    ) -> List[User]:
-        return (
-            super()._apply_sort(items, sort, sort_dir)
-            if sort
-            else super()._apply_sort(items, "created_at", SortDirection.DESC)
-        )
+        return items
 
     def get_entity(self) -> Type[User]:
         return User
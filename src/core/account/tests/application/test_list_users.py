@@ -0,0 +1,33 @@
+from src.core.account.application.use_cases.common.user_output import UserOutput
+from src.core.account.application.use_cases.list_users import (
+    ListUsersInput,
+    ListUsersOutput,
+    ListUsersReadModelOutput,
+    ListUsersUseCase,
+)
+from src.core.account.domain.user import User
+from src.core.account.domain.user_repository import UserReadModel
+from src.core.account.infra.user_in_memory_repository import UserInMemoryRepository
+
+
+class TestListUsersUseCase:
+    def setup_method(self):
+        self.repository = UserInMemoryRepository()
+        self.user = User(name="John", email="john@example.com", password="secret")
+        self.repository.insert(self.user)
+
+    def test_should_map_entities_to_user_outputs(self):
+        output = ListUsersUseCase(self.repository).execute(ListUsersInput())
+
+        assert type(output) is ListUsersOutput
+        assert output.items == [UserOutput.from_entity(self.user)]
+        assert output.total == 1
+
+    def test_should_return_read_models_in_a_read_model_output(self):
+        use_case = ListUsersUseCase(self.repository, use_read_model=True)
+
+        output = use_case.execute(ListUsersInput())
+
+        assert type(output) is ListUsersReadModelOutput
+        assert output.items == [UserReadModel.from_entity(self.user)]
+        assert output.total == 1
@@ -19,6 +19,7 @@ class TestUser:
             "is_staff",
             "is_superuser",
             "is_active",
+            "token_version",
             "created_at",
             "updated_at",
         )
@@ -242,6 +243,45 @@ class TestUser:
         assert user.is_superuser == True
         assert user.notification.has_errors() is False
 
+    def test_should_revoke_tokens_when_credentials_change(self):
+        user = User(
+            id=UserId(),
+            name="John Doe",
+            email="john.doe@example.com",
+            password="password123",
+            is_active=True,
+        )
+
+        user.change_name("Jane Doe")
+        user.change_password("password123")
+        user.change_is_staff(False)
+        assert user.token_version == 0
+
+        user.change_email("jane.doe@example.com")
+        user.change_password("new_password123")
+        user.change_is_staff(True)
+        user.change_is_superuser(True)
+        user.deactivate()
+        user.deactivate()
+
+        assert user.token_version == 5
+        assert user.notification.has_errors() is False
+
+    def test_should_keep_tokens_when_rehashing_password(self):
+        user = User(
+            id=UserId(),
+            name="John Doe",
+            email="john.doe@example.com",
+            password="password123",
+            is_active=True,
+        )
+
+        user.rehash_password("rehashed_password123")
+
+        assert user.password == "rehashed_password123"
+        assert user.token_version == 0
+        assert user.notification.has_errors() is False
+
     def test_fields_mapping(self):
         assert User.__annotations__ == {
             "id": UserId,
@@ -251,6 +291,7 @@ class TestUser:
             "is_staff": bool | None,
             "is_superuser": bool | None,
             "is_active": bool | None,
+            "token_version": int,
             "created_at": Annotated[datetime.datetime, Strict()],
             "updated_at": Annotated[datetime.datetime, Strict()],
         }
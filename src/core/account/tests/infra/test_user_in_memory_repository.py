@@ -0,0 +1,40 @@
+from src.core.account.domain.user import User
+from src.core.account.domain.user_repository import (
+    UserReadModel,
+    UserSearchParams,
+    UserSearchResult,
+)
+from src.core.account.infra.user_in_memory_repository import UserInMemoryRepository
+
+
+class TestUserInMemoryRepositorySearchReadModels:
+    def test_should_map_search_items_to_read_models(self):
+        repository = UserInMemoryRepository()
+        user = User(name="John", email="john@example.com", password="secret")
+        repository.insert(user)
+
+        result = repository.search_read_models(UserSearchParams())
+
+        assert result.items == [UserReadModel.from_entity(user)]
+        assert result.total == 1
+
+    def test_should_keep_the_cursor_and_count_exactness(self, monkeypatch):
+        repository = UserInMemoryRepository()
+        monkeypatch.setattr(
+            repository,
+            "search",
+            lambda props: UserSearchResult(
+                items=[],
+                total=None,
+                current_page=1,
+                per_page=15,
+                next_cursor="next",
+                total_is_exact=False,
+            ),
+        )
+
+        result = repository.search_read_models(UserSearchParams())
+
+        assert result.next_cursor == "next"
+        assert result.total_is_exact is False
+        assert result.total is None
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 
 from src.core.category.application.use_cases.common.category_output import CategoryOutput
 from src.core.category.domain.category_repository import (
+    CategoryReadModel,
     CategorySearchParams,
     CategorySearchResult,
     ICategoryRepository,
@@ -21,14 +22,29 @@ class ListCategoriesOutput(PaginationOutput[CategoryOutput]):
     pass
 
 
+@dataclass(slots=True)
+class ListCategoriesReadModelOutput(PaginationOutput[CategoryReadModel]):
+    pass
+
+
 class ListCategoriesUseCase(UseCase):
 
-    def __init__(self, category_repo: ICategoryRepository):
+    def __init__(self, category_repo: ICategoryRepository, use_read_model: bool = False):
         self.category_repo = category_repo
+        self.use_read_model = use_read_model
 
-    def execute(self, input: ListCategoriesInput) -> ListCategoriesOutput:
+    def execute(
+        self, input: ListCategoriesInput
+    ) -> ListCategoriesOutput | ListCategoriesReadModelOutput:
         params = CategorySearchParams(**input.to_input())
 
+        if self.use_read_model:
+            # Read models already carry the output fields; no entities are built.
+            result = self.category_repo.search_read_models(params)
+            return ListCategoriesReadModelOutput.from_search_result(
+                result.items, result
+            )
+
         result = self.category_repo.search(params)
 
         return self.__to_output(result)
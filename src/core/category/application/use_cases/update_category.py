@@ -31,17 +31,18 @@ class UpdateCategoryUseCase(UseCase):
         if category is None:
             raise NotFoundException(input.id, Category)
 
-        if input.name is not None:
-            category.change_name(input.name)
+        with category.changes():
+            if input.name is not None:
+                category.change_name(input.name)
 
-        if input.description is not None:
-            category.change_description(input.description)
+            if input.description is not None:
+                category.change_description(input.description)
 
-        if input.is_active is True:
-            category.activate()
+            if input.is_active is True:
+                category.activate()
 
-        if input.is_active is False:
-            category.deactivate()
+            if input.is_active is False:
+                category.deactivate()
 
         if category.notification.has_errors():
             raise EntityValidationException(category.notification.errors)
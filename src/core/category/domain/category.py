@@ -45,24 +45,22 @@ class Category(AggregateRoot):
 
     def change_name(self, name: str):
         self.name = name
-        self.touch()
-        self.validate()
+        self._after_change()
 
 
     def change_description(self, description: str | None):
         self.description = description
-        self.touch()
-        self.validate()
+        self._after_change()
 
 
     def activate(self):
         self.is_active = True
-        self.touch()
+        self._after_change(validate=False)
 
 
     def deactivate(self):
         self.is_active = False
-        self.touch()
+        self._after_change(validate=False)
 
 
     def touch(self):
@@ -1,10 +1,35 @@
 from abc import ABC
+from dataclasses import dataclass
+import datetime
+from uuid import UUID
+
 from src.core.category.domain.category import Category, CategoryId
 from src.core.shared.domain.repositories.repository_interface import ISearchableRepository
 from src.core.shared.domain.repositories.search_params import SearchParams
 from src.core.shared.domain.repositories.search_result import SearchResult
 
 
+@dataclass(slots=True)
+class CategoryReadModel:
+    id: UUID
+    name: str
+    description: str | None
+    is_active: bool
+    created_at: datetime.datetime
+    updated_at: datetime.datetime
+
+    @classmethod
+    def from_entity(cls, entity: Category):
+        return cls(
+            id=entity.id.value,
+            name=entity.name,
+            description=entity.description,
+            is_active=entity.is_active,
+            created_at=entity.created_at,
+            updated_at=entity.updated_at,
+        )
+
+
 class CategorySearchParams(SearchParams[str]):
     pass
 
@@ -13,6 +38,15 @@ class CategorySearchResult(SearchResult[Category]):
     pass
 
 
+class CategoryReadModelSearchResult(SearchResult[CategoryReadModel]):
+    pass
+
+
 class ICategoryRepository(ISearchableRepository[Category, CategoryId], ABC):
      def find_by_name(self, name: str) -> Category | None:
          pass
+
+     def search_read_models(
+         self, props: CategorySearchParams
+     ) -> CategoryReadModelSearchResult:
+         raise NotImplementedError()
@@ -1,7 +1,16 @@
 from typing import List, Type
 from src.core.category.domain.category import Category, CategoryId
-from src.core.category.domain.category_repository import ICategoryRepository
+from src.core.category.domain.category_repository import (
+    CategoryReadModel,
+    CategoryReadModelSearchResult,
+    CategorySearchParams,
+    ICategoryRepository,
+)
 from src.core.shared.domain.repositories.search_params import SortDirection
+from src.core.shared.infra.db.in_memory.in_memory_index import (
+    HashIndex,
+    InMemoryIndex,
+)
 from src.core.shared.infra.db.in_memory.in_memory_searchable_repository import (
     InMemorySearchableRepository,
 )
@@ -10,32 +19,34 @@ from src.core.shared.infra.db.in_memory.in_memory_searchable_repository import (
 class CategoryInMemoryRepository(
     ICategoryRepository, InMemorySearchableRepository[Category, CategoryId, str]
 ):
+    default_sort: str | None = "created_at"
+    default_sort_dir: SortDirection | None = SortDirection.DESC
     sortable_fields: List[str] = ["name", "created_at"]
+    searchable_fields: List[str] = ["name"]
+    secondary_indexes: List[InMemoryIndex] = [HashIndex("name")]
 
     def _apply_filter(
         self, items: List[Category], filter_param: str | None = None
     ) -> List[Category]:
         if filter_param:
-            filter_obj = filter(lambda i: filter_param.lower() in i.name.lower(), items)
-            return list(filter_obj)
+            return self._filter_contains(items, "name", filter_param)
 
         return items
 
-    def _apply_sort(
-        self,
-        items: List[Category],
-        sort: str | None = None,
-        sort_dir: SortDirection | None = None,
-    ) -> List[Category]:
-        return (
-            super()._apply_sort(items, sort, sort_dir)
-            if sort
-            else super()._apply_sort(items, "created_at", SortDirection.DESC)
-        )
-
     def find_by_name(self, name) -> Category | None:
-        return next(
-            (category for category in self.items if category.name == name), None
+        return self._find_one_by_index("name", name)
+
+    def search_read_models(
+        self, props: CategorySearchParams
+    ) -> CategoryReadModelSearchResult:
+        result = self.search(props)
+        return CategoryReadModelSearchResult(
+            items=list(map(CategoryReadModel.from_entity, result.items)),
+            total=result.total,
+            current_page=result.current_page,
+            per_page=result.per_page,
+            next_cursor=result.next_cursor,
+            total_is_exact=result.total_is_exact,
         )
 
     def get_entity(self) -> Type[Category]:
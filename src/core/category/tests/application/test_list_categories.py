@@ -0,0 +1,35 @@
+from src.core.category.application.use_cases.common.category_output import CategoryOutput
+from src.core.category.application.use_cases.list_categories import (
+    ListCategoriesInput,
+    ListCategoriesOutput,
+    ListCategoriesReadModelOutput,
+    ListCategoriesUseCase,
+)
+from src.core.category.domain.category import Category
+from src.core.category.domain.category_repository import CategoryReadModel
+from src.core.category.infra.category_in_memory_repository import (
+    CategoryInMemoryRepository,
+)
+
+
+class TestListCategoriesUseCase:
+    def setup_method(self):
+        self.repository = CategoryInMemoryRepository()
+        self.category = Category(name="Movie")
+        self.repository.insert(self.category)
+
+    def test_should_map_entities_to_category_outputs(self):
+        output = ListCategoriesUseCase(self.repository).execute(ListCategoriesInput())
+
+        assert type(output) is ListCategoriesOutput
+        assert output.items == [CategoryOutput.from_entity(self.category)]
+        assert output.total == 1
+
+    def test_should_return_read_models_in_a_read_model_output(self):
+        use_case = ListCategoriesUseCase(self.repository, use_read_model=True)
+
+        output = use_case.execute(ListCategoriesInput())
+
+        assert type(output) is ListCategoriesReadModelOutput
+        assert output.items == [CategoryReadModel.from_entity(self.category)]
+        assert output.total == 1
@@ -0,0 +1,42 @@
+from src.core.category.domain.category import Category
+from src.core.category.domain.category_repository import (
+    CategoryReadModel,
+    CategorySearchParams,
+    CategorySearchResult,
+)
+from src.core.category.infra.category_in_memory_repository import (
+    CategoryInMemoryRepository,
+)
+
+
+class TestCategoryInMemoryRepositorySearchReadModels:
+    def test_should_map_search_items_to_read_models(self):
+        repository = CategoryInMemoryRepository()
+        category = Category(name="Movie", description="Films")
+        repository.insert(category)
+
+        result = repository.search_read_models(CategorySearchParams())
+
+        assert result.items == [CategoryReadModel.from_entity(category)]
+        assert result.total == 1
+
+    def test_should_keep_the_cursor_and_count_exactness(self, monkeypatch):
+        repository = CategoryInMemoryRepository()
+        monkeypatch.setattr(
+            repository,
+            "search",
+            lambda props: CategorySearchResult(
+                items=[],
+                total=12,
+                current_page=1,
+                per_page=15,
+                next_cursor="next",
+                total_is_exact=False,
+            ),
+        )
+
+        result = repository.search_read_models(CategorySearchParams())
+
+        assert result.next_cursor == "next"
+        assert result.total_is_exact is False
+        assert result.total == 12
@@ -59,36 +59,31 @@ class Post(AggregateRoot):
 
     def change_title(self, title: str):
         self.title = title
-        self.touch()
-        self.validate()
+        self._after_change()
 
     def change_content(self, content: str):
         self.content = content
-        self.touch()
-        self.validate()
+        self._after_change()
 
     def replace_banner(self, banner: ImageMedia):
         self.banner = banner
-        self.touch()
-        self.validate()
+        self._after_change()
 
     def replace_thumbnail(self, thumbnail: ImageMedia):
         self.thumbnail = thumbnail
-        self.touch()
-        self.validate()
+        self._after_change()
 
     def replace_thumbnail_half(self, thumbnail_half: ImageMedia):
         self.thumbnail_half = thumbnail_half
-        self.touch()
-        self.validate()
+        self._after_change()
 
     def published(self):
         self.is_published = True
-        self.touch()
+        self._after_change(validate=False)
 
     def unpublished(self):
         self.is_published = False
-        self.touch()
+        self._after_change(validate=False)
 
     def touch(self):
         self.updated_at = datetime.datetime.now(datetime.timezone.utc)
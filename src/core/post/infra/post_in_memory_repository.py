@@ -1,9 +1,13 @@
 from tracemalloc import BaseFilter
 from typing import List, Type
-from core.post.domain.post import Post, PostId
-from core.post.domain.post_repository import IPostRepository
-from core.shared.domain.repositories.search_params import SortDirection
-from core.shared.infra.db.in_memory.in_memory_searchable_repository import (
+from src.core.post.domain.post import Post, PostId
+from src.core.post.domain.post_repository import IPostRepository
+from src.core.shared.domain.repositories.search_params import SortDirection
+from src.core.shared.infra.db.in_memory.in_memory_index import (
+    HashIndex,
+    InMemoryIndex,
+)
+from src.core.shared.infra.db.in_memory.in_memory_searchable_repository import (
     InMemorySearchableRepository,
 )
 
@@ -11,10 +15,13 @@ from core.shared.infra.db.in_memory.in_memory_searchable_repository import (
 class PostInMemoryRepository(
     IPostRepository, InMemorySearchableRepository[Post, PostId, BaseFilter]
 ):
+    default_sort: str | None = "created_at"
+    default_sort_dir: SortDirection | None = SortDirection.DESC
     sortable_fields: List[str] = ["title", "created_at"]
+    secondary_indexes: List[InMemoryIndex] = [HashIndex("title")]
 
     def find_by_title(self, title: str) -> Post | None:
-        return next((post for post in self.items if post.title == title), None)
+        return self._find_one_by_index("title", title)
 
     def _apply_filter(
         self, items: List[Post], filter_param: str | None = None
@@ -25,17 +32,5 @@ class PostInMemoryRepository(
 
         return items
 
-    def _apply_sort(
-        self,
-        items: List[Post],
-        sort: str | None = None,
-        sort_dir: SortDirection | None = None,
-    ) -> List[Post]:
-        return (
-            super()._apply_sort(items, sort, sort_dir)
-            if sort
-            else super()._apply_sort(items, "created_at", SortDirection.DESC)
-        )
-
     def get_entity(self) -> Type[Post]:
         return Post
@@ -1,5 +1,14 @@
+import asyncio
 from abc import ABC, abstractmethod
 
+
+class CryptographyBusyException(Exception):
+    def __init__(
+        self, message: str = "Too many password operations in progress, try again later"
+    ):
+        super().__init__(message)
+
+
 class ICryptography(ABC):
     @abstractmethod
     def verify(self, plain: str, hash: str) -> bool:
@@ -8,3 +17,12 @@ class ICryptography(ABC):
     @abstractmethod
     def hash(self, plain: str) -> str:
         pass
+
+    def needs_rehash(self, hash: str) -> bool:
+        return False
+
+    async def verify_async(self, plain: str, hash: str) -> bool:
+        return await asyncio.to_thread(self.verify, plain, hash)
+
+    async def hash_async(self, plain: str) -> str:
+        return await asyncio.to_thread(self.hash, plain)
@@ -10,10 +10,12 @@ PaginationOutputItem = TypeVar("PaginationOutputItem")
 @dataclass(slots=True)
 class PaginationOutput(Generic[PaginationOutputItem]):
     items: List[PaginationOutputItem]
-    total: int
+    total: int | None
     current_page: int
     per_page: int
-    last_page: int
+    last_page: int | None
+    next_cursor: str | None = None
+    total_is_exact: bool = True
 
     @classmethod
     def from_search_result(
@@ -21,7 +23,11 @@ class PaginationOutput(Generic[PaginationOutputItem]):
         items: List[PaginationOutputItem],
         result: SearchResult[Any],
     ):
-        last_page = max(1, (result.total + result.per_page - 1) // result.per_page)
+        last_page = (
+            None
+            if result.total is None
+            else max(1, (result.total + result.per_page - 1) // result.per_page)
+        )
 
         return cls(
             items=items,
@@ -29,4 +35,6 @@ class PaginationOutput(Generic[PaginationOutputItem]):
             current_page=result.current_page,
             per_page=result.per_page,
             last_page=last_page,
+            next_cursor=result.next_cursor,
+            total_is_exact=result.total_is_exact,
         )
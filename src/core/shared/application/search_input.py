@@ -2,6 +2,8 @@ from dataclasses import dataclass
 from typing import Generic, TypeVar, TypedDict
 
 from src.core.shared.domain.repositories.search_params import (
+    CountMode,
+    CountModeValues,
     SortDirection,
     SortDirectionValues,
 )
@@ -15,8 +17,10 @@ class SearchInput(Generic[Filter]):
     page: int | None = None
     per_page: int | None = None
     sort: str | None = None
-    sort_dir: SortDirection | SortDirectionValues | None = None
+    sort_dir: SortDirectionValues | SortDirection | None = None
     filter: Filter | None = None
+    cursor: str | None = None
+    count: CountModeValues | CountMode | None = None
 
     def to_input(self):
         typed_dict = TypedDict(
@@ -25,8 +29,10 @@ class SearchInput(Generic[Filter]):
                 "init_page": int | None,
                 "init_per_page": int | None,
                 "init_sort": str | None,
-                "init_sort_dir": SortDirection | SortDirectionValues | None,
+                "init_sort_dir": SortDirectionValues | SortDirection | None,
                 "init_filter": Filter | None,
+                "init_cursor": str | None,
+                "init_count": CountModeValues | CountMode | None,
             },
         )
         return typed_dict(
@@ -35,4 +41,6 @@ class SearchInput(Generic[Filter]):
             init_sort=self.sort,
             init_sort_dir=self.sort_dir,
             init_filter=self.filter,
+            init_cursor=self.cursor,
+            init_count=self.count,
         )
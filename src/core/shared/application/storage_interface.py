@@ -1,5 +1,10 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import BinaryIO, Iterable, List
+
+# A readable binary file or any iterable of byte chunks, such as
+# `UploadedFile.chunks()`.
+Chunks = BinaryIO | Iterable[bytes]
 
 
 class IStorage(ABC):
@@ -7,6 +12,12 @@ class IStorage(ABC):
     def store(self, file_path: Path, content: bytes, content_type: str = "") -> str:
         pass
 
+    @abstractmethod
+    def store_stream(
+        self, file_path: Path, chunks: Chunks, content_type: str = ""
+    ) -> str:
+        pass
+
     @abstractmethod
     def get(self, file_path: Path) -> bytes:
         pass
@@ -14,3 +25,7 @@ class IStorage(ABC):
     @abstractmethod
     def delete(self, file_path: Path) -> None:
         pass
+
+    def delete_many(self, file_paths: List[Path]) -> None:
+        for file_path in file_paths:
+            self.delete(file_path)
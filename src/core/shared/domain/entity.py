@@ -1,7 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from contextlib import contextmanager
+import inspect
+from typing import Any, Iterator
 from dataclasses import dataclass, field
 
+from src.core.shared.domain.type_adapters import type_adapter
 from src.core.shared.domain.value_objects import ValueObject
 from src.core.shared.domain.validators.notification import Notification
 from pydantic import TypeAdapter, ValidationError
@@ -24,11 +27,26 @@ class Entity(ABC):
             return False
         return self.entity_id == other.entity_id
 
+    @classmethod
+    def type_adapter(cls) -> TypeAdapter:
+        return type_adapter(cls)
+
+    @staticmethod
+    def prepare_validators(*classes: type["Entity"]) -> None:
+        """Compile the validators up front, e.g. at startup, instead of on the
+        first validate() of each class. Without arguments, every concrete
+        entity class imported so far is compiled."""
+        pending = list(classes) or Entity.__subclasses__()
+        while pending:
+            cls = pending.pop()
+            if not classes:
+                pending.extend(cls.__subclasses__())
+            if not inspect.isabstract(cls):
+                cls.type_adapter()
+
     def _validate(self, data: Any):
         try:
-            TypeAdapter(
-                self.__class__,
-            ).validate_python(data)
+            self.type_adapter().validate_python(data)
         except ValidationError as e:
             for error in e.errors():
                 self.notification.add_error(error["msg"], str(error["loc"][0]))
@@ -36,4 +54,38 @@ class Entity(ABC):
 
 @dataclass(slots=True)
 class AggregateRoot(Entity):
-    pass
+    _change_depth: int = field(default=0, init=False, repr=False, compare=False)
+    _pending_touch: bool = field(default=False, init=False, repr=False, compare=False)
+    _pending_validation: bool = field(
+        default=False, init=False, repr=False, compare=False
+    )
+
+    @contextmanager
+    def changes(self) -> Iterator["AggregateRoot"]:
+        """Group several mutations: touch() and validate() run once on exit
+        instead of after every change_* call."""
+        self._change_depth += 1
+        try:
+            yield self
+        finally:
+            self._change_depth -= 1
+            outermost = self._change_depth == 0
+            if outermost:
+                touch, self._pending_touch = self._pending_touch, False
+                validation, self._pending_validation = self._pending_validation, False
+
+        if outermost:
+            if touch:
+                self.touch()
+            if validation:
+                self.validate()
+
+    def _after_change(self, validate: bool = True) -> None:
+        if self._change_depth:
+            self._pending_touch = True
+            self._pending_validation |= validate
+            return
+
+        self.touch()
+        if validate:
+            self.validate()
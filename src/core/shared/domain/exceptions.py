@@ -18,4 +18,9 @@ class ApplicationNotFoundException(Exception):
 
 class InvalidArgumentException(Exception):
     def __init__(self, message):
-        super().__init__(message)
\ No newline at end of file
+        super().__init__(message)
+
+
+class DuplicateKeyException(Exception):
+    def __init__(self, index_name: str, key: Any):
+        super().__init__(f"Index {index_name} already contains the key {key!r}")
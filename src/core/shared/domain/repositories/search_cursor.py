@@ -0,0 +1,41 @@
+import base64
+import binascii
+import datetime
+import json
+from typing import Any, List
+
+from src.core.shared.domain.exceptions import InvalidArgumentException
+
+
+def encode_cursor(sort: str, *values: Any) -> str:
+    payload = json.dumps(
+        [sort, *map(_to_str, values)],
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str, size: int) -> List[str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, binascii.Error):
+        raise InvalidArgumentException("Invalid cursor")
+
+    if (
+        not isinstance(payload, list)
+        or len(payload) != size + 1
+        or not all(isinstance(value, str) for value in payload)
+    ):
+        raise InvalidArgumentException("Invalid cursor")
+
+    if payload[0] != sort:
+        raise InvalidArgumentException("Cursor does not match the requested sort")
+
+    return payload[1:]
+
+
+def _to_str(value: Any) -> str:
+    if isinstance(value, datetime.datetime):
+        return value.isoformat()
+    return str(value)
@@ -13,6 +13,20 @@ class SortDirection(Enum):
 
 SortDirectionValues = Literal['asc', 'desc']
 
+
+class CountMode(Enum):
+    # EXACT runs COUNT(*). CACHED reuses a recent count, which is exact only
+    # when it was just computed. ESTIMATED reads the PostgreSQL planner's row
+    # estimate; other databases (SQLite included) fall back to CACHED. NONE
+    # skips the count.
+    EXACT = "exact"
+    CACHED = "cached"
+    ESTIMATED = "estimated"
+    NONE = "none"
+
+
+CountModeValues = Literal['exact', 'cached', 'estimated', 'none']
+
 Filter = TypeVar("Filter")
 
 
@@ -23,12 +37,16 @@ class SearchParams(Generic[Filter]):
     sort: str | None = field(init=False, default=None)
     sort_dir: SortDirection | None = field(init=False, default=None)
     filter: Filter | None = field(init=False, default=None)
+    cursor: str | None = field(init=False, default=None)
+    count: CountMode = field(init=False, default=CountMode.EXACT)
 
     init_page: InitVar[int | None] = None
     init_per_page: InitVar[int | None] = None
     init_sort: InitVar[str | None] = None
     init_sort_dir: InitVar[SortDirectionValues | SortDirection | None] = None
     init_filter: InitVar[Filter | None] = None
+    init_cursor: InitVar[str | None] = None
+    init_count: InitVar[CountModeValues | CountMode | None] = None
 
     def __post_init__(
         self,
@@ -37,12 +55,16 @@ class SearchParams(Generic[Filter]):
         init_sort: str | None,
         init_sort_dir: SortDirectionValues | SortDirection | None,
         init_filter: Filter | None,
+        init_cursor: str | None,
+        init_count: CountModeValues | CountMode | None,
     ):
         self._normalize_page(init_page)
         self._normalize_per_page(init_per_page)
         self._normalize_sort(init_sort)
         self._normalize_sort_dir(init_sort_dir)
         self._normalize_filter(init_filter)
+        self._normalize_cursor(init_cursor)
+        self._normalize_count(init_count)
 
     def _normalize_page(self, page: int | None):
         page = _int_or_none(page)
@@ -78,6 +100,29 @@ class SearchParams(Generic[Filter]):
         filter_type = get_args(self.__orig_bases__[0])[0]
         self.filter = _filter if isinstance(_filter, filter_type) else None
 
+    def _normalize_cursor(self, cursor: str | None):
+        self.cursor = cursor if isinstance(cursor, str) else None
+
+    def _normalize_count(self, count: CountModeValues | CountMode | None):
+        if isinstance(count, CountMode):
+            self.count = count
+            return
+
+        try:
+            self.count = CountMode(count.lower())  # type: ignore
+        except (AttributeError, ValueError):
+            # Scrolling by cursor does not need a total, so it skips the
+            # count unless one is asked for.
+            self.count = (
+                CountMode.NONE
+                if self.is_cursor_mode
+                else cast(CountMode, self.get_field("count").default)
+            )
+
+    @property
+    def is_cursor_mode(self) -> bool:
+        return self.cursor is not None
+
     @classmethod
     def get_field(cls, entity_field: str) -> Field[Any]:
         return cls.__dataclass_fields__[entity_field]
@@ -9,10 +9,15 @@ SearchResultItem = TypeVar("SearchResultItem", bound=Any)
 @dataclass(slots=True, kw_only=True)
 class SearchResult(Generic[SearchResultItem]):
     items: List[SearchResultItem]
-    total: int
+    total: int | None
     current_page: int
     per_page: int
-    last_page: int = field(init=False)
+    next_cursor: str | None = None
+    total_is_exact: bool = True
+    last_page: int | None = field(init=False)
 
     def __post_init__(self):
-        object.__setattr__(self, "last_page", math.ceil(self.total / self.per_page))
+        last_page = (
+            None if self.total is None else math.ceil(self.total / self.per_page)
+        )
+        object.__setattr__(self, "last_page", last_page)
@@ -0,0 +1,15 @@
+from typing import Any, Dict
+
+from pydantic import TypeAdapter
+
+# Compiling a TypeAdapter builds the whole pydantic schema for the type, so
+# each type (an entity class, a presenter, a List[...] of presenters) is
+# compiled once and reused.
+_type_adapters: Dict[Any, TypeAdapter] = {}
+
+
+def type_adapter(type_: Any) -> TypeAdapter:
+    adapter = _type_adapters.get(type_)
+    if adapter is None:
+        adapter = _type_adapters[type_] = TypeAdapter(type_)
+    return adapter
@@ -0,0 +1,93 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Hashable, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: float = 60,
+        clock: Callable[[], float] = time.monotonic,
+        max_weight: int | None = None,
+        weigh: Callable[[K, V], int] | None = None,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be greater than 0")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self.max_weight = max_weight
+        self.weigh = weigh
+        self.weight = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[K, Tuple[float, V, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or entry[0] <= self.clock():
+                if entry is not None:
+                    self._pop(key)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        expires_at = self.clock() + (self.ttl if ttl is None else ttl)
+        weight = self.weigh(key, value) if self.weigh else 0
+
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = (expires_at, value, weight)
+            self.weight += weight
+
+            # Least recently used entries go first, until both the entry count
+            # and the total weight fit (the newest entry is always kept).
+            while len(self._entries) > 1 and (
+                len(self._entries) > self.max_size
+                or (self.max_weight is not None and self.weight > self.max_weight)
+            ):
+                self._pop(next(iter(self._entries)))
+
+    def invalidate(self, key: K) -> None:
+        with self._lock:
+            self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.weight = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "weight": self.weight,
+            "max_weight": self.max_weight,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def _pop(self, key: K) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.weight -= entry[2]
@@ -4,11 +4,24 @@ from src.core.shared.application.cryptography import ICryptography
 
 
 class BcryptHasher(ICryptography):
+    def __init__(self, rounds: int = 8):
+        if not 4 <= rounds <= 31:
+            raise ValueError("rounds must be between 4 and 31")
+
+        self.rounds = rounds
 
     def hash(self, plain: str) -> str:
-        salt = bcrypt.gensalt(8)
+        salt = bcrypt.gensalt(self.rounds)
         hashed_password = bcrypt.hashpw(plain.encode("utf-8"), salt)
         return hashed_password.decode("utf-8")
 
     def verify(self, plain: str, hash: str) -> bool:
         return bcrypt.checkpw(plain.encode("utf-8"), hash.encode("utf-8"))
+
+    def needs_rehash(self, hash: str) -> bool:
+        # Modular crypt format: $2b$<cost>$<salt and digest>
+        parts = hash.split("$")
+        try:
+            return int(parts[2]) != self.rounds
+        except (IndexError, ValueError):
+            return True
@@ -0,0 +1,79 @@
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+from src.core.shared.application.cryptography import (
+    CryptographyBusyException,
+    ICryptography,
+)
+
+
+class PooledHasher(ICryptography):
+    """Runs another ICryptography on a bounded worker pool.
+
+    At most `max_pending` operations may be running or queued; further calls
+    are rejected with CryptographyBusyException instead of piling up behind
+    slow hashes. bcrypt releases the GIL, so threads run rounds in parallel.
+    """
+
+    def __init__(
+        self,
+        cryptography: ICryptography,
+        max_workers: int = 4,
+        max_pending: int = 32,
+        timeout: float | None = None,
+    ):
+        if max_pending < max_workers:
+            raise ValueError("max_pending must be at least max_workers")
+
+        self.cryptography = cryptography
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="cryptography"
+        )
+
+    def hash(self, plain: str) -> str:
+        return self.submit_hash(plain).result(self.timeout)
+
+    def verify(self, plain: str, hash: str) -> bool:
+        return self.submit_verify(plain, hash).result(self.timeout)
+
+    def needs_rehash(self, hash: str) -> bool:
+        return self.cryptography.needs_rehash(hash)
+
+    async def hash_async(self, plain: str) -> str:
+        return await asyncio.wrap_future(self.submit_hash(plain))
+
+    async def verify_async(self, plain: str, hash: str) -> bool:
+        return await asyncio.wrap_future(self.submit_verify(plain, hash))
+
+    def submit_hash(self, plain: str) -> Future:
+        return self._submit(self.cryptography.hash, plain)
+
+    def submit_verify(self, plain: str, hash: str) -> Future:
+        return self._submit(self.cryptography.verify, plain, hash)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+    def _submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        if not self._slots.acquire(blocking=False):
+            raise CryptographyBusyException()
+
+        try:
+            return self._executor.submit(self._run, fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def _run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        # The slot is freed before the future resolves, so a caller woken by
+        # the result can submit again straight away.
+        try:
+            return fn(*args)
+        finally:
+            self._slots.release()
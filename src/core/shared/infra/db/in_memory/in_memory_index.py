@@ -0,0 +1,199 @@
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass, field
+from operator import itemgetter
+from typing import Any, Callable, Dict, Generic, List, Set, Tuple, TypeVar
+
+from src.core.shared.domain.entity import Entity
+from src.core.shared.domain.exceptions import DuplicateKeyException
+
+E = TypeVar("E", bound=Entity)
+
+
+@dataclass(slots=True)
+class InMemoryIndex(ABC, Generic[E]):
+    name: str
+    key: str | Callable[[E], Any] | None = None
+
+    def key_of(self, entity: E) -> Any:
+        if self.key is None:
+            return getattr(entity, self.name)
+        if isinstance(self.key, str):
+            return getattr(entity, self.key)
+        return self.key(entity)
+
+    def check(self, position: int, entity: E) -> None:
+        pass
+
+    def check_many(self, entries: List[Tuple[int, E]]) -> None:
+        for position, entity in entries:
+            self.check(position, entity)
+
+    @abstractmethod
+    def add(self, position: int, entity: E) -> None:
+        raise NotImplementedError()
+
+    def add_many(self, entries: List[Tuple[int, E]]) -> None:
+        for position, entity in entries:
+            self.add(position, entity)
+
+    @abstractmethod
+    def remove(self, position: int) -> None:
+        raise NotImplementedError()
+
+    def replace(self, position: int, entity: E) -> None:
+        self.remove(position)
+        self.add(position, entity)
+
+
+@dataclass(slots=True)
+class HashIndex(InMemoryIndex[E]):
+    unique: bool = False
+    _buckets: Dict[Any, Dict[int, None]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    # Keys are remembered per position because entities are stored by
+    # reference and may already be mutated when `replace` is called.
+    _keys: Dict[int, Any] = field(default_factory=dict, init=False, repr=False)
+
+    def check(self, position: int, entity: E) -> None:
+        if not self.unique:
+            return
+
+        key = self.key_of(entity)
+        bucket = self._buckets.get(key)
+
+        if bucket and position not in bucket:
+            raise DuplicateKeyException(self.name, key)
+
+    def check_many(self, entries: List[Tuple[int, E]]) -> None:
+        if not self.unique:
+            return
+
+        keys = set()
+        for position, entity in entries:
+            self.check(position, entity)
+
+            key = self.key_of(entity)
+            if key in keys:
+                raise DuplicateKeyException(self.name, key)
+            keys.add(key)
+
+    def add(self, position: int, entity: E) -> None:
+        key = self.key_of(entity)
+        self._buckets.setdefault(key, {})[position] = None
+        self._keys[position] = key
+
+    def remove(self, position: int) -> None:
+        if position not in self._keys:
+            return
+
+        key = self._keys.pop(position)
+        bucket = self._buckets[key]
+        del bucket[position]
+
+        if not bucket:
+            del self._buckets[key]
+
+    def lookup(self, key: Any) -> List[int]:
+        return list(self._buckets.get(key, ()))
+
+
+@dataclass(slots=True)
+class SortedIndex(InMemoryIndex[E]):
+    # (key, position) pairs kept in ascending order; the position breaks ties
+    # so equal keys stay in insertion order, as with a stable sort.
+    _entries: List[Tuple[Any, int]] = field(
+        default_factory=list, init=False, repr=False
+    )
+    _keys: Dict[int, Any] = field(default_factory=dict, init=False, repr=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, position: int, entity: E) -> None:
+        key = self.key_of(entity)
+        insort(self._entries, (key, position))
+        self._keys[position] = key
+
+    def add_many(self, entries: List[Tuple[int, E]]) -> None:
+        for position, entity in entries:
+            key = self.key_of(entity)
+            self._entries.append((key, position))
+            self._keys[position] = key
+        self._entries.sort()
+
+    def remove(self, position: int) -> None:
+        if position not in self._keys:
+            return
+
+        key = self._keys.pop(position)
+        del self._entries[bisect_left(self._entries, (key, position))]
+
+    def positions(self, start: int, stop: int, reverse: bool = False) -> List[int]:
+        if not reverse:
+            return [position for _, position in self._entries[start:stop]]
+
+        # Walk runs of equal keys from the end of the index; inside a run the
+        # positions keep ascending order, matching sorted(..., reverse=True).
+        total = len(self._entries)
+        stop = min(stop, total)
+        result = []
+        index = start
+        while index < stop:
+            key = self._entries[total - 1 - index][0]
+            low = bisect_left(self._entries, key, key=itemgetter(0))
+            high = bisect_right(self._entries, key, key=itemgetter(0))
+            offset = low + index - (total - high)
+            taken = min(high - offset, stop - index)
+            result.extend(
+                position for _, position in self._entries[offset : offset + taken]
+            )
+            index += taken
+        return result
+
+
+@dataclass(slots=True)
+class TrigramIndex(InMemoryIndex[E]):
+    # Casefolded values are cached at write time; the trigram postings narrow
+    # the candidates before the substring check, like `icontains` in SQL.
+    _values: Dict[int, str] = field(default_factory=dict, init=False, repr=False)
+    _grams: Dict[str, Set[int]] = field(default_factory=dict, init=False, repr=False)
+
+    def add(self, position: int, entity: E) -> None:
+        value = str(self.key_of(entity) or "").casefold()
+        self._values[position] = value
+
+        for gram in _trigrams(value):
+            self._grams.setdefault(gram, set()).add(position)
+
+    def remove(self, position: int) -> None:
+        if position not in self._values:
+            return
+
+        for gram in _trigrams(self._values.pop(position)):
+            postings = self._grams[gram]
+            postings.discard(position)
+
+            if not postings:
+                del self._grams[gram]
+
+    def search(self, needle: str) -> List[int]:
+        needle = needle.casefold()
+        grams = _trigrams(needle)
+
+        if grams:
+            postings = sorted(
+                (self._grams.get(gram, set()) for gram in grams), key=len
+            )
+            candidates = postings[0].intersection(*postings[1:])
+        else:
+            candidates = self._values.keys()
+
+        return sorted(
+            position for position in candidates if needle in self._values[position]
+        )
+
+
+def _trigrams(value: str) -> Set[str]:
+    return {value[index : index + 3] for index in range(len(value) - 2)}
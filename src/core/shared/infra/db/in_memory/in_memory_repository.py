@@ -1,10 +1,14 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from typing import Dict, List, Set, Type, TypeVar
-from src.core.shared.domain.value_objects import ValueObject
+from dataclasses import dataclass, field, replace
+from typing import Any, ClassVar, Dict, List, Set, Type, TypeVar
+from src.core.shared.domain.value_objects import Uuid, ValueObject
 from src.core.shared.domain.exceptions import NotFoundException
 from src.core.shared.domain.entity import Entity
 from src.core.shared.domain.repositories.repository_interface import IRepository
+from src.core.shared.infra.db.in_memory.in_memory_index import (
+    HashIndex,
+    InMemoryIndex,
+)
 
 E = TypeVar("E", bound=Entity)
 EntityId = TypeVar("EntityId", bound=ValueObject)
@@ -12,13 +16,48 @@ EntityId = TypeVar("EntityId", bound=ValueObject)
 
 @dataclass(slots=True)
 class InMemoryRepository(IRepository[E, EntityId], ABC):
-    items: List[E] = field(default_factory=lambda: [])
+    # Entities are stored by insertion sequence (dicts keep insertion order),
+    # and `_positions` maps each entity id to its sequence, so lookups,
+    # updates and deletes never scan the whole collection.
+    _entries: Dict[int, E] = field(default_factory=dict, init=False, repr=False)
+    _positions: Dict[Any, int] = field(default_factory=dict, init=False, repr=False)
+    _sequence: int = field(default=0, init=False, repr=False)
+    _snapshot: List[E] | None = field(default=None, init=False, repr=False)
+    _indexes: Dict[str, InMemoryIndex[E]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    secondary_indexes: ClassVar[List[InMemoryIndex]] = []
+
+    def __post_init__(self):
+        # Declared indexes are templates shared by the class; every
+        # repository instance gets its own empty copy.
+        self._indexes = {index.name: replace(index) for index in self.secondary_indexes}
+
+    @property
+    def items(self) -> List[E]:
+        if self._snapshot is None:
+            self._snapshot = list(self._entries.values())
+        return self._snapshot
 
     def insert(self, entity: E) -> None:
-        self.items.append(entity)
+        self._add(entity)
 
     def bulk_insert(self, entities: List[E]) -> None:
-        self.items.extend(entities)
+        entries = list(enumerate(entities, self._sequence))
+
+        for index in self._indexes.values():
+            index.check_many(entries)
+
+        for index in self._indexes.values():
+            index.add_many(entries)
+
+        for position, entity in entries:
+            self._entries[position] = entity
+            self._positions[_key(entity.entity_id)] = position
+
+        self._sequence += len(entries)
+        self._snapshot = None
 
     def find_by_id(self, entity_id: EntityId) -> E | None:
         return self._get(entity_id)
@@ -27,50 +66,90 @@ class InMemoryRepository(IRepository[E, EntityId], ABC):
         return self.items
 
     def find_by_ids(self, ids: Set[EntityId]) -> List[E]:
-        return [entity for entity in self.items if entity.id in ids]
-    
+        positions = sorted(
+            position
+            for position in map(self._positions.get, map(_key, ids))
+            if position is not None
+        )
+        return [self._entries[position] for position in positions]
+
     def exists_by_id(self, entity_ids: List[EntityId]) -> Dict[str, List[EntityId]]:
         if not entity_ids:
             raise ValueError("entity_ids must be a list with at least one element")
 
-        if not self.items:
-            return {
-                "exists": [],
-                "not_exists": entity_ids,
-            }
-
         exists_id = set()
-        not_exists_id = set(entity_ids)
-        for entity in self.items:
-            if entity.id in entity_ids:
-                exists_id.add(entity.id)
-                not_exists_id.discard(entity.id)
+        not_exists_id = set()
+        for entity_id in entity_ids:
+            if _key(entity_id) in self._positions:
+                exists_id.add(entity_id)
+            else:
+                not_exists_id.add(entity_id)
 
         return {
             "exists": list(exists_id),
             "not_exists": list(not_exists_id),
         }
 
-
-
     def update(self, entity: E) -> None:
-        entity_found = self._get(entity.entity_id)
+        position = self._positions.get(_key(entity.entity_id))
 
-        if not entity_found:
+        if position is None:
             raise NotFoundException(entity.entity_id, self.get_entity())
 
-        index = self.items.index(entity_found)
-        self.items[index] = entity
+        for index in self._indexes.values():
+            index.check(position, entity)
+
+        for index in self._indexes.values():
+            index.replace(position, entity)
+
+        self._entries[position] = entity
+        self._snapshot = None
 
     def delete(self, entity_id: EntityId) -> None:
-        if entity_found := self._get(entity_id):
-            self.items.remove(entity_found)
-        else:
+        position = self._positions.pop(_key(entity_id), None)
+
+        if position is None:
             raise NotFoundException(entity_id, self.get_entity())
 
+        for index in self._indexes.values():
+            index.remove(position)
+
+        del self._entries[position]
+        self._snapshot = None
+
     def _get(self, entity_id: EntityId) -> E | None:
-        return next(filter(lambda i: i.entity_id == entity_id, self.items), None)
+        position = self._positions.get(_key(entity_id))
+        return None if position is None else self._entries[position]
+
+    def _find_by_index(self, name: str, key: Any) -> List[E]:
+        index: HashIndex[E] = self._indexes[name]
+        return [self._entries[position] for position in sorted(index.lookup(key))]
+
+    def _find_one_by_index(self, name: str, key: Any) -> E | None:
+        index: HashIndex[E] = self._indexes[name]
+        positions = index.lookup(key)
+        return self._entries[min(positions)] if positions else None
+
+    def _add(self, entity: E) -> None:
+        position = self._sequence
+
+        for index in self._indexes.values():
+            index.check(position, entity)
+
+        for index in self._indexes.values():
+            index.add(position, entity)
+
+        self._sequence += 1
+        self._entries[position] = entity
+        self._positions[_key(entity.entity_id)] = position
+        self._snapshot = None
 
     @abstractmethod
     def get_entity(self) -> Type[E]:
         pass
+
+
+def _key(entity_id: Any) -> Any:
+    # Entities expose either the `Uuid` value object or its raw UUID as
+    # `entity_id`; index both forms under the raw value.
+    return entity_id.value if isinstance(entity_id, Uuid) else entity_id
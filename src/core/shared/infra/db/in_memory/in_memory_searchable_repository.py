@@ -1,12 +1,15 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Generic, List, TypeVar
+from dataclasses import dataclass, field
+import heapq
+from operator import attrgetter
+from typing import ClassVar, Dict, Generic, List, Tuple, TypeVar
 
 from src.core.shared.domain.value_objects import ValueObject
 from src.core.shared.domain.entity import AggregateRoot
 from src.core.shared.domain.repositories.search_result import SearchResult
 from src.core.shared.domain.repositories.search_params import SearchParams, SortDirection
 from src.core.shared.domain.repositories.repository_interface import ISearchableRepository
+from src.core.shared.infra.db.in_memory.in_memory_index import SortedIndex, TrigramIndex
 from src.core.shared.infra.db.in_memory.in_memory_repository import InMemoryRepository
 
 E = TypeVar("E", bound=AggregateRoot)
@@ -23,14 +26,54 @@ class InMemorySearchableRepository(
     ],
     ABC,
 ):
+    default_sort: ClassVar[str | None] = None
+    default_sort_dir: ClassVar[SortDirection | None] = None
+    searchable_fields: ClassVar[List[str]] = []
+
+    _sorted_indexes: Dict[str, SortedIndex[E]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _trigram_indexes: Dict[str, TrigramIndex[E]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def __post_init__(self):
+        InMemoryRepository.__post_init__(self)
+
+        for sort_field in self.sortable_fields:
+            index = SortedIndex(f"{sort_field}:sorted", key=sort_field)
+            self._indexes[index.name] = index
+            self._sorted_indexes[sort_field] = index
+
+        for search_field in self.searchable_fields:
+            index = TrigramIndex(f"{search_field}:trigram", key=search_field)
+            self._indexes[index.name] = index
+            self._trigram_indexes[search_field] = index
+
     def search(self, input_params: SearchParams[Filter]) -> SearchResult[E]:
         items_filtered = self._apply_filter(self.items, input_params.filter)
-        items_sorted = self._apply_sort(
-            items_filtered, input_params.sort, input_params.sort_dir
-        )
-        items_paginated = self._apply_paginate(
-            items_sorted, input_params.page, input_params.per_page
-        )
+        sort, sort_dir = self._resolve_sort(input_params.sort, input_params.sort_dir)
+
+        if sort is None:
+            items_paginated = self._apply_paginate(
+                items_filtered, input_params.page, input_params.per_page
+            )
+        elif items_filtered is self.items:
+            # Nothing was filtered out, so the page is read straight from the
+            # sorted index without touching the rest of the collection.
+            items_paginated = self._paginate_sorted_index(
+                sort, sort_dir, input_params.page, input_params.per_page
+            )
+        else:
+            items_top = self._apply_top(
+                items_filtered,
+                sort,
+                sort_dir,
+                input_params.page * input_params.per_page,
+            )
+            items_paginated = self._apply_paginate(
+                items_top, input_params.page, input_params.per_page
+            )
 
         return SearchResult(
             items=items_paginated,
@@ -43,17 +86,56 @@ class InMemorySearchableRepository(
     def _apply_filter(self, items: List[E], filter_param: Filter | None) -> List[E]:
         raise NotImplementedError()
 
+    def _filter_contains(self, items: List[E], field_name: str, value: str) -> List[E]:
+        index = self._trigram_indexes.get(field_name)
+
+        if index is not None and items is self.items:
+            return [self._entries[position] for position in index.search(value)]
+
+        value = value.casefold()
+        return [
+            item
+            for item in items
+            if value in str(getattr(item, field_name) or "").casefold()
+        ]
+
+    def _resolve_sort(
+        self, sort: str | None, sort_dir: SortDirection | None
+    ) -> Tuple[str | None, SortDirection | None]:
+        if not sort:
+            return self.default_sort, self.default_sort_dir
+        if sort in self.sortable_fields:
+            return sort, sort_dir
+        return None, None
+
     def _apply_sort(
         self, items: List[E], sort: str | None, sort_dir: SortDirection | None
     ) -> List[E]:
-        if sort and sort in self.sortable_fields:
+        sort, sort_dir = self._resolve_sort(sort, sort_dir)
+        if sort:
             is_reverse = sort_dir == SortDirection.DESC
             return sorted(
                 items, key=lambda item: getattr(item, sort), reverse=is_reverse
             )
         return items
 
+    def _apply_top(
+        self, items: List[E], sort: str, sort_dir: SortDirection | None, limit: int
+    ) -> List[E]:
+        # Same result as _apply_sort(...)[:limit], without sorting the rest.
+        select = heapq.nlargest if sort_dir == SortDirection.DESC else heapq.nsmallest
+        return select(limit, items, key=attrgetter(sort))
+
     def _apply_paginate(self, items: List[E], page: int, per_page: int) -> List[E]:
         start = (page - 1) * per_page
         limit = start + per_page
         return items[slice(start, limit)]
+
+    def _paginate_sorted_index(
+        self, sort: str, sort_dir: SortDirection | None, page: int, per_page: int
+    ) -> List[E]:
+        start = (page - 1) * per_page
+        positions = self._sorted_indexes[sort].positions(
+            start, start + per_page, reverse=sort_dir == SortDirection.DESC
+        )
+        return [self._entries[position] for position in positions]
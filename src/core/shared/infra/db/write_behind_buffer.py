@@ -0,0 +1,121 @@
+import atexit
+import logging
+import threading
+from typing import Callable, Generic, List, TypeVar
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBehindBuffer(Generic[T]):
+    """Collects writes and hands them to `flush_batch` in batches.
+
+    A background thread flushes every `flush_interval` seconds, or as soon as
+    `batch_size` items are pending, and whatever is left is flushed when the
+    interpreter exits. A batch that fails with an error `is_transient` accepts
+    is put back and retried, up to `max_pending` items; beyond that the oldest
+    items are dropped and logged. Any other failure is retried item by item,
+    so one bad item cannot hold back the rest of its batch: items that fail
+    on their own with a permanent error are dropped and logged.
+    """
+
+    def __init__(
+        self,
+        flush_batch: Callable[[List[T]], None],
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        max_pending: int = 10000,
+        on_thread_exit: Callable[[], None] | None = None,
+        is_transient: Callable[[Exception], bool] = lambda error: True,
+    ):
+        self.flush_batch = flush_batch
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.on_thread_exit = on_thread_exit
+        self.is_transient = is_transient
+        self._pending: List[T] = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(self, item: T) -> None:
+        with self._lock:
+            self._pending.append(item)
+            should_wake = len(self._pending) >= self.batch_size
+            self._ensure_started()
+
+        if should_wake:
+            self._wakeup.set()
+
+    def flush(self) -> None:
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+
+            if not batch:
+                return
+
+            try:
+                self.flush_batch(batch)
+            except Exception as error:
+                logger.exception("Failed to flush %d buffered writes", len(batch))
+                if self.is_transient(error):
+                    self._requeue(batch)
+                else:
+                    self._flush_one_by_one(batch)
+
+    def close(self) -> None:
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self.flush()
+
+    def _flush_one_by_one(self, batch: List[T]) -> None:
+        retry = []
+        for item in batch:
+            try:
+                self.flush_batch([item])
+            except Exception as error:
+                if self.is_transient(error):
+                    retry.append(item)
+                else:
+                    logger.error("Dropped buffered write %r: %s", item, error)
+
+        if retry:
+            self._requeue(retry)
+
+    def _requeue(self, batch: List[T]) -> None:
+        with self._lock:
+            self._pending[:0] = batch
+            overflow = len(self._pending) - self.max_pending
+            if overflow > 0:
+                del self._pending[:overflow]
+                logger.error("Dropped %d buffered writes", overflow)
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+
+        self._thread = threading.Thread(
+            target=self._run, name="write-behind", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _run(self) -> None:
+        try:
+            while not self._stopped.is_set():
+                self._wakeup.wait(self.flush_interval)
+                self._wakeup.clear()
+                self.flush()
+        finally:
+            if self.on_thread_exit is not None:
+                self.on_thread_exit()
@@ -0,0 +1,29 @@
+from typing import Iterator
+
+from src.core.shared.application.storage_interface import Chunks
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def iter_chunks(chunks: Chunks, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    if not hasattr(chunks, "read"):
+        yield from chunks
+        return
+
+    while chunk := chunks.read(chunk_size):
+        yield chunk
+
+
+def iter_parts(chunks: Chunks, part_size: int) -> Iterator[bytes]:
+    # Regroups chunks of any size into `part_size` parts; only the last part
+    # may be shorter.
+    part = bytearray()
+
+    for chunk in iter_chunks(chunks, min(part_size, DEFAULT_CHUNK_SIZE)):
+        part += chunk
+        while len(part) >= part_size:
+            yield bytes(part[:part_size])
+            del part[:part_size]
+
+    if part:
+        yield bytes(part)
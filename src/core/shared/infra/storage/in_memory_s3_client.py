@@ -0,0 +1,156 @@
+import bisect
+import hashlib
+import io
+import itertools
+import threading
+import time
+from typing import Any, Dict, Tuple
+
+from botocore.exceptions import ClientError
+
+
+class InMemoryS3Client:
+    # Stand-in for the subset of the boto3 S3 client used by S3Storage, for
+    # tests and benchmarks without network access. `latency` seconds are
+    # slept on every call to mimic a round trip.
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.objects: Dict[str, Dict[str, Any]] = {}
+        self.uploads: Dict[str, Dict[str, Any]] = {}
+        self.calls: Dict[str, int] = {}
+        self._part_failures: Dict[int, Tuple[int, str]] = {}
+        self._upload_ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def fail_part(
+        self, number: int, times: int = 1, code: str = "InternalError"
+    ) -> None:
+        self._part_failures[number] = (times, code)
+
+    def put_object(self, Bucket: str, Key: str, Body: bytes, ContentType: str = ""):
+        self._record("put_object")
+        with self._lock:
+            self.objects[Key] = {"Body": bytes(Body), "ContentType": ContentType}
+        return {"ETag": _etag(Body)}
+
+    def get_object(self, Bucket: str, Key: str):
+        self._record("get_object")
+        with self._lock:
+            stored = self.objects.get(Key)
+        if stored is None:
+            raise _error("NoSuchKey", "GetObject")
+        return {"Body": io.BytesIO(stored["Body"]), "ContentType": stored["ContentType"]}
+
+    def delete_object(self, Bucket: str, Key: str):
+        self._record("delete_object")
+        with self._lock:
+            self.objects.pop(Key, None)
+        return {}
+
+    def delete_objects(self, Bucket: str, Delete: Dict[str, Any]):
+        self._record("delete_objects")
+        if len(Delete["Objects"]) > 1000:
+            raise _error("MalformedXML", "DeleteObjects")
+
+        with self._lock:
+            for item in Delete["Objects"]:
+                self.objects.pop(item["Key"], None)
+
+        if Delete.get("Quiet"):
+            return {}
+        return {"Deleted": [{"Key": item["Key"]} for item in Delete["Objects"]]}
+
+    def list_objects_v2(
+        self,
+        Bucket: str,
+        Prefix: str = "",
+        MaxKeys: int = 1000,
+        ContinuationToken: str | None = None,
+    ):
+        self._record("list_objects_v2")
+        with self._lock:
+            keys = sorted(self.objects)
+
+        start = bisect.bisect_right(keys, ContinuationToken) if ContinuationToken else 0
+        start = max(start, bisect.bisect_left(keys, Prefix))
+        page = []
+        for key in keys[start:]:
+            if not key.startswith(Prefix) or len(page) == MaxKeys:
+                break
+            page.append(key)
+
+        response: Dict[str, Any] = {"KeyCount": len(page), "IsTruncated": False}
+        if page:
+            response["Contents"] = [{"Key": key} for key in page]
+            end = start + len(page)
+            if end < len(keys) and keys[end].startswith(Prefix):
+                response["IsTruncated"] = True
+                response["NextContinuationToken"] = page[-1]
+        return response
+
+    def create_multipart_upload(self, Bucket: str, Key: str, ContentType: str = ""):
+        self._record("create_multipart_upload")
+        upload_id = str(next(self._upload_ids))
+        with self._lock:
+            self.uploads[upload_id] = {
+                "Key": Key,
+                "ContentType": ContentType,
+                "Parts": {},
+            }
+        return {"UploadId": upload_id}
+
+    def upload_part(
+        self, Bucket: str, Key: str, UploadId: str, PartNumber: int, Body: bytes
+    ):
+        self._record("upload_part")
+        with self._lock:
+            times, code = self._part_failures.get(PartNumber, (0, ""))
+            if times:
+                self._part_failures[PartNumber] = (times - 1, code)
+                raise _error(code, "UploadPart")
+
+            upload = self.uploads.get(UploadId)
+            if upload is None:
+                raise _error("NoSuchUpload", "UploadPart")
+
+            upload["Parts"][PartNumber] = bytes(Body)
+        return {"ETag": _etag(Body)}
+
+    def complete_multipart_upload(
+        self, Bucket: str, Key: str, UploadId: str, MultipartUpload: Dict[str, Any]
+    ):
+        self._record("complete_multipart_upload")
+        with self._lock:
+            upload = self.uploads.pop(UploadId, None)
+            if upload is None:
+                raise _error("NoSuchUpload", "CompleteMultipartUpload")
+
+            body = b""
+            for part in MultipartUpload["Parts"]:
+                content = upload["Parts"].get(part["PartNumber"])
+                if content is None or _etag(content) != part["ETag"]:
+                    raise _error("InvalidPart", "CompleteMultipartUpload")
+                body += content
+
+            self.objects[Key] = {"Body": body, "ContentType": upload["ContentType"]}
+        return {"ETag": _etag(body)}
+
+    def abort_multipart_upload(self, Bucket: str, Key: str, UploadId: str):
+        self._record("abort_multipart_upload")
+        with self._lock:
+            self.uploads.pop(UploadId, None)
+        return {}
+
+    def _record(self, operation: str) -> None:
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            self.calls[operation] = self.calls.get(operation, 0) + 1
+
+
+def _etag(body: bytes) -> str:
+    return f'"{hashlib.md5(body).hexdigest()}"'
+
+
+def _error(code: str, operation: str) -> ClientError:
+    return ClientError({"Error": {"Code": code, "Message": code}}, operation)
@@ -1,6 +1,7 @@
 from pathlib import Path
 
-from src.core.shared.application.storage_interface import IStorage
+from src.core.shared.application.storage_interface import Chunks, IStorage
+from src.core.shared.infra.storage.chunk_stream import iter_chunks
 
 
 class LocalStorage(IStorage):
@@ -23,6 +24,20 @@ class LocalStorage(IStorage):
 
         return full_path.as_uri()
 
+    def store_stream(
+        self, file_path: Path, chunks: Chunks, content_type: str = ""
+    ) -> str:
+        full_path = self.bucket.joinpath(file_path)
+
+        if not full_path.parent.exists():
+            full_path.parent.mkdir(parents=True)
+
+        with open(full_path, "wb") as file:
+            for chunk in iter_chunks(chunks):
+                file.write(chunk)
+
+        return full_path.as_uri()
+
     def get(self, file_path: Path) -> bytes:
         with open(self.bucket.joinpath(file_path), "rb") as file:
             return file.read()
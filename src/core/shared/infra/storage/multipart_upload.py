@@ -0,0 +1,124 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterable, List, Set
+
+from botocore.exceptions import ClientError, HTTPClientError
+from botocore.exceptions import ConnectionError as BotoConnectionError
+
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+
+class MultipartUploader:
+    # Parts are read from the stream one at a time and uploaded by a bounded
+    # pool, so at most `max_workers` parts are held in memory. With
+    # `max_retries`, a part that fails with a transient error (throttling, a
+    # 5xx, a dropped connection) is retried with exponential backoff; leave it
+    # at 0 for clients that already retry, such as the shared one from
+    # get_s3_client. Any other error, or one that persists, aborts the upload
+    # so S3 does not keep (and bill) the orphaned parts.
+    TRANSIENT_ERROR_CODES = frozenset(
+        {
+            "InternalError",
+            "RequestTimeout",
+            "RequestTimeoutException",
+            "ServiceUnavailable",
+            "SlowDown",
+            "Throttling",
+            "ThrottlingException",
+            "TooManyRequestsException",
+        }
+    )
+
+    def __init__(
+        self,
+        s3_client: Any,
+        bucket_name: str,
+        max_workers: int = 4,
+        max_retries: int = 0,
+        retry_backoff: float = 0.2,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be greater than 0")
+
+        self.s3_client = s3_client
+        self.bucket_name = bucket_name
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+
+    def upload(self, key: str, parts: Iterable[bytes], content_type: str) -> None:
+        upload_id = self.s3_client.create_multipart_upload(
+            Bucket=self.bucket_name, Key=key, ContentType=content_type
+        )["UploadId"]
+
+        try:
+            uploaded = self._upload_parts(key, upload_id, parts)
+            self.s3_client.complete_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": uploaded},
+            )
+        except BaseException:
+            self.s3_client.abort_multipart_upload(
+                Bucket=self.bucket_name, Key=key, UploadId=upload_id
+            )
+            raise
+
+    def _upload_parts(
+        self, key: str, upload_id: str, parts: Iterable[bytes]
+    ) -> List[Dict[str, Any]]:
+        uploaded: List[Dict[str, Any]] = []
+        pending: Set[Future] = set()
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="s3-multipart"
+        ) as executor:
+            try:
+                for number, part in enumerate(parts, 1):
+                    if len(pending) >= self.max_workers:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        uploaded.extend(future.result() for future in done)
+
+                    pending.add(
+                        executor.submit(
+                            self._upload_part, key, upload_id, number, part
+                        )
+                    )
+
+                uploaded.extend(future.result() for future in wait(pending).done)
+            except BaseException:
+                for future in pending:
+                    future.cancel()
+                raise
+
+        return sorted(uploaded, key=lambda part: part["PartNumber"])
+
+    def _upload_part(
+        self, key: str, upload_id: str, number: int, body: bytes
+    ) -> Dict[str, Any]:
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self.s3_client.upload_part(
+                    Bucket=self.bucket_name,
+                    Key=key,
+                    UploadId=upload_id,
+                    PartNumber=number,
+                    Body=body,
+                )
+                return {"PartNumber": number, "ETag": response["ETag"]}
+            except (ClientError, BotoConnectionError, HTTPClientError) as error:
+                if attempt == self.max_retries or not self.is_transient(error):
+                    raise
+                time.sleep(self.retry_backoff * 2**attempt)
+
+    @classmethod
+    def is_transient(cls, error: Exception) -> bool:
+        if isinstance(error, (BotoConnectionError, HTTPClientError)):
+            return True
+        if not isinstance(error, ClientError):
+            return False
+
+        code = error.response.get("Error", {}).get("Code")
+        status = error.response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0)
+        return code in cls.TRANSIENT_ERROR_CODES or status == 429 or status >= 500
@@ -0,0 +1,57 @@
+import functools
+import os
+import threading
+from typing import Any
+
+import boto3
+from botocore.config import Config
+from dotenv import load_dotenv
+
+_client: Any = None
+_lock = threading.Lock()
+
+
+@functools.cache
+def load_s3_env() -> None:
+    load_dotenv(dotenv_path=os.path.join("envs/.env"))
+
+
+def get_s3_client() -> Any:
+    # boto3 clients are thread-safe, so one client (and its connection pool)
+    # is shared by the whole process and built on first use. The pool must
+    # cover concurrent requests times the multipart workers of each. Its
+    # standard-mode retries are the only retry layer: S3Storage does not
+    # retry multipart parts on top of them.
+    global _client
+
+    if _client is None:
+        with _lock:
+            if _client is None:
+                _client = _create_client()
+    return _client
+
+
+def reset_s3_client() -> None:
+    global _client
+
+    with _lock:
+        _client = None
+
+
+def _create_client() -> Any:
+    load_s3_env()
+
+    # Sessions are not thread-safe; this one is only used under the lock.
+    session = boto3.session.Session()
+    return session.client(
+        "s3",
+        aws_access_key_id=os.environ.get("R2_ACCESS_KEY_ID"),
+        aws_secret_access_key=os.environ.get("R2_SECRET_ACCESS_KEY"),
+        endpoint_url=f"https://{os.environ.get('R2_ACCOUNT_ID')}.r2.cloudflarestorage.com",
+        region_name="auto",
+        config=Config(
+            max_pool_connections=int(os.environ.get("S3_MAX_POOL_CONNECTIONS", 50)),
+            tcp_keepalive=True,
+            retries={"max_attempts": 3, "mode": "standard"},
+        ),
+    )
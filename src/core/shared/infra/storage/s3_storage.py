@@ -1,38 +1,103 @@
-from src.core.shared.application.storage_interface import IStorage
-from dotenv import load_dotenv
+from src.core.shared.application.storage_interface import Chunks, IStorage
+from src.core.shared.infra.storage.chunk_stream import iter_parts
+from src.core.shared.infra.storage.multipart_upload import (
+    MIN_PART_SIZE,
+    MultipartUploader,
+)
+from src.core.shared.infra.storage.s3_client_factory import (
+    get_s3_client,
+    load_s3_env,
+)
 
 import os
-import boto3
+from botocore.exceptions import ClientError
+import itertools
 from pathlib import Path
 import mimetypes
-
-load_dotenv(dotenv_path=os.path.join("envs/.env"))
+from typing import Any, Iterable, Iterator, List
 
 
 class S3Storage(IStorage):
-    def __init__(self) -> None:
-
-        self.s3_client = boto3.client(
-            "s3",
-            aws_access_key_id=os.environ.get("R2_ACCESS_KEY_ID"),
-            aws_secret_access_key=os.environ.get("R2_SECRET_ACCESS_KEY"),
-            endpoint_url=f"https://{os.environ.get('R2_ACCOUNT_ID')}.r2.cloudflarestorage.com",
-            region_name="auto",
-        )
-        self.bucket_name = os.environ.get("R2_BUCKET_NAME")
+    # Objects of at least `multipart_threshold` bytes are sent as multipart
+    # uploads of `part_size` parts, `max_workers` at a time. Retries are left
+    # to the client (see get_s3_client); `part_retries` only adds uploader
+    # retries for clients that have none. Deletes are sent in batches of the
+    # most keys one `delete_objects` call accepts.
+    DELETE_BATCH_SIZE = 1000
+
+    def __init__(
+        self,
+        multipart_threshold: int = 8 * 1024 * 1024,
+        part_size: int = 8 * 1024 * 1024,
+        max_workers: int = 4,
+        part_retries: int = 0,
+        s3_client: Any = None,
+        bucket_name: str | None = None,
+    ) -> None:
+        if part_size < MIN_PART_SIZE:
+            raise ValueError(f"part_size must be at least {MIN_PART_SIZE} bytes")
+
+        self.multipart_threshold = multipart_threshold
+        self.part_size = part_size
+        self.max_workers = max_workers
+        self.part_retries = part_retries
+        self._s3_client = s3_client
+        self._bucket_name = bucket_name
+
+    # Storage is cheap to construct per request: the shared client and the
+    # environment are only resolved on first use.
+    @property
+    def s3_client(self) -> Any:
+        if self._s3_client is None:
+            self._s3_client = get_s3_client()
+        return self._s3_client
+
+    @property
+    def bucket_name(self) -> str | None:
+        if self._bucket_name is None:
+            load_s3_env()
+            self._bucket_name = os.environ.get("R2_BUCKET_NAME")
+        return self._bucket_name
 
     def store(self, file_path: Path, content: bytes, content_type: str = "") -> str:
-        if not content_type:
-            content_type, _ = mimetypes.guess_type(str(file_path))
+        # A payload already in memory skips the part accumulator: small ones
+        # are sent as they are and large ones are sliced straight into parts.
+        content_type = self._content_type(file_path, content_type)
 
-        self.s3_client.put_object(
-            Bucket=self.bucket_name,
-            Key=str(file_path),
-            Body=content,
-            ContentType=content_type or "application/octet-stream",
-        )
+        if len(content) < self.multipart_threshold:
+            self._put(file_path, content, content_type)
+        else:
+            parts = (
+                content[start : start + self.part_size]
+                for start in range(0, len(content), self.part_size)
+            )
+            self._upload_multipart(file_path, parts, content_type)
 
-        return f"{os.environ.get('R2_ENDPOINT_URL')}/{self.bucket_name}/{file_path}"
+        return self._url(file_path)
+
+    def store_stream(
+        self, file_path: Path, chunks: Chunks, content_type: str = ""
+    ) -> str:
+        content_type = self._content_type(file_path, content_type)
+
+        # Buffer up to the threshold to find out whether the object is small
+        # enough for a single request.
+        parts = iter_parts(chunks, self.part_size)
+        head, size = [], 0
+        for part in parts:
+            head.append(part)
+            size += len(part)
+            if size >= self.multipart_threshold:
+                break
+
+        if size < self.multipart_threshold:
+            self._put(file_path, b"".join(head), content_type)
+        else:
+            self._upload_multipart(
+                file_path, itertools.chain(head, parts), content_type
+            )
+
+        return self._url(file_path)
 
     def get(self, file_path: Path) -> bytes:
         response = self.s3_client.get_object(
@@ -42,10 +107,67 @@ class S3Storage(IStorage):
         return response["Body"].read()
 
     def delete(self, file_path: Path) -> None:
-        list_paths = self.s3_client.list_objects_v2(Bucket=self.bucket_name)
-        if "Contents" in list_paths:
-            for path in list_paths["Contents"]:
-                if str(file_path) in path["Key"]:
-                    self.s3_client.delete_object(
-                        Bucket=self.bucket_name, Key=path["Key"]
-                    )
+        self.delete_many([file_path])
+
+    def delete_many(self, file_paths: List[Path]) -> None:
+        # A path removes the object with that key and everything under it as
+        # a "directory".
+        keys = sorted(
+            {
+                key
+                for file_path in map(str, file_paths)
+                for key in self._list_keys(file_path)
+                if key == file_path or key.startswith(f"{file_path.rstrip('/')}/")
+            }
+        )
+
+        for start in range(0, len(keys), self.DELETE_BATCH_SIZE):
+            batch = keys[start : start + self.DELETE_BATCH_SIZE]
+            response = self.s3_client.delete_objects(
+                Bucket=self.bucket_name,
+                Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+            )
+            errors = response.get("Errors")
+            if errors:
+                raise ClientError({"Error": errors[0]}, "DeleteObjects")
+
+    def _put(self, file_path: Path, body: bytes, content_type: str) -> None:
+        self.s3_client.put_object(
+            Bucket=self.bucket_name,
+            Key=str(file_path),
+            Body=body,
+            ContentType=content_type,
+        )
+
+    def _upload_multipart(
+        self, file_path: Path, parts: Iterable[bytes], content_type: str
+    ) -> None:
+        uploader = MultipartUploader(
+            self.s3_client,
+            self.bucket_name,
+            max_workers=self.max_workers,
+            max_retries=self.part_retries,
+        )
+        uploader.upload(str(file_path), parts, content_type)
+
+    @staticmethod
+    def _content_type(file_path: Path, content_type: str) -> str:
+        if not content_type:
+            content_type, _ = mimetypes.guess_type(str(file_path))
+        return content_type or "application/octet-stream"
+
+    def _url(self, file_path: Path) -> str:
+        load_s3_env()
+        return f"{os.environ.get('R2_ENDPOINT_URL')}/{self.bucket_name}/{file_path}"
+
+    def _list_keys(self, prefix: str) -> Iterator[str]:
+        kwargs = {"Bucket": self.bucket_name, "Prefix": prefix}
+
+        while True:
+            response = self.s3_client.list_objects_v2(**kwargs)
+            for item in response.get("Contents", []):
+                yield item["Key"]
+
+            if not response.get("IsTruncated"):
+                return
+            kwargs["ContinuationToken"] = response["NextContinuationToken"]
@@ -0,0 +1,119 @@
+from dataclasses import dataclass
+
+from src.core.shared.domain import type_adapters as type_adapters_module
+from src.core.shared.domain.entity import AggregateRoot, Entity
+from src.core.shared.domain.value_objects import Uuid
+
+
+@dataclass(slots=True)
+class StubEntity(AggregateRoot):
+    id: Uuid
+    name: str
+    touches: int = 0
+    validations: int = 0
+
+    @property
+    def entity_id(self) -> Uuid:
+        return self.id
+
+    def change_name(self, name: str):
+        self.name = name
+        self._after_change()
+
+    def deactivate(self):
+        self._after_change(validate=False)
+
+    def touch(self):
+        self.touches += 1
+
+    def validate(self):
+        self.validations += 1
+        self._validate({"id": self.id, "name": self.name})
+
+
+class TestEntityValidators:
+    def setup_method(self):
+        type_adapters_module._type_adapters.pop(StubEntity, None)
+
+    def test_should_compile_the_type_adapter_once_per_class(self):
+        adapter = StubEntity.type_adapter()
+
+        assert StubEntity.type_adapter() is adapter
+        assert type_adapters_module._type_adapters[StubEntity] is adapter
+
+    def test_should_validate_with_the_cached_adapter(self):
+        valid = StubEntity(id=Uuid(), name="valid")
+        valid.validate()
+        invalid = StubEntity(id=Uuid(), name=1)
+        invalid.validate()
+
+        assert valid.notification.has_errors() is False
+        assert invalid.notification.errors == {
+            "name": ["Input should be a valid string"]
+        }
+
+    def test_should_prepare_validators_up_front(self):
+        Entity.prepare_validators(StubEntity)
+        assert StubEntity in type_adapters_module._type_adapters
+
+        type_adapters_module._type_adapters.pop(StubEntity)
+        Entity.prepare_validators()
+        assert StubEntity in type_adapters_module._type_adapters
+        assert Entity not in type_adapters_module._type_adapters
+        assert AggregateRoot not in type_adapters_module._type_adapters
+
+
+class TestAggregateRootChanges:
+    def test_should_touch_and_validate_after_each_change(self):
+        entity = StubEntity(id=Uuid(), name="a")
+
+        entity.change_name("b")
+        entity.change_name("c")
+        entity.deactivate()
+
+        assert entity.touches == 3
+        assert entity.validations == 2
+
+    def test_should_touch_and_validate_once_for_grouped_changes(self):
+        entity = StubEntity(id=Uuid(), name="a")
+
+        with entity.changes():
+            entity.change_name("b")
+            with entity.changes():
+                entity.change_name(1)
+            entity.deactivate()
+            assert entity.validations == 0
+
+        assert entity.touches == 1
+        assert entity.validations == 1
+        assert entity.notification.errors == {
+            "name": ["Input should be a valid string"]
+        }
+
+    def test_should_skip_validation_without_validated_changes(self):
+        entity = StubEntity(id=Uuid(), name="a")
+
+        with entity.changes():
+            entity.deactivate()
+
+        with entity.changes():
+            pass
+
+        assert entity.touches == 1
+        assert entity.validations == 0
+
+    def test_should_discard_pending_work_when_the_block_fails(self):
+        entity = StubEntity(id=Uuid(), name="a")
+
+        try:
+            with entity.changes():
+                entity.change_name("b")
+                raise RuntimeError()
+        except RuntimeError:
+            pass
+
+        with entity.changes():
+            pass
+
+        assert entity.touches == 0
+        assert entity.validations == 0
@@ -0,0 +1,40 @@
+import datetime
+
+import pytest
+from src.core.shared.domain.exceptions import InvalidArgumentException
+from src.core.shared.domain.repositories.search_cursor import (
+    decode_cursor,
+    encode_cursor,
+)
+
+
+class TestSearchCursor:
+
+    def test_should_encode_and_decode_values(self):
+        created_at = datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.UTC)
+
+        cursor = encode_cursor("created_at", created_at, 42)
+
+        assert "=" not in cursor
+        assert decode_cursor(cursor, "created_at", 2) == [
+            "2024-01-02T03:04:05+00:00",
+            "42",
+        ]
+
+    @pytest.mark.parametrize(
+        "cursor",
+        [
+            pytest.param("not a cursor", id="not base64"),
+            pytest.param("bm90IGpzb24", id="not json"),
+            pytest.param(encode_cursor("name", "a"), id="wrong size"),
+        ],
+    )
+    def test_should_reject_invalid_cursors(self, cursor: str):
+        with pytest.raises(InvalidArgumentException):
+            decode_cursor(cursor, "name", 2)
+
+    def test_should_reject_cursor_from_another_sort(self):
+        cursor = encode_cursor("name", "a", 1)
+
+        with pytest.raises(InvalidArgumentException):
+            decode_cursor(cursor, "created_at", 2)
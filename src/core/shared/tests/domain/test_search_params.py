@@ -1,3 +1,4 @@
+from src.core.shared.domain.repositories.search_params import CountMode, SearchParams
 from src.core.shared.domain.repositories.search_result import SearchResult
 
 
@@ -48,3 +49,29 @@ class TestSearchResult:
             items=items, total=total, current_page=current_page, per_page=per_page
         )
         assert search_result.last_page == 0
+
+    def test_last_page_is_none_without_total(self):
+        search_result = SearchResult[int](
+            items=[1, 2], total=None, current_page=1, per_page=5
+        )
+        assert search_result.last_page is None
+        assert search_result.total_is_exact is True
+
+
+class StubSearchParams(SearchParams[str]):
+    pass
+
+
+class TestSearchParamsCount:
+    def test_should_count_exactly_by_default(self):
+        assert StubSearchParams().count == CountMode.EXACT
+        assert StubSearchParams(init_count="bogus").count == CountMode.EXACT
+
+    def test_should_skip_the_count_by_default_in_cursor_mode(self):
+        assert StubSearchParams(init_cursor="").count == CountMode.NONE
+        assert StubSearchParams(init_cursor="abc").count == CountMode.NONE
+
+    def test_should_keep_an_explicit_count_in_cursor_mode(self):
+        params = StubSearchParams(init_cursor="", init_count="cached")
+
+        assert params.count == CountMode.CACHED
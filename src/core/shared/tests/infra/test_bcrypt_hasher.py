@@ -0,0 +1,27 @@
+import pytest
+
+from src.core.shared.infra.cryptography.bcrypt_hasher import BcryptHasher
+
+
+class TestBcryptHasher:
+    def test_should_validate_rounds(self):
+        with pytest.raises(ValueError, match="rounds must be between 4 and 31"):
+            BcryptHasher(rounds=3)
+
+    def test_should_hash_with_the_configured_cost(self):
+        hasher = BcryptHasher(rounds=5)
+        hashed = hasher.hash("secret")
+
+        assert hashed.startswith("$2b$05$")
+        assert hasher.verify("secret", hashed) is True
+        assert hasher.verify("other", hashed) is False
+
+    def test_should_need_rehash_when_the_cost_changes(self):
+        hashed = BcryptHasher(rounds=4).hash("secret")
+
+        assert BcryptHasher(rounds=4).needs_rehash(hashed) is False
+        assert BcryptHasher(rounds=5).needs_rehash(hashed) is True
+        assert BcryptHasher(rounds=5).verify("secret", hashed) is True
+
+    def test_should_need_rehash_for_unknown_formats(self):
+        assert BcryptHasher().needs_rehash("plain-text") is True
@@ -0,0 +1,42 @@
+import pytest
+
+from src.core.shared.infra.cache.bloom_filter import BloomFilter
+
+
+class TestBloomFilter:
+    def test_should_validate_arguments(self):
+        with pytest.raises(ValueError, match="capacity must be greater than 0"):
+            BloomFilter(capacity=0)
+
+        with pytest.raises(ValueError, match="error_rate must be between 0 and 1"):
+            BloomFilter(error_rate=1)
+
+    def test_should_size_bits_and_hashes_from_capacity(self):
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+
+        assert bloom.size == 9586
+        assert bloom.hash_count == 7
+
+    def test_should_never_miss_added_items(self):
+        bloom = BloomFilter(capacity=1000)
+        items = [f"item-{index}" for index in range(1000)]
+        bloom.update(items)
+
+        assert all(item in bloom for item in items)
+        assert len(bloom) == 1000
+        assert bloom.is_saturated is False
+
+    def test_should_keep_false_positives_near_the_error_rate(self):
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        bloom.update(f"item-{index}" for index in range(1000))
+
+        false_positives = sum(f"other-{index}" in bloom for index in range(10000))
+
+        assert false_positives < 300
+
+    def test_should_report_saturation(self):
+        bloom = BloomFilter(capacity=1)
+        bloom.add("a")
+        bloom.add("b")
+
+        assert bloom.is_saturated is True
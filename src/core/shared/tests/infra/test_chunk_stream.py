@@ -0,0 +1,18 @@
+import io
+
+from src.core.shared.infra.storage.chunk_stream import iter_chunks, iter_parts
+
+
+class TestChunkStream:
+    def test_should_iterate_file_objects_in_chunks(self):
+        chunks = list(iter_chunks(io.BytesIO(b"abcdefg"), chunk_size=3))
+
+        assert chunks == [b"abc", b"def", b"g"]
+
+    def test_should_regroup_chunks_into_parts(self):
+        parts = list(iter_parts([b"ab", b"", b"cdefg", b"h"], part_size=3))
+
+        assert parts == [b"abc", b"def", b"gh"]
+
+    def test_should_not_yield_parts_for_empty_streams(self):
+        assert list(iter_parts(io.BytesIO(b""), part_size=3)) == []
@@ -0,0 +1,46 @@
+from dataclasses import dataclass
+
+from src.core.shared.domain.value_objects import Uuid
+from src.core.shared.domain.entity import AggregateRoot
+from src.core.shared.infra.db.in_memory.in_memory_index import TrigramIndex
+
+
+@dataclass(slots=True)
+class StubEntity(AggregateRoot):
+    id: Uuid
+    name: str
+
+    @property
+    def entity_id(self) -> Uuid:
+        return self.id
+
+
+class TestTrigramIndex:
+    index: TrigramIndex[StubEntity]
+
+    def setup_method(self):
+        self.index = TrigramIndex("name")
+        names = ["Python", "PYTHON tips", "Go", "Straße", "typing"]
+        for position, name in enumerate(names):
+            self.index.add(position, StubEntity(id=Uuid(), name=name))
+
+    def test_should_match_substrings_ignoring_case(self):
+        assert self.index.search("python") == [0, 1]
+        assert self.index.search("TIPS") == [1]
+        assert self.index.search("pyt") == [0, 1]
+        assert self.index.search("rust") == []
+
+    def test_should_match_needles_shorter_than_a_trigram(self):
+        assert self.index.search("go") == [2]
+        assert self.index.search("y") == [0, 1, 4]
+
+    def test_should_casefold_values_and_needles(self):
+        assert self.index.search("STRASSE") == [3]
+
+    def test_should_follow_replace_and_remove(self):
+        self.index.replace(0, StubEntity(id=Uuid(), name="Rust"))
+        self.index.remove(1)
+
+        assert self.index.search("python") == []
+        assert self.index.search("rust") == [0]
+        assert self.index._grams.get("tip") is None
@@ -2,7 +2,8 @@ from dataclasses import dataclass
 
 import pytest
 from src.core.shared.domain.value_objects import Uuid
-from src.core.shared.domain.exceptions import NotFoundException
+from src.core.shared.domain.exceptions import DuplicateKeyException, NotFoundException
+from src.core.shared.infra.db.in_memory.in_memory_index import HashIndex
 from src.core.shared.infra.db.in_memory.in_memory_repository import InMemoryRepository
 from src.core.shared.domain.entity import AggregateRoot
 
@@ -23,6 +24,16 @@ class StubInMemoryRepository(InMemoryRepository[StubEntity, Uuid]):
         return StubEntity
 
 
+class StubIndexedInMemoryRepository(InMemoryRepository[StubEntity, Uuid]):
+    secondary_indexes = [
+        HashIndex("name", unique=True),
+        HashIndex("price_range", key=lambda entity: entity.price // 100),
+    ]
+
+    def get_entity(self):
+        return StubEntity
+
+
 class TestInMemoryRepository:
     repository: StubInMemoryRepository
 
@@ -100,3 +111,117 @@ class TestInMemoryRepository:
     def test_get_entity(self):
         entity = self.repository.get_entity()
         assert entity == StubEntity
+
+    def test_should_be_able_to_find_by_ids(self):
+        entities = [
+            StubEntity(id=Uuid(), name=f"some entity {i}", price=100) for i in range(3)
+        ]
+        self.repository.bulk_insert(entities)
+
+        found_entities = self.repository.find_by_ids(
+            {entities[2].id, entities[0].id, Uuid()}
+        )
+
+        assert found_entities == [entities[0], entities[2]]
+
+    def test_should_keep_insertion_order_after_update_and_delete(self):
+        entities = [
+            StubEntity(id=Uuid(), name=f"some entity {i}", price=100) for i in range(4)
+        ]
+        self.repository.bulk_insert(entities)
+
+        updated_entity = StubEntity(id=entities[1].id, name="Updated Name", price=200)
+        self.repository.update(updated_entity)
+        self.repository.delete(entities[2].id)
+
+        assert self.repository.find_all() == [
+            entities[0],
+            updated_entity,
+            entities[3],
+        ]
+
+    def test_delete_should_raise_not_found_exception_for_non_existent_entity(self):
+        with pytest.raises(NotFoundException):
+            self.repository.delete(Uuid())
+
+    def test_should_be_able_to_check_exists_by_id(self):
+        stub_entity = StubEntity(id=Uuid(), name="some entity", price=100)
+        self.repository.insert(stub_entity)
+        non_existent_id = Uuid()
+
+        result = self.repository.exists_by_id([stub_entity.id, non_existent_id])
+
+        assert result == {"exists": [stub_entity.id], "not_exists": [non_existent_id]}
+
+
+class TestInMemoryRepositorySecondaryIndexes:
+    repository: StubIndexedInMemoryRepository
+
+    def setup_method(self):
+        self.repository = StubIndexedInMemoryRepository()
+
+    def test_indexes_are_not_shared_between_instances(self):
+        self.repository.insert(StubEntity(id=Uuid(), name="some entity", price=100))
+
+        other_repository = StubIndexedInMemoryRepository()
+
+        assert other_repository._find_one_by_index("name", "some entity") is None
+
+    def test_should_find_by_unique_and_non_unique_index(self):
+        entities = [
+            StubEntity(id=Uuid(), name="entity 1", price=100),
+            StubEntity(id=Uuid(), name="entity 2", price=50),
+            StubEntity(id=Uuid(), name="entity 3", price=150),
+        ]
+        self.repository.bulk_insert(entities)
+
+        assert self.repository._find_one_by_index("name", "entity 2") == entities[1]
+        assert self.repository._find_by_index("price_range", 1) == [
+            entities[0],
+            entities[2],
+        ]
+        assert self.repository._find_by_index("price_range", 9) == []
+
+    def test_should_reject_duplicated_unique_key(self):
+        self.repository.insert(StubEntity(id=Uuid(), name="some entity", price=100))
+
+        with pytest.raises(DuplicateKeyException) as raised:
+            self.repository.insert(
+                StubEntity(id=Uuid(), name="some entity", price=200)
+            )
+
+        assert str(raised.value) == "Index name already contains the key 'some entity'"
+        assert len(self.repository.find_all()) == 1
+
+    def test_should_reject_duplicated_unique_keys_in_one_batch(self):
+        with pytest.raises(DuplicateKeyException):
+            self.repository.bulk_insert(
+                [
+                    StubEntity(id=Uuid(), name="some entity", price=100),
+                    StubEntity(id=Uuid(), name="some entity", price=200),
+                ]
+            )
+
+        assert self.repository.find_all() == []
+
+    def test_should_keep_indexes_consistent_on_update(self):
+        stub_entity = StubEntity(id=Uuid(), name="Original Name", price=100)
+        self.repository.insert(stub_entity)
+
+        stub_entity.name = "Updated Name"
+        stub_entity.price = 20
+        self.repository.update(stub_entity)
+
+        assert self.repository._find_one_by_index("name", "Original Name") is None
+        assert self.repository._find_one_by_index("name", "Updated Name") == stub_entity
+        assert self.repository._find_by_index("price_range", 1) == []
+        assert self.repository._find_by_index("price_range", 0) == [stub_entity]
+
+    def test_should_keep_indexes_consistent_on_delete(self):
+        stub_entity = StubEntity(id=Uuid(), name="some entity", price=100)
+        self.repository.insert(stub_entity)
+
+        self.repository.delete(stub_entity.id)
+
+        assert self.repository._find_one_by_index("name", "some entity") is None
+        assert self.repository._find_by_index("price_range", 1) == []
@@ -184,3 +184,51 @@ class TestInMemorySearchableRepository:
             current_page=2,
             per_page=2,
         )
+
+    def test_search_sorted_pages_match_a_full_sort(self):
+        items = [
+            StubEntity(Uuid(), name, index)
+            for index, name in enumerate(["c", "a", "b", "a", "c", "test", "a", "TEST"])
+        ]
+        self.repository.bulk_insert(items[:4])
+        for item in items[4:]:
+            self.repository.insert(item)
+
+        for sort_dir in [SortDirection.ASC, SortDirection.DESC]:
+            for filter_param in [None, "a", "test"]:
+                expected = self.repository._apply_sort(
+                    self.repository._apply_filter(items, filter_param),
+                    "name",
+                    sort_dir,
+                )
+                for page in range(1, 5):
+                    result = self.repository.search(
+                        StubSearchParams(
+                            init_page=page,
+                            init_per_page=3,
+                            init_sort="name",
+                            init_sort_dir=sort_dir,
+                            init_filter=filter_param,
+                        )
+                    )
+                    assert result.items == expected[(page - 1) * 3 : page * 3]
+
+    def test_search_sorted_index_follows_updates_and_deletes(self):
+        items = [
+            StubEntity(Uuid(), "b", 1),
+            StubEntity(Uuid(), "a", 2),
+            StubEntity(Uuid(), "c", 3),
+        ]
+        self.repository.bulk_insert(items)
+
+        items[2].name = "0"
+        self.repository.update(items[2])
+        self.repository.delete(items[1].id)
+
+        result = self.repository.search(StubSearchParams(init_sort="name"))
+        assert result.items == [items[2], items[0]]
+
+        result = self.repository.search(
+            StubSearchParams(init_sort="name", init_sort_dir="desc")
+        )
+        assert result.items == [items[0], items[2]]
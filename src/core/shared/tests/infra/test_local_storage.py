@@ -0,0 +1,25 @@
+import io
+from pathlib import Path
+
+from src.core.shared.infra.storage.local_storage import LocalStorage
+
+
+class TestLocalStorage:
+    def test_should_store_a_stream_of_chunks(self, tmp_path):
+        storage = LocalStorage(str(tmp_path))
+        chunks = (bytes([index]) * 1024 for index in range(4))
+
+        location = storage.store_stream(Path("images/1/banner.png"), chunks)
+
+        assert location == tmp_path.joinpath("images/1/banner.png").as_uri()
+        assert storage.get(Path("images/1/banner.png")) == b"".join(
+            bytes([index]) * 1024 for index in range(4)
+        )
+
+    def test_should_store_a_file_object(self, tmp_path):
+        storage = LocalStorage(str(tmp_path))
+        content = b"x" * (200 * 1024)
+
+        storage.store_stream(Path("banner.png"), io.BytesIO(content))
+
+        assert storage.get(Path("banner.png")) == content
@@ -0,0 +1,92 @@
+import pytest
+
+from src.core.shared.infra.cache.lru_cache import LRUCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLRUCache:
+    clock: FakeClock
+    cache: LRUCache[str, int]
+
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.cache = LRUCache(max_size=2, ttl=10, clock=self.clock)
+
+    def test_should_reject_empty_size(self):
+        with pytest.raises(ValueError, match="max_size must be greater than 0"):
+            LRUCache(max_size=0)
+
+    def test_should_count_hits_and_misses(self):
+        assert self.cache.get("a") is None
+        self.cache.set("a", 1)
+
+        assert self.cache.get("a") == 1
+        assert self.cache.stats() == {
+            "size": 1,
+            "max_size": 2,
+            "weight": 0,
+            "max_weight": None,
+            "hits": 1,
+            "misses": 1,
+            "hit_rate": 0.5,
+        }
+
+    def test_should_expire_entries_after_ttl(self):
+        self.cache.set("a", 1)
+        self.cache.set("b", 2, ttl=20)
+        self.clock.now = 10
+
+        assert self.cache.get("a") is None
+        assert self.cache.get("b") == 2
+        assert len(self.cache) == 1
+
+    def test_should_evict_least_recently_used(self):
+        self.cache.set("a", 1)
+        self.cache.set("b", 2)
+        self.cache.get("a")
+        self.cache.set("c", 3)
+
+        assert self.cache.get("b") is None
+        assert self.cache.get("a") == 1
+        assert self.cache.get("c") == 3
+
+    def test_should_invalidate_and_clear(self):
+        self.cache.set("a", 1)
+        self.cache.set("b", 2)
+        self.cache.invalidate("a")
+        self.cache.invalidate("missing")
+
+        assert self.cache.get("a") is None
+        assert self.cache.get("b") == 2
+
+        self.cache.clear()
+        assert len(self.cache) == 0
+        assert self.cache.stats()["hits"] == 0
+
+    def test_should_evict_by_weight(self):
+        cache = LRUCache(
+            max_size=10,
+            clock=self.clock,
+            max_weight=10,
+            weigh=lambda key, value: len(value),
+        )
+        cache.set("a", "xxxx")
+        cache.set("b", "xxxx")
+        cache.set("a", "xx")
+        cache.set("c", "xxxx")
+
+        assert cache.weight == 10
+        assert cache.get("a") == "xx"
+
+        cache.set("d", "x" * 20)
+
+        assert len(cache) == 1
+        assert cache.get("d") == "x" * 20
+        assert cache.weight == 20
@@ -0,0 +1,130 @@
+import threading
+
+import pytest
+from botocore.exceptions import (
+    ClientError,
+    EndpointConnectionError,
+    ParamValidationError,
+    ReadTimeoutError,
+)
+
+from src.core.shared.infra.storage.in_memory_s3_client import InMemoryS3Client
+from src.core.shared.infra.storage.multipart_upload import MultipartUploader
+
+
+def client_error(code: str, status: int | None = None) -> ClientError:
+    response = {"Error": {"Code": code}}
+    if status is not None:
+        response["ResponseMetadata"] = {"HTTPStatusCode": status}
+    return ClientError(response, "UploadPart")
+
+
+class TestMultipartUploader:
+    def setup_method(self):
+        self.client = InMemoryS3Client()
+        self.uploader = MultipartUploader(
+            self.client, "bucket", max_workers=3, max_retries=2, retry_backoff=0
+        )
+
+    def test_should_upload_parts_and_complete_in_order(self):
+        parts = [bytes([number]) * 10 for number in range(7)]
+
+        self.uploader.upload("video.mp4", parts, "video/mp4")
+
+        assert self.client.objects["video.mp4"] == {
+            "Body": b"".join(parts),
+            "ContentType": "video/mp4",
+        }
+        assert self.client.calls["upload_part"] == 7
+        assert self.client.uploads == {}
+
+    def test_should_retry_failed_parts(self):
+        self.client.fail_part(2, times=2)
+
+        self.uploader.upload("video.mp4", [b"a", b"b", b"c"], "video/mp4")
+
+        assert self.client.objects["video.mp4"]["Body"] == b"abc"
+        assert self.client.calls["upload_part"] == 5
+
+    def test_should_abort_when_a_part_keeps_failing(self):
+        self.client.fail_part(2, times=3)
+
+        with pytest.raises(ClientError):
+            self.uploader.upload("video.mp4", [b"a", b"b", b"c"], "video/mp4")
+
+        assert "video.mp4" not in self.client.objects
+        assert self.client.uploads == {}
+        assert self.client.calls["abort_multipart_upload"] == 1
+
+    @pytest.mark.parametrize("code", ["AccessDenied", "NoSuchUpload", "InvalidPart"])
+    def test_should_not_retry_permanent_errors(self, code):
+        self.client.fail_part(2, code=code)
+
+        with pytest.raises(ClientError) as raised:
+            self.uploader.upload("video.mp4", [b"a", b"b", b"c"], "video/mp4")
+
+        assert raised.value.response["Error"]["Code"] == code
+        assert self.client.calls["upload_part"] == 3
+        assert self.client.calls["abort_multipart_upload"] == 1
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            client_error("SlowDown"),
+            client_error("InternalError"),
+            client_error("Unknown", status=503),
+            client_error("Unknown", status=429),
+            EndpointConnectionError(endpoint_url="https://s3"),
+            ReadTimeoutError(endpoint_url="https://s3"),
+        ],
+    )
+    def test_should_treat_throttling_server_and_connection_errors_as_transient(
+        self, error
+    ):
+        assert MultipartUploader.is_transient(error)
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            client_error("AccessDenied", status=403),
+            client_error("NoSuchUpload", status=404),
+            ParamValidationError(report="missing Body"),
+            ValueError("bad part"),
+        ],
+    )
+    def test_should_treat_other_errors_as_permanent(self, error):
+        assert not MultipartUploader.is_transient(error)
+
+    def test_should_abort_when_the_stream_fails(self):
+        def parts():
+            yield b"a"
+            raise OSError("connection reset")
+
+        with pytest.raises(OSError):
+            self.uploader.upload("video.mp4", parts(), "video/mp4")
+
+        assert self.client.uploads == {}
+        assert self.client.calls["abort_multipart_upload"] == 1
+
+    def test_should_bound_the_parts_in_flight(self):
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+        upload_part = self.client.upload_part
+
+        def tracking_upload_part(**kwargs):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            try:
+                return upload_part(**kwargs)
+            finally:
+                with lock:
+                    in_flight -= 1
+
+        self.client.upload_part = tracking_upload_part
+
+        self.uploader.upload("video.mp4", [b"x"] * 20, "video/mp4")
+
+        assert 1 <= peak <= 3
@@ -0,0 +1,70 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.core.shared.application.cryptography import (
+    CryptographyBusyException,
+    ICryptography,
+)
+from src.core.shared.infra.cryptography.pooled_hasher import PooledHasher
+
+
+class BlockingCryptography(ICryptography):
+    def __init__(self):
+        self.release = threading.Event()
+
+    def hash(self, plain: str) -> str:
+        self.release.wait(5)
+        return f"hashed:{plain}"
+
+    def verify(self, plain: str, hash: str) -> bool:
+        self.release.wait(5)
+        return hash == f"hashed:{plain}"
+
+
+class TestPooledHasher:
+    inner: BlockingCryptography
+    hasher: PooledHasher
+
+    def setup_method(self):
+        self.inner = BlockingCryptography()
+        self.hasher = PooledHasher(self.inner, max_workers=1, max_pending=2)
+
+    def teardown_method(self):
+        self.inner.release.set()
+        self.hasher.shutdown()
+
+    def test_should_require_pending_slots_for_every_worker(self):
+        with pytest.raises(ValueError, match="max_pending must be at least"):
+            PooledHasher(self.inner, max_workers=4, max_pending=2)
+
+    def test_should_delegate_to_the_wrapped_cryptography(self):
+        self.inner.release.set()
+
+        assert self.hasher.hash("secret") == "hashed:secret"
+        assert self.hasher.verify("secret", "hashed:secret") is True
+        assert self.hasher.verify("other", "hashed:secret") is False
+
+    def test_should_reject_when_the_queue_is_full(self):
+        running = self.hasher.submit_hash("a")
+        queued = self.hasher.submit_hash("b")
+
+        with pytest.raises(CryptographyBusyException, match="try again later"):
+            self.hasher.submit_hash("c")
+
+        self.inner.release.set()
+        assert running.result(5) == "hashed:a"
+        assert queued.result(5) == "hashed:b"
+        assert self.hasher.hash("c") == "hashed:c"
+
+    def test_should_expose_async_operations(self):
+        self.inner.release.set()
+
+        async def run():
+            return await asyncio.gather(
+                self.hasher.hash_async("secret"),
+                self.hasher.verify_async("secret", "hashed:secret"),
+            )
+
+        assert asyncio.run(run()) == ["hashed:secret", True]
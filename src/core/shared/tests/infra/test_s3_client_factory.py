@@ -0,0 +1,61 @@
+import threading
+
+from src.core.shared.infra.storage import s3_client_factory
+from src.core.shared.infra.storage.s3_client_factory import (
+    get_s3_client,
+    reset_s3_client,
+)
+from src.core.shared.infra.storage.s3_storage import S3Storage
+
+
+class TestS3ClientFactory:
+    def setup_method(self):
+        reset_s3_client()
+
+    def teardown_method(self):
+        reset_s3_client()
+
+    def test_should_share_one_pooled_client(self, monkeypatch):
+        monkeypatch.delenv("S3_MAX_POOL_CONNECTIONS", raising=False)
+        client = get_s3_client()
+
+        assert get_s3_client() is client
+        assert client.meta.config.max_pool_connections == 50
+        assert client.meta.config.tcp_keepalive is True
+        assert client.meta.config.retries == {
+            "mode": "standard",
+            "total_max_attempts": 4,
+        }
+
+    def test_should_size_the_pool_from_the_environment(self, monkeypatch):
+        monkeypatch.setenv("S3_MAX_POOL_CONNECTIONS", "12")
+
+        assert get_s3_client().meta.config.max_pool_connections == 12
+
+    def test_should_create_the_client_once_across_threads(self, monkeypatch):
+        created = []
+
+        def create_client():
+            created.append(object())
+            return created[-1]
+
+        monkeypatch.setattr(s3_client_factory, "_create_client", create_client)
+
+        clients = []
+        threads = [
+            threading.Thread(target=lambda: clients.append(get_s3_client()))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(created) == 1
+        assert all(client is created[0] for client in clients)
+
+    def test_should_not_create_a_client_until_storage_is_used(self):
+        storage = S3Storage()
+
+        assert s3_client_factory._client is None
+        assert storage.s3_client is get_s3_client()
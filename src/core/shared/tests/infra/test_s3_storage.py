@@ -0,0 +1,96 @@
+import io
+from pathlib import Path
+
+import pytest
+from botocore.exceptions import ClientError
+
+from src.core.shared.infra.storage.in_memory_s3_client import InMemoryS3Client
+from src.core.shared.infra.storage.multipart_upload import MIN_PART_SIZE
+from src.core.shared.infra.storage.s3_storage import S3Storage
+
+
+class TestS3Storage:
+    def setup_method(self):
+        self.client = InMemoryS3Client()
+        self.storage = S3Storage(
+            multipart_threshold=MIN_PART_SIZE,
+            part_size=MIN_PART_SIZE,
+            s3_client=self.client,
+            bucket_name="bucket",
+        )
+
+    def test_should_put_small_objects_in_one_request(self):
+        content = b"png"
+        bodies = []
+        put_object = self.client.put_object
+
+        def spying_put_object(**kwargs):
+            bodies.append(kwargs["Body"])
+            return put_object(**kwargs)
+
+        self.client.put_object = spying_put_object
+
+        self.storage.store(Path("images/1/banner.png"), content)
+
+        assert bodies[0] is content
+
+        assert self.client.objects["images/1/banner.png"] == {
+            "Body": b"png",
+            "ContentType": "image/png",
+        }
+        assert self.client.calls == {"put_object": 1}
+
+    def test_should_use_multipart_uploads_above_the_threshold(self):
+        content = b"x" * (2 * MIN_PART_SIZE + 10)
+
+        self.storage.store_stream(Path("videos/1/intro.mp4"), io.BytesIO(content))
+
+        assert self.client.objects["videos/1/intro.mp4"]["Body"] == content
+        assert self.client.calls["upload_part"] == 3
+        assert "put_object" not in self.client.calls
+
+    def test_should_slice_large_payloads_into_parts(self):
+        content = b"x" * (MIN_PART_SIZE + 10)
+
+        self.storage.store(Path("videos/1/intro.mp4"), content)
+
+        assert self.client.objects["videos/1/intro.mp4"]["Body"] == content
+        assert self.client.calls["upload_part"] == 2
+
+    def test_should_leave_part_retries_to_the_client(self):
+        self.client.fail_part(1)
+
+        with pytest.raises(ClientError):
+            self.storage.store(Path("videos/1/intro.mp4"), b"x" * MIN_PART_SIZE)
+
+        assert self.client.calls["upload_part"] == 1
+        assert self.client.calls["abort_multipart_upload"] == 1
+
+    def test_should_put_small_streams_in_one_request(self):
+        self.storage.store_stream(Path("docs/1.txt"), [b"a", b"b"])
+
+        assert self.client.objects["docs/1.txt"] == {
+            "Body": b"ab",
+            "ContentType": "text/plain",
+        }
+        assert self.client.calls == {"put_object": 1}
+
+    def test_should_delete_an_object_and_the_keys_under_it(self):
+        keys = ["images/1", "images/1/a.png", "images/1/b.png", "images/10/c.png"]
+        for key in keys:
+            self.storage.store(Path(key), b"x")
+
+        self.storage.delete(Path("images/1"))
+
+        assert sorted(self.client.objects) == ["images/10/c.png"]
+
+    def test_should_page_listings_and_batch_deletes(self):
+        for index in range(2500):
+            self.client.objects[f"images/{index:04}.png"] = {"Body": b""}
+        self.client.objects["videos/1.mp4"] = {"Body": b""}
+
+        self.storage.delete_many([Path("images")])
+
+        assert list(self.client.objects) == ["videos/1.mp4"]
+        assert self.client.calls["list_objects_v2"] == 3
+        assert self.client.calls["delete_objects"] == 3
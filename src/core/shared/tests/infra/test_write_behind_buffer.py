@@ -0,0 +1,113 @@
+import threading
+from typing import List
+
+from src.core.shared.infra.db.write_behind_buffer import WriteBehindBuffer
+
+
+class RecordingSink:
+    def __init__(self, fail_times: int = 0):
+        self.batches: List[List[int]] = []
+        self.fail_times = fail_times
+        self.flushed = threading.Event()
+
+    def __call__(self, batch: List[int]) -> None:
+        if self.fail_times:
+            self.fail_times -= 1
+            raise RuntimeError("database unavailable")
+        self.batches.append(batch)
+        self.flushed.set()
+
+
+class TestWriteBehindBuffer:
+    def test_should_flush_when_the_batch_is_full(self):
+        sink = RecordingSink()
+        buffer = WriteBehindBuffer(sink, batch_size=3, flush_interval=60)
+
+        for item in range(3):
+            buffer.add(item)
+
+        assert sink.flushed.wait(5)
+        assert sink.batches == [[0, 1, 2]]
+        buffer.close()
+
+    def test_should_flush_after_the_interval(self):
+        sink = RecordingSink()
+        buffer = WriteBehindBuffer(sink, batch_size=100, flush_interval=0.01)
+
+        buffer.add(1)
+
+        assert sink.flushed.wait(5)
+        assert sink.batches == [[1]]
+        buffer.close()
+
+    def test_should_flush_pending_items_on_close(self):
+        sink = RecordingSink()
+        buffer = WriteBehindBuffer(sink, batch_size=100, flush_interval=60)
+
+        buffer.add(1)
+        buffer.add(2)
+        buffer.close()
+
+        assert sink.batches == [[1, 2]]
+        assert len(buffer) == 0
+
+    def test_should_requeue_failed_batches(self):
+        sink = RecordingSink(fail_times=1)
+        buffer = WriteBehindBuffer(
+            sink, batch_size=100, flush_interval=60, max_pending=2
+        )
+        buffer._pending = [1, 2, 3]
+
+        buffer.flush()
+        assert buffer._pending == [2, 3]
+
+        buffer.flush()
+        assert sink.batches == [[2, 3]]
+
+    def test_should_isolate_items_that_keep_failing(self):
+        persisted = []
+
+        def sink(batch):
+            if "poison" in batch:
+                raise ValueError("violates a constraint")
+            persisted.extend(batch)
+
+        buffer = WriteBehindBuffer(
+            sink,
+            batch_size=100,
+            flush_interval=60,
+            is_transient=lambda error: not isinstance(error, ValueError),
+        )
+        buffer._pending = ["a", "poison", "b"]
+
+        buffer.flush()
+
+        assert persisted == ["a", "b"]
+        assert len(buffer) == 0
+
+    def test_should_requeue_items_that_fail_transiently_when_isolated(self):
+        attempts = {"b": 0}
+        persisted = []
+
+        def sink(batch):
+            if "poison" in batch:
+                raise ValueError("violates a constraint")
+            if batch == ["b"] and not attempts["b"]:
+                attempts["b"] += 1
+                raise ConnectionError("database restarting")
+            persisted.extend(batch)
+
+        buffer = WriteBehindBuffer(
+            sink,
+            batch_size=100,
+            flush_interval=60,
+            is_transient=lambda error: not isinstance(error, ValueError),
+        )
+        buffer._pending = ["a", "poison", "b"]
+
+        buffer.flush()
+        assert persisted == ["a"]
+        assert buffer._pending == ["b"]
+
+        buffer.flush()
+        assert persisted == ["a", "b"]
@@ -36,6 +36,21 @@ class UserDocumentation:
                 description="User is active",
                 type=openapi.TYPE_BOOLEAN,
             ),
+            openapi.Parameter(
+                "cursor",
+                openapi.IN_QUERY,
+                description="Cursor of the next page (empty for the first page)",
+                type=openapi.TYPE_STRING,
+            ),
+            openapi.Parameter(
+                "count",
+                openapi.IN_QUERY,
+                description=(
+                    "How the total is computed (exact by default, none with a cursor)"
+                ),
+                type=openapi.TYPE_STRING,
+                enum=["exact", "cached", "estimated", "none"],
+            ),
         ]
 
     @staticmethod
@@ -93,10 +108,18 @@ class UserDocumentation:
                 "meta": openapi.Schema(
                     type=openapi.TYPE_OBJECT,
                     properties={
-                        "total": openapi.Schema(type=openapi.TYPE_INTEGER),
+                        "total": openapi.Schema(
+                            type=openapi.TYPE_INTEGER, x_nullable=True
+                        ),
+                        "total_is_exact": openapi.Schema(type=openapi.TYPE_BOOLEAN),
                         "current_page": openapi.Schema(type=openapi.TYPE_INTEGER),
                         "per_page": openapi.Schema(type=openapi.TYPE_INTEGER),
-                        "last_page": openapi.Schema(type=openapi.TYPE_INTEGER),
+                        "last_page": openapi.Schema(
+                            type=openapi.TYPE_INTEGER, x_nullable=True
+                        ),
+                        "next_cursor": openapi.Schema(
+                            type=openapi.TYPE_STRING, x_nullable=True
+                        ),
                     },
                 ),
             },
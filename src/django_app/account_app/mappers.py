@@ -13,6 +13,7 @@ class UserModelMapper:
             is_staff=entity.is_staff,
             is_superuser=entity.is_superuser,
             is_active=entity.is_active,
+            token_version=entity.token_version,
             created_at=entity.created_at,
             updated_at=entity.updated_at,
         )
@@ -27,6 +28,7 @@ class UserModelMapper:
             is_staff=model.is_staff,
             is_superuser=model.is_superuser,
             is_active=model.is_active,
+            token_version=model.token_version,
             created_at=model.created_at,
             updated_at=model.updated_at,
         )
@@ -3,7 +3,10 @@ import datetime
 from uuid import UUID
 
 from src.core.account.application.use_cases.common.user_output import UserOutput
-from src.core.account.application.use_cases.list_users import ListUsersOutput
+from src.core.account.application.use_cases.list_users import (
+    ListUsersOutput,
+    ListUsersReadModelOutput,
+)
 from src.core.account.domain.user_role import UserRole
 from src.django_app.shared_app.presenters import CollectionPresenter, ResourcePresenter
 
@@ -35,9 +38,13 @@ class UserPresenter(ResourcePresenter):
 
 @dataclass(slots=True)
 class UserCollectionPresenter(CollectionPresenter):
-    output: ListUsersOutput
+    output: ListUsersOutput | ListUsersReadModelOutput
 
     def __post_init__(self):
-        self.data = [UserPresenter.from_output(item) for item in self.output.items]
+        if isinstance(self.output, ListUsersReadModelOutput):
+            # Read models have exactly the presented fields; dump them as they are.
+            self.data = self.output.items
+        else:
+            self.data = [UserPresenter.from_output(item) for item in self.output.items]
 
         self.pagination = self.output
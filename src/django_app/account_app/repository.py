@@ -1,5 +1,5 @@
+from dataclasses import fields
 from typing import List, Set
-from django.core.paginator import Paginator
 
 from src.core.shared.domain.exceptions import (
     NotFoundException,
@@ -8,15 +8,20 @@ from src.core.shared.domain.repositories.search_params import SortDirection
 from src.core.account.domain.user import User, UserId
 from src.core.account.domain.user_repository import (
     IUserRepository,
+    UserReadModel,
+    UserReadModelSearchResult,
     UserSearchParams,
     UserSearchResult,
 )
 from src.django_app.account_app.mappers import UserModelMapper
 from src.django_app.account_app.models import UserModel
+from src.django_app.account_app.signals import user_changed
+from src.django_app.shared_app.query_paginator import QueryPaginator
 
 
 class UserDjangoRepository(IUserRepository):
     sortable_fields = ["name", "created_at"]
+    read_model_fields = [field.name for field in fields(UserReadModel)]
 
     def insert(self, entity: User) -> None:
         model = UserModelMapper.to_model(entity)
@@ -52,13 +57,41 @@ class UserDjangoRepository(IUserRepository):
             is_staff=entity.is_staff,
             is_superuser=entity.is_superuser,
             is_active=entity.is_active,
+            token_version=entity.token_version,
             updated_at=entity.updated_at,
         )
 
+        user_changed.send(sender=self.__class__, user_id=entity.id.value)
+
         if not model:
             raise NotFoundException(entity.id.value, self.get_entity())
 
     def search(self, props: UserSearchParams) -> UserSearchResult:
+        page = self._paginator(self._filter(props), props).paginate(props)
+
+        return UserSearchResult(
+            items=[UserModelMapper.to_entity(model) for model in page.models],
+            total=page.total,
+            current_page=props.page,
+            per_page=props.per_page,
+            next_cursor=page.next_cursor,
+            total_is_exact=page.total_is_exact,
+        )
+
+    def search_read_models(self, props: UserSearchParams) -> UserReadModelSearchResult:
+        query = self._filter(props).values(*self.read_model_fields)
+        page = self._paginator(query, props).paginate(props)
+
+        return UserReadModelSearchResult(
+            items=[UserReadModel(**row) for row in page.models],
+            total=page.total,
+            current_page=props.page,
+            per_page=props.per_page,
+            next_cursor=page.next_cursor,
+            total_is_exact=page.total_is_exact,
+        )
+
+    def _filter(self, props: UserSearchParams):
         query = UserModel.objects.all()
 
         if props.filter:
@@ -77,30 +110,16 @@ class UserDjangoRepository(IUserRepository):
             if props.filter.is_active:
                 query = query.filter(is_active=props.filter.is_active)
 
-        if props.sort and props.sort in self.sortable_fields:
-            if props.sort_dir == SortDirection.DESC:
-                props.sort = f"-{props.sort}"
-            query = query.order_by(props.sort)
-        else:
-            query = query.order_by("-created_at")
-
-        paginator = Paginator(query, props.per_page)
-
-        if props.page <= paginator.num_pages:
-            page_obj = paginator.page(props.page)
-        else:
-            page_obj = paginator.page(paginator.num_pages)
-            page_obj.object_list = []
+        return query
 
-        return UserSearchResult(
-            items=[UserModelMapper.to_entity(model) for model in page_obj.object_list],
-            total=paginator.count,
-            current_page=props.page,
-            per_page=props.per_page,
-        )
+    def _paginator(self, query, props: UserSearchParams) -> QueryPaginator:
+        if props.sort and props.sort in self.sortable_fields:
+            return QueryPaginator(query, props.sort, props.sort_dir)
+        return QueryPaginator(query, "created_at", SortDirection.DESC)
 
     def delete(self, entity_id: UserId) -> None:
         UserModel.objects.filter(id=entity_id).delete()
+        user_changed.send(sender=self.__class__, user_id=entity_id)
 
     def get_entity(self) -> User:
         return User
@@ -0,0 +1,5 @@
+from django.dispatch import Signal
+
+# Sent by UserDjangoRepository with a `user_id` argument after a user is
+# updated or deleted, so other apps can drop what they cached about the user.
+user_changed = Signal()
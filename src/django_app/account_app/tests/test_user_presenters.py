@@ -0,0 +1,63 @@
+from src.core.account.application.use_cases.common.user_output import UserOutput
+from src.core.account.application.use_cases.list_users import (
+    ListUsersOutput,
+    ListUsersReadModelOutput,
+)
+from src.core.account.domain.user import User
+from src.core.account.domain.user_repository import UserReadModel
+from src.django_app.account_app.presenters import (
+    UserCollectionPresenter,
+    UserPresenter,
+)
+
+
+def pagination(items):
+    return {
+        "items": items,
+        "total": len(items),
+        "current_page": 1,
+        "per_page": 15,
+        "last_page": 1,
+    }
+
+
+class TestUserCollectionPresenter:
+    def setup_method(self):
+        self.users = [
+            User(name="John", email="john@example.com", password="secret"),
+            User(name="Jane", email="jane@example.com", password="secret"),
+        ]
+
+    def test_should_present_read_models_without_per_row_presenters(self):
+        output = ListUsersReadModelOutput(
+            **pagination([UserReadModel.from_entity(user) for user in self.users])
+        )
+
+        presenter = UserCollectionPresenter(output)
+
+        assert presenter.data is output.items
+        assert all(type(item) is UserReadModel for item in presenter.data)
+
+    def test_should_present_user_outputs_as_user_presenters(self):
+        output = ListUsersOutput(
+            **pagination([UserOutput.from_entity(user) for user in self.users])
+        )
+
+        presenter = UserCollectionPresenter(output)
+
+        assert all(type(item) is UserPresenter for item in presenter.data)
+
+    def test_should_serialize_both_outputs_identically(self):
+        read_models = UserCollectionPresenter(
+            ListUsersReadModelOutput(
+                **pagination([UserReadModel.from_entity(user) for user in self.users])
+            )
+        )
+        outputs = UserCollectionPresenter(
+            ListUsersOutput(
+                **pagination([UserOutput.from_entity(user) for user in self.users])
+            )
+        )
+
+        assert read_models.serialize() == outputs.serialize()
+        assert read_models.serialize_json() == outputs.serialize_json()
@@ -0,0 +1,64 @@
+import pytest
+
+from src.core.account.domain.user import User
+from src.core.account.domain.user_repository import (
+    UserFilter,
+    UserReadModel,
+    UserSearchParams,
+)
+from src.django_app.account_app.repository import UserDjangoRepository
+
+
+@pytest.mark.django_db
+class TestUserDjangoRepositoryReadModels:
+    @pytest.fixture(autouse=True)
+    def users(self):
+        self.repository = UserDjangoRepository()
+        self.repository.bulk_insert(
+            [
+                User(
+                    name=f"User {index}",
+                    email=f"user{index}@example.com",
+                    password="secret",
+                    is_staff=index == 0,
+                )
+                for index in range(3)
+            ]
+        )
+
+    def test_should_project_the_same_rows_as_the_entity_search(self):
+        params = UserSearchParams(init_per_page=2, init_sort="name")
+
+        entities = self.repository.search(params)
+        read_models = self.repository.search_read_models(params)
+
+        assert read_models.items == [
+            UserReadModel.from_entity(entity) for entity in entities.items
+        ]
+        assert read_models.total == entities.total == 3
+        assert read_models.total_is_exact is True
+        assert read_models.next_cursor is None
+        assert not hasattr(read_models.items[0], "password")
+
+    def test_should_apply_filters_to_the_projection(self):
+        read_models = self.repository.search_read_models(
+            UserSearchParams(init_filter=UserFilter(email="user1@"))
+        )
+
+        assert [item.email for item in read_models.items] == ["user1@example.com"]
+        assert read_models.total == 1
+
+    def test_should_pass_the_cursor_through_in_cursor_mode(self):
+        params = UserSearchParams(init_per_page=2, init_sort="name", init_cursor="")
+
+        read_models = self.repository.search_read_models(params)
+        assert [item.name for item in read_models.items] == ["User 0", "User 1"]
+        assert read_models.next_cursor == self.repository.search(params).next_cursor
+
+        next_page = self.repository.search_read_models(
+            UserSearchParams(
+                init_per_page=2, init_sort="name", init_cursor=read_models.next_cursor
+            )
+        )
+        assert [item.name for item in next_page.items] == ["User 2"]
+        assert next_page.next_cursor is None
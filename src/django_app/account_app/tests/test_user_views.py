@@ -0,0 +1,47 @@
+import pytest
+from django.test import Client
+
+from src.django_app.account_app.models import UserModel
+from src.django_app.authentication_app.services.jwt_auth_service import JwtAuthService
+
+
+@pytest.mark.django_db
+class TestUserAPIViewConditionalGet:
+    @pytest.fixture(autouse=True)
+    def clients(self):
+        self.admin_user = UserModel.objects.create_superuser(
+            "admin@example.com", "Admin", "x"
+        )
+        token = JwtAuthService().generate(
+            {"user_id": str(self.admin_user.id), "is_staff": True, "token_version": 0}
+        )
+        self.admin = Client(HTTP_AUTHORIZATION=f"Bearer {token}")
+        self.user = UserModel.objects.create_user("john@example.com", "John", "x")
+
+    def get_list(self, **headers):
+        return self.admin.get("/api/users", **headers)
+
+    def test_should_send_a_private_etag_without_last_modified_on_lists(self):
+        response = self.get_list()
+
+        assert response.status_code == 200
+        assert "Last-Modified" not in response
+        assert "private" in response["Cache-Control"]
+        assert "Authorization" in response["Vary"]
+        assert self.get_list(HTTP_IF_NONE_MATCH=response["ETag"]).status_code == 304
+
+    def test_should_revalidate_after_update_and_delete(self):
+        etag = self.get_list()["ETag"]
+
+        self.user.name = "Johnny"
+        self.user.save()
+        response = self.get_list(HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        etag = response["ETag"]
+
+        self.user.delete()
+        response = self.get_list(HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert [item["email"] for item in response.json()["data"]] == [
+            "admin@example.com"
+        ]
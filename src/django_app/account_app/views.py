@@ -16,7 +16,6 @@ from src.core.account.application.use_cases.update_user import (
     UpdateUserInput,
     UpdateUserUseCase,
 )
-from src.core.shared.infra.cryptography.bcrypt_hasher import BcryptHasher
 from src.core.account.application.use_cases.common.user_output import UserOutput
 from src.core.account.application.use_cases.create_user import (
     CreateUserInput,
@@ -37,18 +36,23 @@ from src.django_app.account_app.serializers import (
     GetUserInputSerializer,
     UpdateUserInputSerializer,
 )
+from src.django_app.shared_app.conditional_get import ConditionalGet
+from src.django_app.shared_app.cryptography import password_hasher
 from src.django_app.shared_app.filter_extractor import FilterExtractor
 
 
-class UserAPIView(APIView, FilterExtractor):
+class UserAPIView(APIView, FilterExtractor, ConditionalGet):
+    cache_control = {"private": True, "max_age": 0, "must_revalidate": True}
+    vary_headers = ("Authorization",)
+
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         user_repo = UserDjangoRepository()
-        cryptography = BcryptHasher()
+        cryptography = password_hasher
 
         self.create_use_case = CreateUserUseCase(user_repo, cryptography)
         self.get_use_case = GetUserUseCase(user_repo)
-        self.list_use_case = ListUsersUseCase(user_repo)
+        self.list_use_case = ListUsersUseCase(user_repo, use_read_model=True)
         self.update_use_case = UpdateUserUseCase(user_repo, cryptography)
         self.delete_use_case = DeleteUserUseCase(user_repo)
 
@@ -73,7 +77,7 @@ class UserAPIView(APIView, FilterExtractor):
 
         return Response(
             status=status.HTTP_201_CREATED,
-            data=self.serialize(output),
+            data=self.present(output),
         )
 
     @swagger_auto_schema(
@@ -99,9 +103,13 @@ class UserAPIView(APIView, FilterExtractor):
 
         output = self.list_use_case.execute(_input)
 
-        return Response(
-            status=status.HTTP_200_OK,
-            data=UserCollectionPresenter(output).serialize(),
+        return self.conditional_response(
+            request,
+            self.page_etag(request, "users", output),
+            None,
+            lambda: Response(
+                status=status.HTTP_200_OK, data=UserCollectionPresenter(output)
+            ),
         )
 
     @swagger_auto_schema(
@@ -122,10 +130,13 @@ class UserAPIView(APIView, FilterExtractor):
         _input = GetUserInput(**serializer.validated_data)
 
         output = self.get_use_case.execute(_input)
+        etag = self.make_etag(output.id, output.updated_at.isoformat())
 
-        return Response(
-            status=status.HTTP_200_OK,
-            data=self.serialize(output),
+        return self.conditional_response(
+            self.request,
+            etag,
+            output.updated_at,
+            lambda: Response(status=status.HTTP_200_OK, data=self.present(output)),
         )
 
     @swagger_auto_schema(
@@ -155,7 +166,7 @@ class UserAPIView(APIView, FilterExtractor):
 
         return Response(
             status=status.HTTP_200_OK,
-            data=self.serialize(output),
+            data=self.present(output),
         )
 
     @swagger_auto_schema(
@@ -218,5 +229,5 @@ class UserAPIView(APIView, FilterExtractor):
         return permissions_map.get(self.request.method, super().get_permissions())
 
     @staticmethod
-    def serialize(output: UserOutput):
-        return UserPresenter.from_output(output).serialize()
+    def present(output: UserOutput) -> UserPresenter:
+        return UserPresenter.from_output(output)
@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class AuthenticationAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'src.django_app.authentication_app'
+
+    def ready(self):
+        from src.django_app.account_app.signals import user_changed
+        from src.django_app.authentication_app.user_cache import on_user_changed
+
+        user_changed.connect(on_user_changed, dispatch_uid="invalidate_user_caches")
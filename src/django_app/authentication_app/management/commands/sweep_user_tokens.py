@@ -0,0 +1,38 @@
+import json
+import time
+
+from django.core.management.base import BaseCommand
+
+from src.django_app.authentication_app.token_sweeper import UserTokenSweeper
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete expired refresh tokens and token revocations in batches and print "
+        "sweep metrics"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--pause", type=float, default=0.0, help="Seconds to wait between batches"
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=0.0,
+            help="Keep sweeping every N seconds instead of exiting after one sweep",
+        )
+
+    def handle(self, *args, **options):
+        sweeper = UserTokenSweeper(
+            batch_size=options["batch_size"], pause=options["pause"]
+        )
+
+        while True:
+            metrics = sweeper.sweep()
+            self.stdout.write(json.dumps(metrics.to_dict()))
+
+            if not options["interval"]:
+                break
+            time.sleep(options["interval"])
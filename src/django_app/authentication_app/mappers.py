@@ -3,6 +3,7 @@ from typing import Tuple
 
 from src.core.account.domain.user import UserId
 from src.core.account.domain.user_token import UserToken, UserTokenId
+from src.django_app.authentication_app.digests import token_digest
 from src.django_app.authentication_app.models import UserTokenModel
 
 
@@ -18,6 +19,7 @@ class UserTokenModelMapper:
         return UserTokenModel(
             id=entity.id.value,
             refresh_token=entity.refresh_token,
+            token_digest=token_digest(entity.refresh_token),
             expires_date=entity.expires_date,
             created_at=entity.created_at,
         ), UserTokenRelations(user_id=entity.user_id.value)
@@ -26,7 +28,7 @@ class UserTokenModelMapper:
     def to_entity(model: UserTokenModel) -> UserToken:
         return UserToken(
             id=UserTokenId(model.id),
-            user_id=UserId(model.user.id),
+            user_id=UserId(model.user_id),
             refresh_token=model.refresh_token,
             expires_date=model.expires_date,
             created_at=model.created_at,
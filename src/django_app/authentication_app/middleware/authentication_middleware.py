@@ -1,12 +1,25 @@
+import copy
+
 import jwt
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from rest_framework import authentication
 from rest_framework.exceptions import AuthenticationFailed, ParseError
 
+from src.django_app.authentication_app.principal import TokenPrincipal
+from src.django_app.authentication_app.services.jwt_auth_service import (
+    JwtAuthService,
+)
+from src.django_app.authentication_app.user_cache import (
+    user_principal_cache,
+    user_token_version_cache,
+)
+
 User = get_user_model()
 
 class JWTAuthentication(authentication.BaseAuthentication):
+    token_service = JwtAuthService()
+
     def authenticate(self, request):
         jwt_token = request.META.get('HTTP_AUTHORIZATION')
         if jwt_token is None:
@@ -15,21 +28,63 @@ class JWTAuthentication(authentication.BaseAuthentication):
         jwt_token = self.get_the_token_from_header(jwt_token)
 
         try:
-            payload = jwt.decode(jwt_token, settings.SECRET_KEY, algorithms=['HS256'])
-            user = User.objects.filter(id=payload['user_id']).first()
-
-            print(f"user {user}")
+            payload = self.token_service.verify(jwt_token)
+            user_id = str(payload['user_id'])
         except jwt.exceptions.InvalidSignatureError:
             raise AuthenticationFailed('Invalid signature')
-        except User.DoesNotExist:
-            raise AuthenticationFailed('User not found')
         except jwt.ExpiredSignatureError:
             raise AuthenticationFailed('Token has expired')
         except Exception as e:
             raise ParseError(str(e))
 
+        if self.token_service.is_revoked(payload):
+            raise AuthenticationFailed('Token has been revoked')
+
+        if getattr(settings, "AUTH_STATELESS_PRINCIPAL", False):
+            user = TokenPrincipal.from_claims(payload)
+            token_version = self.get_token_version(user_id)
+        else:
+            user = self.get_user(user_id)
+            token_version = user.token_version if user else None
+
+        if token_version is None:
+            raise AuthenticationFailed('User not found')
+
+        if payload.get('token_version', 0) != token_version:
+            raise AuthenticationFailed('Token has been revoked')
+
         return (user, jwt_token)
 
+    @classmethod
+    def get_user(cls, user_id: str):
+        user = user_principal_cache.get(user_id)
+
+        if user is None:
+            user = User.objects.filter(id=user_id).first()
+            if user is None:
+                return None
+            user_principal_cache.set(user_id, user)
+
+        # Each request gets its own instance so attribute changes made while
+        # handling it never leak into the cached one.
+        return copy.copy(user)
+
+    @classmethod
+    def get_token_version(cls, user_id: str) -> int | None:
+        token_version = user_token_version_cache.get(user_id)
+
+        if token_version is None:
+            token_version = (
+                User.objects.filter(id=user_id)
+                .values_list('token_version', flat=True)
+                .first()
+            )
+            if token_version is None:
+                return None
+            user_token_version_cache.set(user_id, token_version)
+
+        return token_version
+
     @classmethod
     def get_the_token_from_header(cls, token):
         return token.replace('Bearer ', '').strip()
@@ -0,0 +1,46 @@
+import hashlib
+
+from django.db import migrations, models
+
+
+def fill_token_digest(apps, schema_editor):
+    UserTokenModel = apps.get_model('authentication_app', 'UserTokenModel')
+    tokens = UserTokenModel.objects.only('id', 'refresh_token')
+
+    for token in tokens.iterator(chunk_size=1000):
+        token.token_digest = hashlib.sha256(
+            token.refresh_token.encode('utf-8')
+        ).hexdigest()
+        token.save(update_fields=['token_digest'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='usertokenmodel',
+            name='refresh_token',
+            field=models.TextField(),
+        ),
+        migrations.AddField(
+            model_name='usertokenmodel',
+            name='token_digest',
+            field=models.CharField(default='', max_length=64),
+            preserve_default=False,
+        ),
+        migrations.RunPython(fill_token_digest, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='usertokenmodel',
+            name='token_digest',
+            field=models.CharField(db_index=True, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='usertokenmodel',
+            name='expires_date',
+            field=models.DateField(db_index=True),
+        ),
+    ]
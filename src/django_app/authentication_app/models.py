@@ -1,5 +1,6 @@
 from uuid import uuid4
 from django.db import models
+from django.utils import timezone
 
 from src.django_app.account_app.models import UserModel
 
@@ -8,8 +9,10 @@ class UserTokenModel(models.Model):
     app_label = "authentication_app"
 
     id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
-    refresh_token = models.CharField(max_length=255)
-    expires_date = models.DateField(auto_now_add=False)
+    refresh_token = models.TextField()
+    # SHA-256 of refresh_token: a fixed-length, indexable lookup key.
+    token_digest = models.CharField(max_length=64, db_index=True)
+    expires_date = models.DateField(auto_now_add=False, db_index=True)
     user = models.ForeignKey(
         UserModel, on_delete=models.CASCADE, related_name="user_tokens"
     )
@@ -18,3 +21,14 @@ class UserTokenModel(models.Model):
     class Meta:
         db_table = "user_tokens"
         ordering = ["-created_at"]
+
+
+class RevokedTokenModel(models.Model):
+    app_label = "authentication_app"
+
+    jti = models.CharField(primary_key=True, max_length=64)
+    expires_at = models.DateTimeField(db_index=True)
+    created_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    class Meta:
+        db_table = "revoked_tokens"
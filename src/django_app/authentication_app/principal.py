@@ -0,0 +1,80 @@
+from typing import Any, Dict, Iterable
+
+from django.contrib.auth import get_user_model
+
+
+class TokenPrincipal:
+    """Authenticated user built from verified JWT claims.
+
+    Exposes what DRF and the permission classes read from `request.user`
+    without touching the database. Anything else (object permissions, other
+    model attributes) loads the user model on first access.
+
+    `is_active` is always true: deactivation is enforced only through the
+    `token_version` bump, which rejects the user's existing tokens. Other
+    processes see the bump once their `user_token_version_cache` entry
+    expires, up to AUTH_USER_CACHE_TTL seconds later.
+    """
+
+    is_active = True
+    is_authenticated = True
+    is_anonymous = False
+
+    def __init__(
+        self,
+        id: str,
+        email: str | None = None,
+        is_staff: bool = False,
+        is_superuser: bool = False,
+        token_version: int = 0,
+    ):
+        self.id = id
+        self.email = email
+        self.is_staff = bool(is_staff)
+        self.is_superuser = bool(is_superuser)
+        self.token_version = token_version
+        self._user = None
+
+    @classmethod
+    def from_claims(cls, payload: Dict[str, Any]) -> "TokenPrincipal":
+        return cls(
+            id=str(payload["user_id"]),
+            email=payload.get("email"),
+            is_staff=payload.get("is_staff", False),
+            is_superuser=payload.get("is_superuser", False),
+            token_version=payload.get("token_version", 0),
+        )
+
+    @property
+    def pk(self) -> str:
+        return self.id
+
+    @property
+    def user(self):
+        if self._user is None:
+            self._user = get_user_model().objects.get(id=self.id)
+        return self._user
+
+    def get_username(self) -> str | None:
+        return self.email
+
+    def has_perm(self, perm: str, obj: Any = None) -> bool:
+        if self.is_superuser:
+            return True
+        return self.user.has_perm(perm, obj)
+
+    def has_perms(self, perm_list: Iterable[str], obj: Any = None) -> bool:
+        return all(self.has_perm(perm, obj) for perm in perm_list)
+
+    def has_module_perms(self, app_label: str) -> bool:
+        if self.is_superuser:
+            return True
+        return self.user.has_module_perms(app_label)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.user, name)
+
+    def __str__(self) -> str:
+        return self.email or self.id
@@ -1,23 +1,62 @@
+from datetime import date
+from typing import List
+
+from django.conf import settings
+
 from src.core.account.domain.user_token import UserToken
 from src.core.account.domain.user_token_repository import IUserTokenRepository
-from src.django_app.account_app.models import UserModel
+from src.django_app.authentication_app.digests import token_digest
 from src.django_app.authentication_app.mappers import UserTokenModelMapper
+from src.django_app.authentication_app.models import UserTokenModel
+from src.django_app.authentication_app.token_sink import user_token_sink
 
 
 class UserTokenDjangoRepository(IUserTokenRepository):
+    def __init__(self, write_behind: bool | None = None):
+        self.write_behind = (
+            write_behind
+            if write_behind is not None
+            else getattr(settings, "USER_TOKEN_WRITE_BEHIND", False)
+        )
 
     def insert(self, entity: UserToken) -> None:
-        model, relations = UserTokenModelMapper.to_model(entity)
+        model = self._to_model(entity)
 
-        user = UserModel.objects.get(id=relations.user_id)
+        if self.write_behind:
+            user_token_sink.add(model)
+        else:
+            model.save()
 
-        model.user = user
-
-        model.save()
+    def bulk_insert(self, entities: List[UserToken]) -> None:
+        UserTokenModel.objects.bulk_create(map(self._to_model, entities))
 
     def find_by_refresh_token(self, refresh_token: str) -> UserToken | None:
-        model = UserModel.objects.filter(refresh_token=refresh_token).first()
+        user_token_sink.flush()
+        model = UserTokenModel.objects.filter(
+            token_digest=token_digest(refresh_token), refresh_token=refresh_token
+        ).first()
         return UserTokenModelMapper.to_entity(model) if model else None
 
     def delete(self, entity_id: str) -> None:
-        UserModel.objects.filter(id=entity_id).delete()
+        UserTokenModel.objects.filter(id=entity_id).delete()
+
+    def delete_expired(self, today: date, batch_size: int = 1000) -> int:
+        ids = list(
+            UserTokenModel.objects.filter(expires_date__lt=today)
+            .order_by()
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            return 0
+
+        deleted, _ = UserTokenModel.objects.filter(id__in=ids).delete()
+        return deleted
+
+    def count(self) -> int:
+        return UserTokenModel.objects.count()
+
+    def _to_model(self, entity: UserToken) -> UserTokenModel:
+        model, relations = UserTokenModelMapper.to_model(entity)
+        # Set the foreign key column directly; loading the user is not needed.
+        model.user_id = relations.user_id
+        return model
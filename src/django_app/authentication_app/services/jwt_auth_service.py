@@ -1,10 +1,18 @@
-
 import jwt
 import datetime
+import uuid
 from django.conf import settings
 from typing import Any, Dict, Optional
 
 from src.core.shared.application.token_generator import ITokenGenerator
+from src.django_app.authentication_app.digests import token_digest
+from src.django_app.authentication_app.services.token_revocation_service import (
+    token_revocation_service,
+)
+from src.django_app.authentication_app.token_cache import (
+    cache_verified_token,
+    verified_token_cache,
+)
 
 
 class JwtAuthService(ITokenGenerator):
@@ -16,13 +24,44 @@ class JwtAuthService(ITokenGenerator):
     def generate(self, payload: Dict[str, Any]) -> str:
         expiration = datetime.datetime.now(datetime.timezone.utc) + self.expiration_delta
         payload["exp"] = expiration
+        payload.setdefault("jti", uuid.uuid4().hex)
 
         return jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
 
+    def verify(self, token: str) -> Dict[str, Any]:
+        """Decode a token, raising the PyJWT errors when it is not valid.
+
+        Verified payloads are cached until the token expires, so repeated
+        requests with the same token skip the signature check and parsing.
+        """
+        digest = token_digest(token)
+        payload = verified_token_cache.get(digest)
+
+        if payload is None:
+            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+            cache_verified_token(digest, payload)
+
+        return dict(payload)
+
+    def revoke(self, token: str) -> None:
+        payload = self.verify(token)
+
+        if "jti" not in payload:
+            raise jwt.InvalidTokenError("Token has no jti claim")
+
+        expires_at = datetime.datetime.fromtimestamp(
+            payload["exp"], datetime.timezone.utc
+        )
+        token_revocation_service.revoke(payload["jti"], expires_at)
+
+    def is_revoked(self, payload: Dict[str, Any]) -> bool:
+        jti = payload.get("jti")
+        return jti is not None and token_revocation_service.is_revoked(jti)
+
     def decode_token(self, token: str) -> Optional[Dict[str, Any]]:
         try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
-            return payload
+            payload = self.verify(token)
+            return None if self.is_revoked(payload) else payload
         except jwt.ExpiredSignatureError:
             return None  
         except jwt.InvalidTokenError:
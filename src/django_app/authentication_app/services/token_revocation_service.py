@@ -0,0 +1,113 @@
+import datetime
+import threading
+import time
+
+from django.conf import settings
+from django.utils import timezone
+
+from src.core.shared.infra.cache.bloom_filter import BloomFilter
+from src.django_app.authentication_app.models import RevokedTokenModel
+
+
+class TokenRevocationService:
+    """Denylist of token ids (`jti`) fronted by an in-process Bloom filter.
+
+    A token missing from the filter is certainly not revoked, so most requests
+    never touch the database; only filter hits are confirmed against the
+    `revoked_tokens` table. Revocations made by other processes are pulled in
+    every `refresh_interval` seconds, and the filter is rebuilt from the
+    unexpired rows once it holds more ids than it was sized for.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 10000,
+        error_rate: float = 0.001,
+        refresh_interval: float = 5.0,
+    ):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.refresh_interval = refresh_interval
+        self.lookups = 0
+        self.storage_checks = 0
+        self._bloom: BloomFilter | None = None
+        self._synced_at: datetime.datetime | None = None
+        self._refreshed_at = 0.0
+        self._lock = threading.Lock()
+
+    def revoke(self, jti: str, expires_at: datetime.datetime) -> None:
+        RevokedTokenModel.objects.bulk_create(
+            [RevokedTokenModel(jti=jti, expires_at=expires_at)],
+            ignore_conflicts=True,
+        )
+        with self._lock:
+            if self._bloom is not None and jti not in self._bloom:
+                self._bloom.add(jti)
+
+    def is_revoked(self, jti: str) -> bool:
+        with self._lock:
+            self.lookups += 1
+        self._refresh()
+
+        if jti not in self._bloom:
+            return False
+
+        with self._lock:
+            self.storage_checks += 1
+        return RevokedTokenModel.objects.filter(
+            jti=jti, expires_at__gt=timezone.now()
+        ).exists()
+
+    def rebuild(self) -> None:
+        now = timezone.now()
+        jtis = RevokedTokenModel.objects.filter(expires_at__gt=now).values_list(
+            "jti", flat=True
+        )
+
+        bloom = BloomFilter(self.capacity, self.error_rate)
+        bloom.update(jtis.iterator(chunk_size=1000))
+
+        with self._lock:
+            self._bloom = bloom
+            self._synced_at = now
+            self._refreshed_at = time.monotonic()
+
+    def _refresh(self) -> None:
+        if self._bloom is None or self._bloom.is_saturated:
+            self.rebuild()
+            return
+
+        if time.monotonic() - self._refreshed_at < self.refresh_interval:
+            return
+
+        with self._lock:
+            since, self._synced_at = self._synced_at, timezone.now()
+            self._refreshed_at = time.monotonic()
+
+        # Rows are read from slightly before the previous sync so a revocation
+        # committed while that sync ran is not missed. Ids the filter already
+        # holds are skipped, so the overlap does not count towards saturation.
+        jtis = RevokedTokenModel.objects.filter(
+            created_at__gte=since - datetime.timedelta(seconds=self.refresh_interval)
+        ).values_list("jti", flat=True)
+
+        with self._lock:
+            self._bloom.update(jti for jti in jtis if jti not in self._bloom)
+
+    def delete_expired(self, now: datetime.datetime, batch_size: int = 1000) -> int:
+        jtis = list(
+            RevokedTokenModel.objects.filter(expires_at__lte=now)
+            .order_by()
+            .values_list("jti", flat=True)[:batch_size]
+        )
+        if not jtis:
+            return 0
+
+        deleted, _ = RevokedTokenModel.objects.filter(jti__in=jtis).delete()
+        return deleted
+
+
+token_revocation_service = TokenRevocationService(
+    capacity=getattr(settings, "TOKEN_REVOCATION_CAPACITY", 10000),
+    refresh_interval=getattr(settings, "TOKEN_REVOCATION_REFRESH_INTERVAL", 5.0),
+)
@@ -0,0 +1,152 @@
+import pytest
+from django.db import connection
+from django.test import Client, RequestFactory
+from django.test.utils import CaptureQueriesContext
+from rest_framework import permissions
+from rest_framework.exceptions import AuthenticationFailed
+
+from src.django_app import permissions as app_permissions
+from src.django_app.account_app.models import UserModel
+from src.django_app.account_app.repository import UserDjangoRepository
+from src.django_app.authentication_app.middleware.authentication_middleware import (
+    JWTAuthentication,
+)
+from src.django_app.authentication_app.principal import TokenPrincipal
+from src.django_app.authentication_app.services.jwt_auth_service import JwtAuthService
+from src.django_app.category_app.models import CategoryModel
+
+
+def claims(model: UserModel, **overrides):
+    return {
+        "user_id": str(model.id),
+        "email": model.email,
+        "is_staff": model.is_staff,
+        "is_superuser": model.is_superuser,
+        "token_version": model.token_version,
+        **overrides,
+    }
+
+
+class TestTokenPrincipal:
+    def test_should_build_the_principal_from_claims(self):
+        principal = TokenPrincipal.from_claims(
+            {
+                "user_id": "42",
+                "email": "john@example.com",
+                "is_staff": True,
+                "is_superuser": False,
+                "token_version": 3,
+            }
+        )
+
+        assert principal.pk == principal.id == "42"
+        assert principal.email == "john@example.com"
+        assert principal.is_staff is True
+        assert principal.is_superuser is False
+        assert principal.token_version == 3
+        assert principal.is_authenticated is True
+        assert str(principal) == "john@example.com"
+
+    def test_should_default_missing_claims(self):
+        principal = TokenPrincipal.from_claims({"user_id": 42})
+
+        assert principal.id == "42"
+        assert principal.email is None
+        assert principal.is_staff is False
+        assert principal.is_superuser is False
+        assert principal.token_version == 0
+
+    @pytest.mark.parametrize(
+        "permission, principal, allowed",
+        [
+            (permissions.IsAuthenticated(), TokenPrincipal("1"), True),
+            (permissions.IsAdminUser(), TokenPrincipal("1", is_staff=True), True),
+            (permissions.IsAdminUser(), TokenPrincipal("1"), False),
+            (app_permissions.IsAuthenticated(), TokenPrincipal("1"), True),
+            (
+                app_permissions.IsAdmin(),
+                TokenPrincipal("1", is_staff=True, is_superuser=True),
+                True,
+            ),
+        ],
+    )
+    def test_should_satisfy_the_permission_classes(
+        self, permission, principal, allowed
+    ):
+        request = RequestFactory().get("/")
+        request.user = principal
+
+        assert permission.has_permission(request, None) is allowed
+
+    @pytest.mark.django_db
+    def test_should_load_the_user_model_only_for_other_attributes(
+        self, django_assert_num_queries
+    ):
+        model = UserModel.objects.create_user("john@example.com", "John", "x")
+        principal = TokenPrincipal.from_claims(claims(model))
+
+        with django_assert_num_queries(0):
+            assert principal.is_staff is False
+
+        with django_assert_num_queries(1):
+            assert principal.name == "John"
+
+
+@pytest.mark.django_db
+class TestJWTAuthenticationWithClaims:
+    @pytest.fixture(autouse=True)
+    def user(self, settings):
+        settings.AUTH_STATELESS_PRINCIPAL = True
+        self.model = UserModel.objects.create_user("john@example.com", "John", "x")
+        self.repository = UserDjangoRepository()
+
+    def authenticate(self, token: str):
+        request = RequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+        return JWTAuthentication().authenticate(request)
+
+    def test_should_authenticate_with_a_principal(self):
+        token = JwtAuthService().generate(claims(self.model))
+
+        user, auth = self.authenticate(token)
+
+        assert isinstance(user, TokenPrincipal)
+        assert user.id == str(self.model.id)
+        assert auth == token
+
+    def test_should_reject_a_stale_token_version(self):
+        token = JwtAuthService().generate(claims(self.model, token_version=1))
+
+        with pytest.raises(AuthenticationFailed, match="Token has been revoked"):
+            self.authenticate(token)
+
+    def test_should_reject_a_deleted_user(self):
+        token = JwtAuthService().generate(claims(self.model))
+        self.model.delete()
+
+        with pytest.raises(AuthenticationFailed, match="User not found"):
+            self.authenticate(token)
+
+    def test_should_reject_existing_tokens_of_a_deactivated_user(self):
+        token = JwtAuthService().generate(claims(self.model))
+        self.authenticate(token)
+
+        user = self.repository.find_by_id(self.model.id)
+        user.deactivate()
+        self.repository.update(user)
+
+        with pytest.raises(AuthenticationFailed, match="Token has been revoked"):
+            self.authenticate(token)
+
+    def test_should_serve_a_detail_without_auth_queries(self):
+        category = CategoryModel.objects.create(name="Movie")
+        url = f"/api/categories/{category.id}"
+        token = JwtAuthService().generate(claims(self.model))
+        client = Client(HTTP_AUTHORIZATION=f"Bearer {token}")
+        client.get(url)
+
+        with CaptureQueriesContext(connection) as anonymous:
+            assert Client().get(url).status_code == 200
+        with CaptureQueriesContext(connection) as authenticated:
+            assert client.get(url).status_code == 200
+
+        assert len(authenticated) == len(anonymous)
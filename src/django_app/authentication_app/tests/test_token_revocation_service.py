@@ -0,0 +1,93 @@
+import datetime
+
+import pytest
+from django.test import Client
+from django.utils import timezone
+
+from src.django_app.account_app.models import UserModel
+from src.django_app.authentication_app.models import RevokedTokenModel
+from src.django_app.authentication_app.services.jwt_auth_service import JwtAuthService
+from src.django_app.authentication_app.services.token_revocation_service import (
+    TokenRevocationService,
+)
+from src.django_app.authentication_app.token_sweeper import UserTokenSweeper
+
+
+def in_hours(hours: float) -> datetime.datetime:
+    return timezone.now() + datetime.timedelta(hours=hours)
+
+
+@pytest.mark.django_db
+class TestTokenRevocationService:
+    @pytest.fixture(autouse=True)
+    def service(self):
+        self.service = TokenRevocationService(capacity=100, refresh_interval=60)
+
+    def test_should_only_check_storage_for_filter_hits(self):
+        self.service.revoke("revoked", in_hours(1))
+
+        assert self.service.is_revoked("revoked") is True
+        assert self.service.is_revoked("live") is False
+        assert self.service.lookups == 2
+        assert self.service.storage_checks == 1
+
+    def test_should_not_report_expired_revocations(self):
+        self.service.revoke("expired", in_hours(-1))
+
+        assert self.service.is_revoked("expired") is False
+
+    def test_should_pick_up_revocations_from_other_processes_on_refresh(self):
+        assert self.service.is_revoked("elsewhere") is False
+
+        RevokedTokenModel.objects.create(jti="elsewhere", expires_at=in_hours(1))
+        assert self.service.is_revoked("elsewhere") is False
+
+        self.service.refresh_interval = 0
+        assert self.service.is_revoked("elsewhere") is True
+
+    def test_should_not_count_ids_twice_on_overlapping_refreshes(self):
+        self.service.revoke("a", in_hours(1))
+        self.service.is_revoked("a")
+        RevokedTokenModel.objects.create(jti="b", expires_at=in_hours(1))
+        self.service.refresh_interval = 0
+
+        for _ in range(3):
+            self.service.is_revoked("b")
+
+        assert len(self.service._bloom) == 2
+
+    def test_should_rebuild_a_saturated_filter(self):
+        service = TokenRevocationService(capacity=2, refresh_interval=60)
+        for jti in ("a", "b", "c"):
+            service.revoke(jti, in_hours(1))
+        service.is_revoked("a")
+        service._bloom.update(["x", "y", "z"])
+
+        assert service.is_revoked("c") is True
+        assert len(service._bloom) == 3
+
+    def test_should_sweep_expired_revocations(self):
+        self.service.revoke("expired", in_hours(-1))
+        self.service.revoke("live", in_hours(1))
+
+        metrics = UserTokenSweeper(revocations=self.service).sweep()
+
+        assert metrics.revoked_deleted == 1
+        assert list(RevokedTokenModel.objects.values_list("jti", flat=True)) == [
+            "live"
+        ]
+
+
+@pytest.mark.django_db
+class TestLogoutAPIView:
+    def test_should_revoke_the_access_token(self):
+        user = UserModel.objects.create_user("john@example.com", "John", "x")
+        token = JwtAuthService().generate({"user_id": str(user.id), "token_version": 0})
+        client = Client(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+        assert client.post("/api/logout").status_code == 204
+        assert RevokedTokenModel.objects.count() == 1
+
+        response = client.post("/api/logout")
+        assert response.status_code == 403
+        assert response.json()["detail"] == "Token has been revoked"
@@ -0,0 +1,42 @@
+import datetime
+import uuid
+
+import pytest
+
+from src.core.shared.infra.db.write_behind_buffer import WriteBehindBuffer
+from src.django_app.account_app.models import UserModel
+from src.django_app.authentication_app.models import UserTokenModel
+from src.django_app.authentication_app.token_sink import _bulk_create, _is_transient
+
+
+def token_model(user_id: uuid.UUID, refresh_token: str) -> UserTokenModel:
+    return UserTokenModel(
+        refresh_token=refresh_token,
+        token_digest=refresh_token,
+        expires_date=datetime.date(2030, 1, 1),
+        user_id=user_id,
+        created_at=datetime.datetime.now(datetime.timezone.utc),
+    )
+
+
+# Foreign keys are only checked when the write commits, so these tests run
+# outside of the per-test transaction.
+@pytest.mark.django_db(transaction=True)
+class TestUserTokenSink:
+    def test_should_persist_tokens_next_to_one_for_a_deleted_user(self):
+        user = UserModel.objects.create_user("john@example.com", "John", "secret")
+        buffer = WriteBehindBuffer(
+            _bulk_create, flush_interval=60, is_transient=_is_transient
+        )
+        buffer._pending = [
+            token_model(user.id, "first"),
+            token_model(uuid.uuid4(), "orphan"),
+            token_model(user.id, "second"),
+        ]
+
+        buffer.flush()
+
+        assert sorted(
+            UserTokenModel.objects.values_list("refresh_token", flat=True)
+        ) == ["first", "second"]
+        assert len(buffer) == 0
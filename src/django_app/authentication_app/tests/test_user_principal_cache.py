@@ -0,0 +1,105 @@
+import pytest
+from django.test import Client, RequestFactory
+from rest_framework.exceptions import AuthenticationFailed
+
+from src.django_app.account_app.models import UserModel
+from src.django_app.account_app.repository import UserDjangoRepository
+from src.django_app.authentication_app.middleware.authentication_middleware import (
+    JWTAuthentication,
+)
+from src.django_app.authentication_app.services.jwt_auth_service import JwtAuthService
+from src.django_app.authentication_app.user_cache import user_principal_cache
+
+
+@pytest.mark.django_db
+class TestJWTAuthenticationUserCache:
+    @pytest.fixture(autouse=True)
+    def user(self, settings):
+        settings.AUTH_STATELESS_PRINCIPAL = False
+        self.model = UserModel.objects.create_user("john@example.com", "John", "x")
+        self.repository = UserDjangoRepository()
+        self.token = JwtAuthService().generate(
+            {"user_id": str(self.model.id), "token_version": 0}
+        )
+
+    def authenticate(self):
+        request = RequestFactory().get(
+            "/", HTTP_AUTHORIZATION=f"Bearer {self.token}"
+        )
+        return JWTAuthentication().authenticate(request)
+
+    def test_should_serve_a_warm_user_without_queries(
+        self, django_assert_num_queries
+    ):
+        self.authenticate()
+
+        with django_assert_num_queries(0):
+            user, _ = self.authenticate()
+
+        assert user.email == "john@example.com"
+        assert user_principal_cache.stats()["hits"] == 1
+        assert user_principal_cache.stats()["misses"] == 1
+
+    def test_should_reload_the_user_after_an_update(
+        self, django_assert_num_queries
+    ):
+        self.authenticate()
+        user = self.repository.find_by_id(self.model.id)
+        user.change_name("Johnny")
+
+        self.repository.update(user)
+
+        with django_assert_num_queries(1):
+            user, _ = self.authenticate()
+        assert user.name == "Johnny"
+
+    def test_should_reject_the_token_after_a_delete(self):
+        self.authenticate()
+
+        self.repository.delete(self.model.id)
+
+        with pytest.raises(AuthenticationFailed, match="User not found"):
+            self.authenticate()
+
+    def test_should_hand_out_copies_of_the_cached_user(self):
+        first, _ = self.authenticate()
+        first.name = "Changed"
+
+        second, _ = self.authenticate()
+
+        assert second.name == "John"
+        assert second is not first
+
+
+@pytest.mark.django_db
+class TestAuthCacheStatsAPIView:
+    def token(self, model: UserModel) -> str:
+        return JwtAuthService().generate(
+            {
+                "user_id": str(model.id),
+                "is_staff": model.is_staff,
+                "token_version": 0,
+            }
+        )
+
+    def test_should_report_the_auth_cache_counters(self):
+        admin = UserModel.objects.create_superuser("admin@example.com", "Admin", "x")
+        client = Client(HTTP_AUTHORIZATION=f"Bearer {self.token(admin)}")
+        client.get("/api/auth/cache-stats")
+
+        response = client.get("/api/auth/cache-stats")
+
+        assert response.status_code == 200
+        assert set(response.json()) == {
+            "user_principals",
+            "user_token_versions",
+            "verified_tokens",
+        }
+        assert response.json()["user_token_versions"]["hits"] == 1
+        assert response.json()["verified_tokens"]["hits"] == 1
+
+    def test_should_hide_the_counters_from_non_staff_users(self):
+        user = UserModel.objects.create_user("john@example.com", "John", "x")
+        client = Client(HTTP_AUTHORIZATION=f"Bearer {self.token(user)}")
+
+        assert client.get("/api/auth/cache-stats").status_code == 403
@@ -0,0 +1,88 @@
+import datetime
+import hashlib
+import io
+import json
+
+import pytest
+from django.core.management import call_command
+
+from src.core.account.domain.user import UserId
+from src.core.account.domain.user_token import UserToken
+from src.django_app.account_app.models import UserModel
+from src.django_app.authentication_app.models import UserTokenModel
+from src.django_app.authentication_app.repository import UserTokenDjangoRepository
+from src.django_app.authentication_app.token_sweeper import UserTokenSweeper
+
+TODAY = datetime.date(2030, 1, 10)
+
+
+@pytest.mark.django_db
+class TestUserTokenDjangoRepository:
+    @pytest.fixture(autouse=True)
+    def user(self):
+        self.user = UserModel.objects.create_user("john@example.com", "John", "x")
+        self.repository = UserTokenDjangoRepository(write_behind=False)
+
+    def insert_tokens(self, count: int, expires_date: datetime.date, prefix: str):
+        self.repository.bulk_insert(
+            [
+                UserToken(
+                    user_id=UserId(self.user.id),
+                    refresh_token=f"{prefix}-{index}",
+                    expires_date=expires_date,
+                )
+                for index in range(count)
+            ]
+        )
+
+    def test_should_find_tokens_by_digest(self):
+        self.insert_tokens(3, TODAY, "token")
+
+        found = self.repository.find_by_refresh_token("token-1")
+
+        assert found.refresh_token == "token-1"
+        assert UserTokenModel.objects.get(refresh_token="token-1").token_digest == (
+            hashlib.sha256(b"token-1").hexdigest()
+        )
+        assert self.repository.find_by_refresh_token("token-9") is None
+
+    def test_should_not_match_a_digest_with_another_token(self):
+        self.insert_tokens(1, TODAY, "token")
+        UserTokenModel.objects.update(refresh_token="tampered")
+
+        assert self.repository.find_by_refresh_token("token-0") is None
+        assert self.repository.find_by_refresh_token("tampered") is None
+
+    def test_should_delete_expired_tokens_in_batches(self):
+        self.insert_tokens(5, TODAY - datetime.timedelta(days=1), "expired")
+        self.insert_tokens(2, TODAY, "live")
+
+        assert self.repository.delete_expired(TODAY, batch_size=2) == 2
+        assert self.repository.delete_expired(TODAY, batch_size=2) == 2
+        assert self.repository.delete_expired(TODAY, batch_size=2) == 1
+        assert self.repository.delete_expired(TODAY, batch_size=2) == 0
+        assert sorted(
+            UserTokenModel.objects.values_list("refresh_token", flat=True)
+        ) == ["live-0", "live-1"]
+
+    def test_should_stop_sweeping_on_a_batch_boundary(self):
+        self.insert_tokens(4, TODAY - datetime.timedelta(days=1), "expired")
+        self.insert_tokens(1, TODAY, "live")
+
+        metrics = UserTokenSweeper(self.repository, batch_size=2).sweep(TODAY)
+
+        assert metrics.deleted == 4
+        assert metrics.batches == 2
+        assert metrics.table_size == 1
+
+    def test_should_sweep_from_the_command_line(self):
+        self.insert_tokens(3, datetime.date(2000, 1, 1), "expired")
+        self.insert_tokens(1, datetime.date(2999, 1, 1), "live")
+        stdout = io.StringIO()
+
+        call_command("sweep_user_tokens", "--batch-size", "2", stdout=stdout)
+
+        metrics = json.loads(stdout.getvalue())
+        assert metrics["deleted"] == 3
+        assert metrics["batches"] == 2
+        assert metrics["table_size"] == 1
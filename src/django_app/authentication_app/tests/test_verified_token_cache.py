@@ -0,0 +1,103 @@
+import time
+
+import jwt
+import pytest
+from django.conf import settings
+from django.test import RequestFactory
+
+from src.django_app.account_app.models import UserModel
+from src.django_app.authentication_app import token_cache
+from src.django_app.authentication_app.digests import token_digest
+from src.django_app.authentication_app.middleware.authentication_middleware import (
+    JWTAuthentication,
+)
+from src.django_app.authentication_app.services import jwt_auth_service
+from src.django_app.authentication_app.services.jwt_auth_service import JwtAuthService
+from src.django_app.authentication_app.token_cache import (
+    cache_verified_token,
+    verified_token_cache,
+)
+
+
+class TestVerifiedTokenCache:
+    @pytest.fixture(autouse=True)
+    def clock(self, monkeypatch):
+        # Wall clock for token expiry and monotonic clock for the cache,
+        # moved together.
+        self.now = time.time()
+        self.elapsed = 0.0
+        monkeypatch.setattr(token_cache.time, "time", lambda: self.now + self.elapsed)
+        monkeypatch.setattr(verified_token_cache, "clock", lambda: self.elapsed)
+
+        self.decoded = []
+        decode = jwt.decode
+
+        def counting_decode(*args, **kwargs):
+            self.decoded.append(args[0])
+            return decode(*args, **kwargs)
+
+        monkeypatch.setattr(jwt_auth_service.jwt, "decode", counting_decode)
+        self.service = JwtAuthService()
+
+    def token(self, expires_in: float) -> str:
+        return jwt.encode(
+            {"user_id": "1", "exp": int(self.now + expires_in)},
+            settings.SECRET_KEY,
+            algorithm="HS256",
+        )
+
+    def test_should_decode_a_token_once(self):
+        token = self.token(3600)
+
+        first = self.service.verify(token)
+        second = self.service.verify(token)
+
+        assert first == second
+        assert self.decoded == [token]
+
+    def test_should_hand_out_copies_of_the_cached_payload(self):
+        token = self.token(3600)
+
+        self.service.verify(token)["user_id"] = "2"
+
+        assert self.service.verify(token)["user_id"] == "1"
+
+    def test_should_expire_entries_with_the_token(self):
+        token = self.token(10)
+        self.service.verify(token)
+
+        self.elapsed = 9
+        self.service.verify(token)
+        assert len(self.decoded) == 1
+
+        self.elapsed = 11
+        assert verified_token_cache.get(token_digest(token)) is None
+        self.service.verify(token)
+        assert len(self.decoded) == 2
+
+    def test_should_cap_the_ttl_at_the_token_expiry(self):
+        cache_verified_token("digest", {"exp": self.now + 30})
+
+        self.elapsed = 29
+        assert verified_token_cache.get("digest") is not None
+
+        self.elapsed = 30
+        assert verified_token_cache.get("digest") is None
+
+    def test_should_not_cache_expired_payloads(self):
+        cache_verified_token("digest", {"exp": self.now - 1})
+
+        assert len(verified_token_cache) == 0
+
+    @pytest.mark.django_db
+    def test_should_share_entries_between_decode_token_and_authentication(self):
+        model = UserModel.objects.create_user("john@example.com", "John", "x")
+        token = self.service.generate({"user_id": str(model.id), "token_version": 0})
+
+        assert self.service.decode_token(token)["user_id"] == str(model.id)
+
+        request = RequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+        user, _ = JWTAuthentication().authenticate(request)
+
+        assert str(user.id) == str(model.id)
+        assert self.decoded == [token]
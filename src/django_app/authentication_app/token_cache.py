@@ -0,0 +1,26 @@
+import time
+from typing import Any, Dict
+
+from django.conf import settings
+
+from src.core.shared.infra.cache.lru_cache import LRUCache
+
+# Verified JWT payloads by token digest. Entries expire with the token, and
+# eviction is bounded by the approximate memory the cached tokens hold.
+verified_token_cache: LRUCache[str, Dict[str, Any]] = LRUCache(
+    max_size=getattr(settings, "AUTH_TOKEN_CACHE_SIZE", 10000),
+    ttl=getattr(settings, "AUTH_TOKEN_CACHE_TTL", 3600),
+    max_weight=getattr(settings, "AUTH_TOKEN_CACHE_MAX_BYTES", 4 * 1024 * 1024),
+    weigh=lambda digest, payload: len(digest) + len(repr(payload)),
+)
+
+
+def cache_verified_token(digest: str, payload: Dict[str, Any]) -> None:
+    ttl = verified_token_cache.ttl
+
+    if "exp" in payload:
+        ttl = min(ttl, float(payload["exp"]) - time.time())
+        if ttl <= 0:
+            return
+
+    verified_token_cache.set(digest, payload, ttl=ttl)
@@ -0,0 +1,27 @@
+from typing import List
+
+from django.conf import settings
+from django.db import DataError, IntegrityError, close_old_connections
+
+from src.core.shared.infra.db.write_behind_buffer import WriteBehindBuffer
+from src.django_app.authentication_app.models import UserTokenModel
+
+
+def _bulk_create(models: List[UserTokenModel]) -> None:
+    UserTokenModel.objects.bulk_create(models)
+
+
+def _is_transient(error: Exception) -> bool:
+    # Constraint and data errors, such as a token whose user was deleted in
+    # the meantime, fail the same way on every retry.
+    return not isinstance(error, (IntegrityError, DataError))
+
+
+# Refresh tokens are written behind the login request, in batches.
+user_token_sink: WriteBehindBuffer[UserTokenModel] = WriteBehindBuffer(
+    _bulk_create,
+    batch_size=getattr(settings, "USER_TOKEN_BATCH_SIZE", 100),
+    flush_interval=getattr(settings, "USER_TOKEN_FLUSH_INTERVAL", 1.0),
+    on_thread_exit=close_old_connections,
+    is_transient=_is_transient,
+)
@@ -0,0 +1,85 @@
+import logging
+import time
+from dataclasses import asdict, dataclass
+from datetime import date
+from typing import Any, Callable, Dict
+
+from django.utils import timezone
+
+from src.django_app.authentication_app.repository import UserTokenDjangoRepository
+from src.django_app.authentication_app.services.token_revocation_service import (
+    TokenRevocationService,
+    token_revocation_service,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class SweepMetrics:
+    deleted: int = 0
+    revoked_deleted: int = 0
+    batches: int = 0
+    seconds: float = 0.0
+    table_size: int = 0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.deleted / self.seconds if self.seconds else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "rows_per_second": self.rows_per_second}
+
+
+class UserTokenSweeper:
+    """Deletes expired refresh tokens and revocations a batch at a time.
+
+    Every batch is its own short DELETE by primary key, so the table is never
+    locked for the whole sweep; `pause` leaves room for other writers.
+    """
+
+    def __init__(
+        self,
+        repository: UserTokenDjangoRepository | None = None,
+        batch_size: int = 1000,
+        pause: float = 0.0,
+        revocations: TokenRevocationService | None = None,
+    ):
+        self.repository = repository or UserTokenDjangoRepository()
+        self.revocations = revocations or token_revocation_service
+        self.batch_size = batch_size
+        self.pause = pause
+        self.total_deleted = 0
+
+    def sweep(self, today: date | None = None) -> SweepMetrics:
+        now = timezone.now()
+        today = today or now.date()
+        metrics = SweepMetrics()
+        start = time.perf_counter()
+
+        metrics.deleted = self._sweep(
+            lambda: self.repository.delete_expired(today, self.batch_size), metrics
+        )
+        metrics.revoked_deleted = self._sweep(
+            lambda: self.revocations.delete_expired(now, self.batch_size), metrics
+        )
+
+        metrics.seconds = time.perf_counter() - start
+        metrics.table_size = self.repository.count()
+        self.total_deleted += metrics.deleted
+
+        logger.info("Swept expired user tokens: %s", metrics.to_dict())
+        return metrics
+
+    def _sweep(self, delete_batch: Callable[[], int], metrics: SweepMetrics) -> int:
+        total = 0
+
+        while deleted := delete_batch():
+            total += deleted
+            metrics.batches += 1
+            if deleted < self.batch_size:
+                break
+            if self.pause:
+                time.sleep(self.pause)
+
+        return total
@@ -0,0 +1,29 @@
+from typing import Any
+
+from django.conf import settings
+
+from src.core.shared.infra.cache.lru_cache import LRUCache
+
+# Authenticated users by id, so hot traffic does not query the users table on
+# every request. Entries are dropped when the account app sends
+# `user_changed` (see AuthenticationAppConfig.ready).
+user_principal_cache: LRUCache[str, Any] = LRUCache(
+    max_size=getattr(settings, "AUTH_USER_CACHE_SIZE", 1024),
+    ttl=getattr(settings, "AUTH_USER_CACHE_TTL", 60),
+)
+
+# Current token version by user id, checked against the `token_version` claim
+# when principals are built from the token alone.
+user_token_version_cache: LRUCache[str, int] = LRUCache(
+    max_size=getattr(settings, "AUTH_USER_CACHE_SIZE", 1024),
+    ttl=getattr(settings, "AUTH_USER_CACHE_TTL", 60),
+)
+
+
+def invalidate_user(user_id: Any) -> None:
+    user_principal_cache.invalidate(str(user_id))
+    user_token_version_cache.invalidate(str(user_id))
+
+
+def on_user_changed(sender: Any, user_id: Any, **kwargs: Any) -> None:
+    invalidate_user(user_id)
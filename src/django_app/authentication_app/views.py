@@ -9,13 +9,18 @@ from src.core.account.application.use_cases.authenticate_user import (
     AuthenticateUserInput,
     AuthenticateUserUseCase,
 )
-from src.core.shared.infra.cryptography.bcrypt_hasher import BcryptHasher
 from src.django_app.account_app.repository import UserDjangoRepository
 from src.django_app.authentication_app.repository import UserTokenDjangoRepository
 from src.django_app.authentication_app.serializers import (
     AuthenticateUserInputSerializer,
 )
 from src.django_app.authentication_app.services.jwt_auth_service import JwtAuthService
+from src.django_app.authentication_app.token_cache import verified_token_cache
+from src.django_app.authentication_app.user_cache import (
+    user_principal_cache,
+    user_token_version_cache,
+)
+from src.django_app.shared_app.cryptography import password_hasher
 
 
 class AuthenticationAPIView(APIView):
@@ -24,7 +29,7 @@ class AuthenticationAPIView(APIView):
     def __init__(self, **kwargs) -> None:
         user_repo = UserDjangoRepository()
         user_token_repo = UserTokenDjangoRepository()
-        cryptography = BcryptHasher()
+        cryptography = password_hasher
         jwt_token_generator = JwtAuthService()
 
         self.authenticate_user = AuthenticateUserUseCase(
@@ -57,3 +62,33 @@ class AuthenticationAPIView(APIView):
                 },
             },
         )
+
+
+class LogoutAPIView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.token_service = JwtAuthService()
+
+    def post(self, request: Request) -> Response:
+        # The access token stays valid until it expires unless its id is
+        # denylisted.
+        self.token_service.revoke(request.auth)
+
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class AuthCacheStatsAPIView(APIView):
+    # Counters are kept per process, so each worker reports its own.
+    permission_classes = [permissions.IsAuthenticated, permissions.IsAdminUser]
+
+    def get(self, request: Request) -> Response:
+        return Response(
+            status=status.HTTP_200_OK,
+            data={
+                "user_principals": user_principal_cache.stats(),
+                "user_token_versions": user_token_version_cache.stats(),
+                "verified_tokens": verified_token_cache.stats(),
+            },
+        )
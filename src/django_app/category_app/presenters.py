@@ -3,7 +3,10 @@ import datetime
 from uuid import UUID
 
 from src.core.category.application.use_cases.common.category_output import CategoryOutput
-from src.core.category.application.use_cases.list_categories import ListCategoriesOutput
+from src.core.category.application.use_cases.list_categories import (
+    ListCategoriesOutput,
+    ListCategoriesReadModelOutput,
+)
 from src.django_app.shared_app.presenters import CollectionPresenter, ResourcePresenter
 
 
@@ -30,18 +33,14 @@ class CategoryPresenter(ResourcePresenter):
 
 @dataclass(slots=True)
 class CategoryCollectionPresenter(CollectionPresenter):
-    output: ListCategoriesOutput
+    output: ListCategoriesOutput | ListCategoriesReadModelOutput
 
     def __post_init__(self):
-        self.data = [
-            CategoryPresenter(
-                id=item.id,
-                name=item.name,
-                description=item.description,
-                is_active=item.is_active,
-                created_at=item.created_at,
-                updated_at=item.updated_at,
-            )
-            for item in self.output.items
-        ]
+        if isinstance(self.output, ListCategoriesReadModelOutput):
+            # Read models have exactly the presented fields; dump them as they are.
+            self.data = self.output.items
+        else:
+            self.data = [
+                CategoryPresenter.from_output(item) for item in self.output.items
+            ]
         self.pagination = self.output
@@ -1,8 +1,10 @@
+from dataclasses import fields
 from typing import List, Set
-from django.core.paginator import Paginator
 
 from src.core.category.domain.category import Category, CategoryId
 from src.core.category.domain.category_repository import (
+    CategoryReadModel,
+    CategoryReadModelSearchResult,
     CategorySearchParams,
     CategorySearchResult,
     ICategoryRepository,
@@ -11,18 +13,23 @@ from src.core.shared.domain.exceptions import NotFoundException
 from src.core.shared.domain.repositories.search_params import SortDirection
 from src.django_app.category_app.mappers import CategoryModelMapper
 from src.django_app.category_app.models import CategoryModel
+from src.django_app.category_app.result_cache import category_result_cache
+from src.django_app.shared_app.query_paginator import QueryPaginator
 
 
 class CategoryDjangoRepository(ICategoryRepository):
     sortable_fields: List[str] = ["name", "created_at"]
+    read_model_fields = [field.name for field in fields(CategoryReadModel)]
 
     def insert(self, entity: Category) -> None:
         model = CategoryModelMapper.to_model(entity)
         model.save()
+        category_result_cache.bump()
 
     def bulk_insert(self, entities: List[Category]) -> None:
         models = list(map(CategoryModelMapper.to_model, entities))
         CategoryModel.objects.bulk_create(models)
+        category_result_cache.bump()
 
     def find_by_id(self, entity_id: CategoryId) -> Category | None:
         model = CategoryModel.objects.filter(id=entity_id).first()
@@ -43,35 +50,52 @@ class CategoryDjangoRepository(ICategoryRepository):
         return [CategoryModelMapper.to_entity(model) for model in models]
 
     def search(self, props: CategorySearchParams) -> CategorySearchResult:
-        query = CategoryModel.objects.all()
+        page = self._paginator(self._filter(props), props).paginate(props)
 
-        if props.filter:
-            query = query.filter(name__icontains=props.filter)
-
-        if props.sort and props.sort in self.sortable_fields:
-            if props.sort_dir == SortDirection.DESC:
-                props.sort = f"-{props.sort}"
-            query = query.order_by(props.sort)
-        else:
-            query = query.order_by("-created_at")
+        return CategorySearchResult(
+            items=[CategoryModelMapper.to_entity(model) for model in page.models],
+            total=page.total,
+            current_page=props.page,
+            per_page=props.per_page,
+            next_cursor=page.next_cursor,
+            total_is_exact=page.total_is_exact,
+        )
 
-        paginator = Paginator(query, props.per_page)
+    def search_read_models(
+        self, props: CategorySearchParams
+    ) -> CategoryReadModelSearchResult:
+        return category_result_cache.get_or_set(
+            "read_models", props, lambda: self._search_read_models(props)
+        )
 
-        if props.page <= paginator.num_pages:
-            page_obj = paginator.page(props.page)
-        else:
-            page_obj = paginator.page(paginator.num_pages)
-            page_obj.object_list = []
+    def _search_read_models(
+        self, props: CategorySearchParams
+    ) -> CategoryReadModelSearchResult:
+        query = self._filter(props).values(*self.read_model_fields)
+        page = self._paginator(query, props).paginate(props)
 
-        return CategorySearchResult(
-            items=[
-                CategoryModelMapper.to_entity(model) for model in page_obj.object_list
-            ],
-            total=paginator.count,
+        return CategoryReadModelSearchResult(
+            items=[CategoryReadModel(**row) for row in page.models],
+            total=page.total,
             current_page=props.page,
             per_page=props.per_page,
+            next_cursor=page.next_cursor,
+            total_is_exact=page.total_is_exact,
         )
 
+    def _filter(self, props: CategorySearchParams):
+        query = CategoryModel.objects.all()
+
+        if props.filter:
+            query = query.filter(name__icontains=props.filter)
+
+        return query
+
+    def _paginator(self, query, props: CategorySearchParams) -> QueryPaginator:
+        if props.sort and props.sort in self.sortable_fields:
+            return QueryPaginator(query, props.sort, props.sort_dir)
+        return QueryPaginator(query, "created_at", SortDirection.DESC)
+
     def update(self, entity: Category) -> None:
         model = CategoryModel.objects.filter(id=entity.id.value).update(
             name=entity.name,
@@ -84,8 +108,11 @@ class CategoryDjangoRepository(ICategoryRepository):
         if not model:
             raise NotFoundException(entity.id.value, self.get_entity())
 
+        category_result_cache.bump()
+
     def delete(self, entity_id: CategoryId) -> None:
         CategoryModel.objects.filter(id=entity_id.value).delete()
+        category_result_cache.bump()
 
     def get_entity(self) -> Category:
         return Category
@@ -0,0 +1,11 @@
+from django.conf import settings
+
+from src.django_app.shared_app.result_cache import VersionedResultCache
+
+# Category list results in the default Django cache; CategoryDjangoRepository
+# bumps the version on every write. Only a shared backend (Redis, Memcached)
+# makes that bump visible to other workers; see CATEGORY_RESULT_CACHE_TIMEOUT.
+category_result_cache = VersionedResultCache(
+    "categories",
+    timeout=getattr(settings, "CATEGORY_RESULT_CACHE_TIMEOUT", 300),
+)
@@ -0,0 +1,62 @@
+from src.core.category.application.use_cases.common.category_output import (
+    CategoryOutput,
+)
+from src.core.category.application.use_cases.list_categories import (
+    ListCategoriesOutput,
+    ListCategoriesReadModelOutput,
+)
+from src.core.category.domain.category import Category
+from src.core.category.domain.category_repository import CategoryReadModel
+from src.django_app.category_app.presenters import (
+    CategoryCollectionPresenter,
+    CategoryPresenter,
+)
+
+
+def pagination(items):
+    return {
+        "items": items,
+        "total": len(items),
+        "current_page": 1,
+        "per_page": 15,
+        "last_page": 1,
+    }
+
+
+class TestCategoryCollectionPresenter:
+    def setup_method(self):
+        self.categories = [Category(name="Movie"), Category(name="Documentary")]
+
+    def test_should_present_read_models_without_per_row_presenters(self):
+        output = ListCategoriesReadModelOutput(
+            **pagination([CategoryReadModel.from_entity(c) for c in self.categories])
+        )
+
+        presenter = CategoryCollectionPresenter(output)
+
+        assert presenter.data is output.items
+        assert all(type(item) is CategoryReadModel for item in presenter.data)
+
+    def test_should_present_category_outputs_as_category_presenters(self):
+        output = ListCategoriesOutput(
+            **pagination([CategoryOutput.from_entity(c) for c in self.categories])
+        )
+
+        presenter = CategoryCollectionPresenter(output)
+
+        assert all(type(item) is CategoryPresenter for item in presenter.data)
+
+    def test_should_serialize_both_outputs_identically(self):
+        read_models = CategoryCollectionPresenter(
+            ListCategoriesReadModelOutput(
+                **pagination([CategoryReadModel.from_entity(c) for c in self.categories])
+            )
+        )
+        outputs = CategoryCollectionPresenter(
+            ListCategoriesOutput(
+                **pagination([CategoryOutput.from_entity(c) for c in self.categories])
+            )
+        )
+
+        assert read_models.serialize() == outputs.serialize()
+        assert read_models.serialize_json() == outputs.serialize_json()
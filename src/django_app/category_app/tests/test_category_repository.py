@@ -0,0 +1,56 @@
+import pytest
+
+from src.core.category.domain.category import Category
+from src.core.category.domain.category_repository import (
+    CategoryReadModel,
+    CategorySearchParams,
+)
+from src.django_app.category_app.repository import CategoryDjangoRepository
+
+
+@pytest.mark.django_db
+class TestCategoryDjangoRepositoryReadModels:
+    @pytest.fixture(autouse=True)
+    def categories(self):
+        self.repository = CategoryDjangoRepository()
+        self.repository.bulk_insert(
+            [
+                Category(name=f"Category {index}", description=f"Text {index}")
+                for index in range(3)
+            ]
+        )
+
+    def test_should_project_the_same_rows_as_the_entity_search(self):
+        params = CategorySearchParams(init_per_page=2, init_sort="name")
+
+        entities = self.repository.search(params)
+        read_models = self.repository.search_read_models(params)
+
+        assert read_models.items == [
+            CategoryReadModel.from_entity(entity) for entity in entities.items
+        ]
+        assert read_models.total == entities.total == 3
+        assert read_models.total_is_exact is True
+        assert read_models.next_cursor is None
+
+    def test_should_pass_the_cursor_through_in_cursor_mode(self):
+        params = CategorySearchParams(
+            init_per_page=2, init_sort="name", init_cursor=""
+        )
+
+        read_models = self.repository.search_read_models(params)
+        assert [item.name for item in read_models.items] == [
+            "Category 0",
+            "Category 1",
+        ]
+        assert read_models.next_cursor == self.repository.search(params).next_cursor
+
+        next_page = self.repository.search_read_models(
+            CategorySearchParams(
+                init_per_page=2,
+                init_sort="name",
+                init_cursor=read_models.next_cursor,
+            )
+        )
+        assert [item.name for item in next_page.items] == ["Category 2"]
+        assert next_page.next_cursor is None
@@ -0,0 +1,85 @@
+import pytest
+
+from src.core.category.domain.category import Category
+from src.core.category.domain.category_repository import CategorySearchParams
+from src.django_app.category_app.repository import CategoryDjangoRepository
+from src.django_app.category_app.result_cache import category_result_cache
+
+
+@pytest.mark.django_db
+class TestCategoryResultCache:
+    @pytest.fixture(autouse=True)
+    def repository(self):
+        self.repository = CategoryDjangoRepository()
+        self.category = Category(name="Movie")
+        self.repository.insert(self.category)
+        category_result_cache.reset_stats()
+        yield
+        category_result_cache.reset_stats()
+
+    def search(self):
+        return self.repository.search_read_models(CategorySearchParams())
+
+    def names(self):
+        return [item.name for item in self.search().items]
+
+    def test_should_serve_a_cached_page_without_queries(
+        self, django_assert_num_queries
+    ):
+        first = self.search()
+
+        with django_assert_num_queries(0):
+            second = self.search()
+
+        assert second == first
+        assert category_result_cache.stats() == {
+            "namespace": "categories",
+            "hits": 1,
+            "misses": 1,
+            "hit_rate": 0.5,
+        }
+
+    def test_should_key_results_by_search_params(self):
+        self.search()
+        self.repository.search_read_models(CategorySearchParams(init_filter="tv"))
+
+        assert category_result_cache.stats()["misses"] == 2
+
+    def test_should_miss_after_an_insert(self):
+        assert self.names() == ["Movie"]
+        version = category_result_cache.version()
+
+        self.repository.insert(Category(name="Series"))
+
+        assert category_result_cache.version() > version
+        assert sorted(self.names()) == ["Movie", "Series"]
+        assert category_result_cache.stats()["misses"] == 2
+
+    def test_should_miss_after_a_bulk_insert(self):
+        self.names()
+
+        self.repository.bulk_insert([Category(name="Series")])
+
+        assert sorted(self.names()) == ["Movie", "Series"]
+        assert category_result_cache.stats()["hits"] == 0
+
+    def test_should_miss_after_an_update(self):
+        self.names()
+        version = category_result_cache.version()
+
+        self.category.change_name("Movies")
+        self.repository.update(self.category)
+
+        assert category_result_cache.version() > version
+        assert self.names() == ["Movies"]
+        assert category_result_cache.stats()["hits"] == 0
+
+    def test_should_miss_after_a_delete(self):
+        self.names()
+        version = category_result_cache.version()
+
+        self.repository.delete(self.category.id)
+
+        assert category_result_cache.version() > version
+        assert self.names() == []
+        assert category_result_cache.stats()["hits"] == 0
@@ -0,0 +1,88 @@
+import pytest
+from django.test import Client
+
+from src.django_app.account_app.models import UserModel
+from src.django_app.authentication_app.services.jwt_auth_service import JwtAuthService
+from src.django_app.category_app.models import CategoryModel
+
+
+@pytest.mark.django_db
+class TestCategoryAPIViewConditionalGet:
+    @pytest.fixture(autouse=True)
+    def clients(self):
+        admin = UserModel.objects.create_superuser("admin@example.com", "Admin", "x")
+        token = JwtAuthService().generate(
+            {"user_id": str(admin.id), "is_staff": True, "token_version": 0}
+        )
+        self.admin = Client(HTTP_AUTHORIZATION=f"Bearer {token}")
+        self.client = Client()
+        self.category = CategoryModel.objects.create(name="Movie")
+        CategoryModel.objects.create(name="Series")
+
+    def get_list(self, **headers):
+        return self.client.get("/api/categories", **headers)
+
+    def assert_revalidates(self, etag: str) -> str:
+        response = self.get_list(HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+        return response["ETag"]
+
+    def test_should_send_an_etag_without_last_modified_on_lists(self):
+        response = self.get_list()
+
+        assert response.status_code == 200
+        assert response["ETag"].startswith('"')
+        assert "Last-Modified" not in response
+        assert "must-revalidate" in response["Cache-Control"]
+
+    def test_should_answer_a_matching_etag_with_not_modified(self):
+        etag = self.get_list()["ETag"]
+
+        response = self.get_list(HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+        assert response["ETag"] == etag
+        assert response.content == b""
+
+    def test_should_key_the_etag_on_the_query_string(self):
+        etag = self.get_list()["ETag"]
+
+        response = self.client.get(
+            "/api/categories", {"per_page": 1}, HTTP_IF_NONE_MATCH=etag
+        )
+
+        assert response.status_code == 200
+
+    def test_should_revalidate_after_create_update_and_delete(self):
+        etag = self.get_list()["ETag"]
+
+        created = self.admin.post(
+            "/api/categories", {"name": "Documentary"}, content_type="application/json"
+        )
+        assert created.status_code == 201
+        etag = self.assert_revalidates(etag)
+
+        updated = self.admin.patch(
+            f"/api/categories/{self.category.id}",
+            {"name": "Movies"},
+            content_type="application/json",
+        )
+        assert updated.status_code == 200
+        etag = self.assert_revalidates(etag)
+
+        deleted = self.admin.delete(f"/api/categories/{self.category.id}")
+        assert deleted.status_code == 204
+        self.assert_revalidates(etag)
+
+    def test_should_validate_details_by_etag_and_last_modified(self):
+        url = f"/api/categories/{self.category.id}"
+        response = self.client.get(url)
+
+        assert response.status_code == 200
+        assert self.client.get(
+            url, HTTP_IF_NONE_MATCH=response["ETag"]
+        ).status_code == 304
+        assert self.client.get(
+            url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]
+        ).status_code == 304
@@ -39,16 +39,17 @@ from src.django_app.category_app.serializers import (
     GetCategoryInputSerializer,
     UpdateCategoryInputSerializer,
 )
+from src.django_app.shared_app.conditional_get import ConditionalGet
 from src.django_app.shared_app.filter_extractor import FilterExtractor
 
 
-class CategoryAPIView(APIView, FilterExtractor):
+class CategoryAPIView(APIView, FilterExtractor, ConditionalGet):
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         repository = CategoryDjangoRepository()
 
         self.create_use_case = CreateCategoryUseCase(repository)
-        self.list_use_case = ListCategoriesUseCase(repository)
+        self.list_use_case = ListCategoriesUseCase(repository, use_read_model=True)
         self.get_use_case = GetCategoryUseCase(repository)
         self.update_use_case = UpdateCategoryUseCase(repository)
         self.delete_use_case = DeleteCategoryUseCase(repository)
@@ -63,7 +64,7 @@ class CategoryAPIView(APIView, FilterExtractor):
 
         return Response(
             status=status.HTTP_201_CREATED,
-            data=self.serialize(output),
+            data=self.present(output),
         )
 
     def get(self, request: Request, category_id: UUID = None) -> Response:
@@ -76,9 +77,13 @@ class CategoryAPIView(APIView, FilterExtractor):
 
         output = self.list_use_case.execute(_input)
 
-        return Response(
-            status=status.HTTP_200_OK,
-            data=CategoryCollectionPresenter(output).serialize(),
+        return self.conditional_response(
+            request,
+            self.page_etag(request, "categories", output),
+            None,
+            lambda: Response(
+                status=status.HTTP_200_OK, data=CategoryCollectionPresenter(output)
+            ),
         )
 
     def get_object(self, category_id: UUID) -> Response:
@@ -88,10 +93,13 @@ class CategoryAPIView(APIView, FilterExtractor):
         _input = GetCategoryInput(**serializer.validated_data)
 
         output = self.get_use_case.execute(_input)
+        etag = self.make_etag(output.id, output.updated_at.isoformat())
 
-        return Response(
-            status=status.HTTP_200_OK,
-            data=self.serialize(output),
+        return self.conditional_response(
+            self.request,
+            etag,
+            output.updated_at,
+            lambda: Response(status=status.HTTP_200_OK, data=self.present(output)),
         )
 
     def patch(self, request: Request, category_id: UUID) -> Response:
@@ -107,7 +115,7 @@ class CategoryAPIView(APIView, FilterExtractor):
 
         return Response(
             status=status.HTTP_200_OK,
-            data=self.serialize(output),
+            data=self.present(output),
         )
 
     def delete(self, request: Request, category_id: UUID) -> Response:
@@ -132,5 +140,5 @@ class CategoryAPIView(APIView, FilterExtractor):
         return permissions_map.get(self.request.method, super().get_permissions())
 
     @staticmethod
-    def serialize(output: CategoryOutput):
-        return CategoryPresenter.from_output(output).serialize()
+    def present(output: CategoryOutput) -> CategoryPresenter:
+        return CategoryPresenter.from_output(output)
@@ -0,0 +1,27 @@
+import pytest
+from django.core.cache import cache
+
+from src.django_app.authentication_app.token_cache import verified_token_cache
+from src.django_app.authentication_app.user_cache import (
+    user_principal_cache,
+    user_token_version_cache,
+)
+
+IN_PROCESS_CACHES = (
+    user_principal_cache,
+    user_token_version_cache,
+    verified_token_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    # The locmem cache and the in-process auth caches outlive the per-test
+    # database rollback.
+    cache.clear()
+    for in_process_cache in IN_PROCESS_CACHES:
+        in_process_cache.clear()
+    yield
+    cache.clear()
+    for in_process_cache in IN_PROCESS_CACHES:
+        in_process_cache.clear()
@@ -42,7 +42,7 @@ INSTALLED_APPS = [
     "src.django_app.account_app",
     "src.django_app.authentication_app",
     "src.django_app.category_app",
-
+    "src.django_app.shared_app",
 ]
 
 MIDDLEWARE = [
@@ -116,6 +116,10 @@ REST_FRAMEWORK = {
         "src.django_app.authentication_app.middleware.authentication_middleware.JWTAuthentication"
     ],
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
+    "DEFAULT_RENDERER_CLASSES": [
+        "src.django_app.shared_app.renderers.PresenterJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
 
 }
 
@@ -143,3 +147,51 @@ STATIC_URL = "static/"
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 APPEND_SLASH = False
+
+# Seconds a list total computed with `?count=cached` stays in the cache.
+SEARCH_COUNT_CACHE_TIMEOUT = 60
+
+# Seconds a category list result stays in the cache; any category write
+# invalidates all of them. Results live in the default Django cache, which is
+# the per-process locmem backend unless CACHES says otherwise: with several
+# workers, a write only invalidates its own worker's copy and the others serve
+# stale lists until this timeout. Multi-worker deployments need a shared
+# backend (Redis or Memcached) in CACHES.
+CATEGORY_RESULT_CACHE_TIMEOUT = 300
+
+# In-process cache of authenticated users looked up from JWTs.
+AUTH_USER_CACHE_SIZE = 1024
+AUTH_USER_CACHE_TTL = 60
+
+# Build `request.user` from the verified JWT claims instead of loading the
+# user model; only the token version is looked up (and cached) per user.
+AUTH_STATELESS_PRINCIPAL = True
+
+# Verified JWT payloads kept in process, bounded by count and approximate size.
+AUTH_TOKEN_CACHE_SIZE = 10000
+AUTH_TOKEN_CACHE_MAX_BYTES = 4 * 1024 * 1024
+
+# Password hashing runs on a bounded pool; requests beyond the pending limit
+# get a 503 instead of tying up request threads.
+CRYPTOGRAPHY_POOL_WORKERS = 4
+CRYPTOGRAPHY_POOL_MAX_PENDING = 32
+
+# bcrypt cost for new hashes; stored hashes with another cost are rehashed on
+# the next successful login. Pick it with `python -m benchmarks.bcrypt_cost`.
+BCRYPT_ROUNDS = 8
+
+# Refresh tokens issued at login are buffered and bulk inserted in the
+# background, every USER_TOKEN_FLUSH_INTERVAL seconds or USER_TOKEN_BATCH_SIZE
+# tokens, and on shutdown.
+USER_TOKEN_WRITE_BEHIND = True
+USER_TOKEN_BATCH_SIZE = 100
+USER_TOKEN_FLUSH_INTERVAL = 1.0
+
+# Revoked token ids are checked against an in-process Bloom filter sized for
+# this many live revocations; other processes' revocations are picked up
+# every TOKEN_REVOCATION_REFRESH_INTERVAL seconds.
+TOKEN_REVOCATION_CAPACITY = 10000
+TOKEN_REVOCATION_REFRESH_INTERVAL = 5.0
+
+# Compile the entity validators at startup rather than on first use.
+EAGER_ENTITY_VALIDATORS = False
@@ -1,6 +1,16 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class SharedAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'src.django_app.shared_app'
+
+    def ready(self):
+        if getattr(settings, "EAGER_ENTITY_VALIDATORS", False):
+            from src.core.account.domain.user import User
+            from src.core.account.domain.user_token import UserToken
+            from src.core.category.domain.category import Category
+            from src.core.shared.domain.entity import Entity
+
+            Entity.prepare_validators(User, UserToken, Category)
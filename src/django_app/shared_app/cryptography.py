@@ -0,0 +1,12 @@
+from django.conf import settings
+
+from src.core.shared.infra.cryptography.bcrypt_hasher import BcryptHasher
+from src.core.shared.infra.cryptography.pooled_hasher import PooledHasher
+
+# One pool per process: views are instantiated per request, so a pool created
+# there would not bound anything.
+password_hasher = PooledHasher(
+    BcryptHasher(rounds=getattr(settings, "BCRYPT_ROUNDS", 8)),
+    max_workers=getattr(settings, "CRYPTOGRAPHY_POOL_WORKERS", 4),
+    max_pending=getattr(settings, "CRYPTOGRAPHY_POOL_MAX_PENDING", 32),
+)
@@ -6,7 +6,9 @@ from rest_framework import status
 from src.core.category.application.use_cases.common.exceptions import (
     CategoryAlreadyExistsException,
 )
+from src.core.shared.application.cryptography import CryptographyBusyException
 from src.core.shared.domain.exceptions import (
+    DuplicateKeyException,
     EntityValidationException,
     InvalidArgumentException,
     NotFoundException,
@@ -55,11 +57,25 @@ def handle_category_already_exists_error(exc: CategoryAlreadyExistsException, co
     return response
 
 
+def handle_duplicate_key_error(exc: DuplicateKeyException, context):
+    response = Response({"message": exc.args[0]}, status.HTTP_409_CONFLICT)
+    return response
+
+
 def handle_invalid_credentials_error(exc: InvalidCredentialsException, context):
     response = Response({"message": exc.args[0]}, status.HTTP_401_UNAUTHORIZED)
     return response
 
 
+def handle_cryptography_busy_error(exc: CryptographyBusyException, context):
+    response = Response(
+        {"message": exc.args[0]},
+        status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers={"Retry-After": "1"},
+    )
+    return response
+
+
 handlers = [
     {"exception": ValidationError, "handle": handle_validation_error},
     {"exception": EntityValidationException, "handle": handle_entity_validation_error},
@@ -81,6 +97,14 @@ handlers = [
         "exception": CategoryAlreadyExistsException,
         "handle": handle_category_already_exists_error,
     },
+    {
+        "exception": DuplicateKeyException,
+        "handle": handle_duplicate_key_error,
+    },
+    {
+        "exception": CryptographyBusyException,
+        "handle": handle_cryptography_busy_error,
+    },
 ]
 
 
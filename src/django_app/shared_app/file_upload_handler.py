@@ -1,9 +1,15 @@
+from django.core.files.uploadedfile import UploadedFile
 from rest_framework.request import Request
 
 from src.core.shared.domain.exceptions import InvalidArgumentException
 
 
 class FileUploadHandler:
+    # Uploads are described with a lazy `chunks` iterator rather than their
+    # bytes; pass it to `IStorage.store_stream` so only one chunk is held in
+    # memory at a time.
+    def __init__(self, chunk_size: int | None = None):
+        self.chunk_size = chunk_size
 
     def handle_uploaded_files_by_dict(
         self, request: Request, file_fields: dict
@@ -20,14 +26,7 @@ class FileUploadHandler:
         for field, field_name in file_fields.items():
             file = request.FILES.get(field_name)
             if file:
-                files.append(
-                    {
-                        "field": field,
-                        "file_name": file.name,
-                        "content": file.read(),
-                        "content_type": file.content_type,
-                    }
-                )
+                files.append(self._describe(field, file))
         return files
 
     def handle_uploaded_files_by_list(self, request: Request, fields: list) -> list:
@@ -41,12 +40,14 @@ class FileUploadHandler:
         for field in fields:
             file = request.FILES.get(field)
             if file:
-                files.append(
-                    {
-                        "field": field,
-                        "file_name": file.name,
-                        "content": file.read(),
-                        "content_type": file.content_type,
-                    }
-                )
+                files.append(self._describe(field, file))
         return files
+
+    def _describe(self, field: str, file: UploadedFile) -> dict:
+        return {
+            "field": field,
+            "file_name": file.name,
+            "chunks": file.chunks(self.chunk_size),
+            "size": file.size,
+            "content_type": file.content_type,
+        }
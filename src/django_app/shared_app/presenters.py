@@ -1,16 +1,21 @@
 from abc import ABC
 from dataclasses import dataclass, field
-from typing import Any, List
-from pydantic import TypeAdapter
+import json
+from typing import Any, Dict, List
 
 from src.core.shared.application.pagination_output import PaginationOutput
+from src.core.shared.domain.type_adapters import type_adapter
 
 
 class ResourcePresenter(ABC):
     def serialize(self):
-        data = TypeAdapter(self.__class__).dump_python(self)
+        data = type_adapter(self.__class__).dump_python(self)
         return {"data": data}
 
+    def serialize_json(self) -> bytes:
+        data = type_adapter(self.__class__).dump_json(self)
+        return b'{"data":' + data + b"}"
+
 
 @dataclass(slots=True)
 class CollectionPresenter(ABC):
@@ -18,15 +23,41 @@ class CollectionPresenter(ABC):
     pagination: PaginationOutput[Any] | None = field(init=False, default=None)
 
     def serialize(self):
-        data = [TypeAdapter(item.__class__).dump_python(item) for item in self.data]
-        meta = (
+        return {"data": self.dump_data(), "meta": self.meta()}
+
+    def serialize_json(self) -> bytes:
+        meta = json.dumps(self.meta(), separators=(",", ":")).encode()
+        return b'{"data":' + self.dump_data_json() + b',"meta":' + meta + b"}"
+
+    def meta(self) -> Dict[str, Any] | None:
+        return (
             {
                 "total": self.pagination.total,
                 "current_page": self.pagination.current_page,
                 "per_page": self.pagination.per_page,
                 "last_page": self.pagination.last_page,
+                "next_cursor": self.pagination.next_cursor,
+                "total_is_exact": self.pagination.total_is_exact,
             }
             if self.pagination is not None
             else None
         )
-        return {"data": data, "meta": meta}
+
+    def dump_data(self) -> List[Any]:
+        item_types = {item.__class__ for item in self.data}
+
+        if len(item_types) == 1:
+            (item_type,) = item_types
+            return type_adapter(List[item_type]).dump_python(self.data)
+
+        return [type_adapter(item.__class__).dump_python(item) for item in self.data]
+
+    def dump_data_json(self) -> bytes:
+        item_types = {item.__class__ for item in self.data}
+
+        if len(item_types) == 1:
+            (item_type,) = item_types
+            return type_adapter(List[item_type]).dump_json(self.data)
+
+        items = (type_adapter(item.__class__).dump_json(item) for item in self.data)
+        return b"[" + b",".join(items) + b"]"
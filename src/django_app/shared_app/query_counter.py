@@ -0,0 +1,69 @@
+import hashlib
+import json
+from typing import Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.db.models import QuerySet
+
+from src.core.shared.domain.repositories.search_params import CountMode
+
+
+class QueryCounter:
+    CACHE_PREFIX = "search_count"
+
+    def __init__(self, timeout: int | None = None):
+        self.timeout = (
+            timeout
+            if timeout is not None
+            else getattr(settings, "SEARCH_COUNT_CACHE_TIMEOUT", 60)
+        )
+
+    def count(self, query: QuerySet, mode: CountMode) -> Tuple[int | None, bool]:
+        query = query.order_by()
+
+        if mode == CountMode.NONE:
+            return None, False
+
+        if mode == CountMode.ESTIMATED:
+            # Without planner estimates (anything but PostgreSQL) this is a
+            # cached count.
+            estimate = self.estimate(query)
+            if estimate is not None:
+                return estimate, False
+            mode = CountMode.CACHED
+
+        if mode == CountMode.CACHED:
+            key = self.cache_key(query)
+            total = cache.get(key)
+            if total is not None:
+                return total, False
+
+            total = query.count()
+            cache.set(key, total, self.timeout)
+            return total, True
+
+        return query.count(), True
+
+    def cache_key(self, query: QuerySet) -> str:
+        sql, params = query.query.sql_with_params()
+        digest = hashlib.sha256(f"{sql}|{params!r}".encode("utf-8")).hexdigest()
+        return f"{self.CACHE_PREFIX}:{query.model._meta.label_lower}:{digest}"
+
+    def estimate(self, query: QuerySet) -> int | None:
+        # Only PostgreSQL exposes planner row estimates; other backends fall
+        # back to the cached count.
+        connection = connections[query.db]
+        if connection.vendor != "postgresql":
+            return None
+
+        sql, params = query.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+
+        return int(plan[0]["Plan"]["Plan Rows"])
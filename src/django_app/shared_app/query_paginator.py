@@ -0,0 +1,102 @@
+from dataclasses import dataclass
+from typing import Any, List
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q, QuerySet
+
+from src.core.shared.domain.exceptions import InvalidArgumentException
+from src.core.shared.domain.repositories.search_cursor import (
+    decode_cursor,
+    encode_cursor,
+)
+from src.core.shared.domain.repositories.search_params import (
+    CountMode,
+    SearchParams,
+    SortDirection,
+)
+from src.django_app.shared_app.query_counter import QueryCounter
+
+
+@dataclass(slots=True)
+class QueryPage:
+    models: List[Any]
+    total: int | None
+    next_cursor: str | None = None
+    total_is_exact: bool = True
+
+
+class QueryPaginator:
+    def __init__(
+        self,
+        query: QuerySet,
+        sort: str,
+        sort_dir: SortDirection | None,
+        counter: QueryCounter | None = None,
+    ):
+        self.counter = counter or QueryCounter()
+        self.pk_name = query.model._meta.pk.attname
+        self.filtered_query = query
+        self.sort = sort
+        self.is_desc = sort_dir == SortDirection.DESC
+
+        prefix = "-" if self.is_desc else ""
+        self.query = query.order_by(f"{prefix}{sort}", f"{prefix}pk")
+
+    def paginate(self, params: SearchParams[Any]) -> QueryPage:
+        if params.is_cursor_mode:
+            return self.paginate_by_cursor(params.cursor, params.per_page, params.count)
+        return self.paginate_by_page(params.page, params.per_page, params.count)
+
+    def paginate_by_page(
+        self, page: int, per_page: int, count: CountMode = CountMode.EXACT
+    ) -> QueryPage:
+        total, total_is_exact = self.counter.count(self.filtered_query, count)
+        offset = (page - 1) * per_page
+
+        if total_is_exact and offset >= total:
+            models = []
+        else:
+            models = list(self.query[offset : offset + per_page])
+
+        return QueryPage(models=models, total=total, total_is_exact=total_is_exact)
+
+    def paginate_by_cursor(
+        self, cursor: str, per_page: int, count: CountMode = CountMode.NONE
+    ) -> QueryPage:
+        total, total_is_exact = self.counter.count(self.filtered_query, count)
+        query = self.query
+
+        if cursor:
+            value, pk = decode_cursor(cursor, self.sort, 2)
+            lookup = "lt" if self.is_desc else "gt"
+            try:
+                query = query.filter(
+                    Q(**{f"{self.sort}__{lookup}": value})
+                    | Q(**{self.sort: value, f"pk__{lookup}": pk})
+                )
+            except ValidationError:
+                raise InvalidArgumentException("Invalid cursor")
+
+        # One extra row tells whether another page follows.
+        models = list(query[: per_page + 1])
+        next_cursor = None
+
+        if len(models) > per_page:
+            models = models[:per_page]
+            last = models[-1]
+            next_cursor = encode_cursor(
+                self.sort, self.value_of(last, self.sort), self.value_of(last, "pk")
+            )
+
+        return QueryPage(
+            models=models,
+            total=total,
+            next_cursor=next_cursor,
+            total_is_exact=total_is_exact,
+        )
+
+    def value_of(self, row: Any, field: str) -> Any:
+        # Rows are model instances, or dicts for `values()` querysets.
+        if isinstance(row, dict):
+            return row[self.pk_name if field == "pk" else field]
+        return getattr(row, field)
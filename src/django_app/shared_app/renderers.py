@@ -0,0 +1,46 @@
+import json
+
+from rest_framework.compat import (
+    INDENT_SEPARATORS,
+    LONG_SEPARATORS,
+    SHORT_SEPARATORS,
+)
+from rest_framework.renderers import JSONRenderer
+
+
+class PresenterJSONRenderer(JSONRenderer):
+    """JSON renderer that lets presenters write the response bytes.
+
+    Views may return a presenter as the response data; its `serialize_json`
+    dumps straight to compact JSON with the cached pydantic adapters, skipping
+    the intermediate dict. Any other data is rendered by DRF's JSONRenderer.
+    Presenter output is only re-encoded when DRF's COMPACT_JSON or UNICODE_JSON
+    is off or the client asks for an indent (`Accept: application/json;
+    indent=2`), so the bytes always match what JSONRenderer would produce.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if not hasattr(data, "serialize_json"):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        content = data.serialize_json()
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+
+        if indent is not None or not self.compact or self.ensure_ascii:
+            if indent is not None:
+                separators = INDENT_SEPARATORS
+            else:
+                separators = SHORT_SEPARATORS if self.compact else LONG_SEPARATORS
+
+            content = json.dumps(
+                json.loads(content),
+                indent=indent,
+                ensure_ascii=self.ensure_ascii,
+                allow_nan=not self.strict,
+                separators=separators,
+            ).encode()
+
+        # Escaped like JSONRenderer, so the output stays a JavaScript subset.
+        return content.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
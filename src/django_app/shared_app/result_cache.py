@@ -0,0 +1,95 @@
+import hashlib
+import threading
+import time
+from typing import Any, Callable, Dict, TypeVar
+
+from django.core.cache import cache
+
+from src.core.shared.domain.repositories.search_params import SearchParams
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+class VersionedResultCache:
+    # Entries are keyed by the namespace version, so bumping the version on a
+    # write orphans every cached result at once; the cache backend expires
+    # the orphans on its own. Entries and version are only shared between
+    # processes when the Django cache backend is; hit/miss stats are always
+    # per process.
+    CACHE_PREFIX = "result_cache"
+
+    def __init__(self, namespace: str, timeout: int = 300):
+        self.namespace = namespace
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @property
+    def version_key(self) -> str:
+        return f"{self.CACHE_PREFIX}:{self.namespace}:version"
+
+    def version(self) -> int:
+        version = cache.get(self.version_key)
+        if version is None:
+            # Start from the clock so an evicted counter never comes back to
+            # a version that still has entries in the cache.
+            cache.add(self.version_key, time.time_ns(), None)
+            version = cache.get(self.version_key)
+        return version
+
+    def bump(self) -> None:
+        try:
+            cache.incr(self.version_key)
+        except ValueError:
+            cache.add(self.version_key, time.time_ns(), None)
+
+    def key(self, kind: str, params: SearchParams[Any]) -> str:
+        normalized = "|".join(
+            str(value)
+            for value in (
+                params.page,
+                params.per_page,
+                params.sort,
+                params.sort_dir.value if params.sort_dir else None,
+                params.filter,
+                params.cursor,
+                params.count.value,
+            )
+        )
+        digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+        return f"{self.CACHE_PREFIX}:{self.namespace}:{self.version()}:{kind}:{digest}"
+
+    def get_or_set(
+        self, kind: str, params: SearchParams[Any], compute: Callable[[], T]
+    ) -> T:
+        key = self.key(kind, params)
+        value = cache.get(key, _MISSING)
+
+        if value is not _MISSING:
+            with self._lock:
+                self.hits += 1
+            return value
+
+        with self._lock:
+            self.misses += 1
+
+        value = compute()
+        cache.set(key, value, self.timeout)
+        return value
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "namespace": self.namespace,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
@@ -0,0 +1,17 @@
+from src.core.shared.domain.exceptions import DuplicateKeyException
+from src.django_app.shared_app.exception_handler import custom_exception_handler
+
+
+class TestCustomExceptionHandler:
+    def test_should_answer_duplicate_keys_with_conflict(self):
+        response = custom_exception_handler(
+            DuplicateKeyException("email", "john@example.com"), {}
+        )
+
+        assert response.status_code == 409
+        assert response.data == {
+            "message": "Index email already contains the key 'john@example.com'"
+        }
+
+    def test_should_leave_value_errors_to_rest_framework(self):
+        assert custom_exception_handler(ValueError("bug"), {}) is None
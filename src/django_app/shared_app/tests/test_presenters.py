@@ -0,0 +1,87 @@
+import json
+from dataclasses import dataclass
+from typing import Any, List
+
+import pytest
+
+from src.core.shared.domain import type_adapters as type_adapters_module
+from src.django_app.shared_app.presenters import (
+    CollectionPresenter,
+    ResourcePresenter,
+)
+
+
+@dataclass(slots=True)
+class StubPresenter(ResourcePresenter):
+    name: str
+    price: float
+
+
+@dataclass(slots=True)
+class OtherStubPresenter(ResourcePresenter):
+    label: str
+
+
+@dataclass(slots=True)
+class StubCollectionPresenter(CollectionPresenter):
+    items: List[Any]
+
+    def __post_init__(self):
+        self.data = self.items
+
+
+class TestPresenters:
+    @pytest.fixture(autouse=True)
+    def forget_adapters(self):
+        for type_ in (
+            StubPresenter,
+            OtherStubPresenter,
+            List[StubPresenter],
+            List[OtherStubPresenter],
+        ):
+            type_adapters_module._type_adapters.pop(type_, None)
+
+    def test_should_compile_one_adapter_per_type(self, monkeypatch):
+        compiled = []
+        adapter_class = type_adapters_module.TypeAdapter
+
+        def counting_adapter(type_):
+            compiled.append(type_)
+            return adapter_class(type_)
+
+        monkeypatch.setattr(type_adapters_module, "TypeAdapter", counting_adapter)
+
+        for _ in range(3):
+            StubPresenter(name="a", price=1).serialize()
+            StubCollectionPresenter([StubPresenter(name="a", price=1)]).serialize()
+
+        assert compiled == [StubPresenter, List[StubPresenter]]
+
+    def test_should_dump_a_single_type_collection_with_the_list_adapter(self):
+        presenter = StubCollectionPresenter(
+            [StubPresenter(name="a", price=1), StubPresenter(name="b", price=2)]
+        )
+
+        assert presenter.dump_data() == [
+            {"name": "a", "price": 1},
+            {"name": "b", "price": 2},
+        ]
+        assert json.loads(presenter.dump_data_json()) == presenter.dump_data()
+        assert List[StubPresenter] in type_adapters_module._type_adapters
+
+    def test_should_dump_mixed_collections_item_by_item(self):
+        presenter = StubCollectionPresenter(
+            [StubPresenter(name="a", price=1), OtherStubPresenter(label="b")]
+        )
+
+        assert presenter.dump_data() == [{"name": "a", "price": 1}, {"label": "b"}]
+        assert json.loads(presenter.dump_data_json()) == presenter.dump_data()
+        assert StubPresenter in type_adapters_module._type_adapters
+        assert OtherStubPresenter in type_adapters_module._type_adapters
+
+    def test_should_dump_an_empty_collection(self):
+        presenter = StubCollectionPresenter([])
+
+        assert presenter.dump_data() == []
+        assert presenter.dump_data_json() == b"[]"
+        assert presenter.serialize() == {"data": [], "meta": None}
@@ -0,0 +1,72 @@
+import time
+
+import pytest
+from django.test import Client
+
+from src.core.shared.domain.repositories.search_params import CountMode
+from src.django_app.category_app.models import CategoryModel
+from src.django_app.shared_app.query_counter import QueryCounter
+
+
+@pytest.mark.django_db
+class TestQueryCounter:
+    @pytest.fixture(autouse=True)
+    def categories(self):
+        for index in range(3):
+            CategoryModel.objects.create(name=f"category {index}")
+
+    def test_should_count_exactly(self):
+        counter = QueryCounter()
+
+        assert counter.count(CategoryModel.objects.all(), CountMode.EXACT) == (3, True)
+
+    def test_should_serve_cached_counts_until_the_timeout(self, monkeypatch):
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now)
+        counter = QueryCounter(timeout=60)
+        query = CategoryModel.objects.filter(is_active=True)
+
+        assert counter.count(query, CountMode.CACHED) == (3, True)
+
+        CategoryModel.objects.create(name="category 3")
+        assert counter.count(query, CountMode.CACHED) == (3, False)
+
+        monkeypatch.setattr(time, "time", lambda: now + 61)
+        assert counter.count(query, CountMode.CACHED) == (4, True)
+
+    def test_should_fall_back_to_the_cached_count_without_postgresql(self):
+        counter = QueryCounter()
+        query = CategoryModel.objects.all()
+
+        assert counter.estimate(query) is None
+        assert counter.count(query, CountMode.ESTIMATED) == (3, True)
+
+        CategoryModel.objects.create(name="category 3")
+        assert counter.count(query, CountMode.ESTIMATED) == (3, False)
+
+    def test_should_flag_cached_hits_as_inexact(self, django_assert_num_queries):
+        counter = QueryCounter()
+        query = CategoryModel.objects.all()
+
+        assert counter.count(query, CountMode.CACHED) == (3, True)
+
+        with django_assert_num_queries(0):
+            assert counter.count(query, CountMode.CACHED) == (3, False)
+
+    def test_should_skip_the_count(self):
+        counter = QueryCounter()
+
+        assert counter.count(CategoryModel.objects.all(), CountMode.NONE) == (
+            None,
+            False,
+        )
+
+    def test_should_not_report_a_last_page_without_a_count(self):
+        response = Client().get("/api/categories", {"count": "none"})
+
+        meta = response.json()["meta"]
+        assert response.status_code == 200
+        assert len(response.json()["data"]) == 3
+        assert meta["total"] is None
+        assert meta["total_is_exact"] is False
+        assert meta["last_page"] is None
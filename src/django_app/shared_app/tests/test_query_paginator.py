@@ -0,0 +1,112 @@
+import datetime
+import uuid
+
+import pytest
+from django.test import Client
+
+from src.core.shared.domain.exceptions import InvalidArgumentException
+from src.core.shared.domain.repositories.search_cursor import encode_cursor
+from src.core.shared.domain.repositories.search_params import (
+    CountMode,
+    SortDirection,
+)
+from src.django_app.category_app.models import CategoryModel
+from src.django_app.shared_app.query_paginator import QueryPaginator
+
+
+def walk(sort_dir: SortDirection, per_page: int):
+    paginator = QueryPaginator(CategoryModel.objects.all(), "created_at", sort_dir)
+    pages, cursor = [], None
+
+    while True:
+        page = paginator.paginate_by_cursor(cursor, per_page)
+        pages.append(page)
+        if page.next_cursor is None:
+            return pages
+        cursor = page.next_cursor
+
+
+@pytest.mark.django_db
+class TestQueryPaginator:
+    @pytest.fixture(autouse=True)
+    def categories(self):
+        tied = datetime.datetime(2024, 1, 2, tzinfo=datetime.timezone.utc)
+        self.models = [
+            CategoryModel.objects.create(name=f"tied {index}", created_at=tied)
+            for index in range(5)
+        ]
+        self.models += [
+            CategoryModel.objects.create(
+                name=f"day {day}",
+                created_at=datetime.datetime(2024, 1, day, tzinfo=datetime.timezone.utc),
+            )
+            for day in (1, 3)
+        ]
+
+    def expected(self, reverse: bool):
+        models = sorted(
+            self.models, key=lambda model: (model.created_at, model.id), reverse=reverse
+        )
+        return [model.id for model in models]
+
+    def test_should_walk_ties_in_ascending_order(self):
+        pages = walk(SortDirection.ASC, per_page=2)
+
+        ids = [model.id for page in pages for model in page.models]
+        assert ids == self.expected(reverse=False)
+        assert [len(page.models) for page in pages] == [2, 2, 2, 1]
+
+    def test_should_walk_ties_in_descending_order(self):
+        pages = walk(SortDirection.DESC, per_page=2)
+
+        ids = [model.id for page in pages for model in page.models]
+        assert ids == self.expected(reverse=True)
+
+    def test_should_not_return_a_cursor_on_the_last_page(self):
+        pages = walk(SortDirection.ASC, per_page=7)
+
+        assert len(pages) == 1
+        assert len(pages[0].models) == 7
+        assert pages[0].next_cursor is None
+        assert pages[0].total is None
+
+    def test_should_not_count_cursor_pages_by_default(
+        self, django_assert_num_queries
+    ):
+        paginator = QueryPaginator(
+            CategoryModel.objects.all(), "created_at", SortDirection.ASC
+        )
+
+        with django_assert_num_queries(1):
+            page = paginator.paginate_by_cursor(None, 2)
+
+        assert page.total is None
+        assert page.total_is_exact is False
+
+    def test_should_count_cursor_pages_on_request(self):
+        paginator = QueryPaginator(
+            CategoryModel.objects.all(), "created_at", SortDirection.ASC
+        )
+
+        page = paginator.paginate_by_cursor(None, 2, CountMode.EXACT)
+
+        assert page.total == 7
+        assert page.total_is_exact is True
+
+    def test_should_reject_cursors_with_invalid_values(self):
+        paginator = QueryPaginator(
+            CategoryModel.objects.all(), "created_at", SortDirection.ASC
+        )
+        cursor = encode_cursor("created_at", "not a date", str(uuid.uuid4()))
+
+        with pytest.raises(InvalidArgumentException):
+            paginator.paginate_by_cursor(cursor, 2)
+
+    def test_should_answer_400_to_a_tampered_cursor(self):
+        cursor = walk(SortDirection.DESC, per_page=2)[0].next_cursor
+        client = Client()
+
+        assert client.get("/api/categories", {"cursor": cursor}).status_code == 200
+        for tampered in (cursor[:-3], "x" + cursor, cursor[::-1]):
+            response = client.get("/api/categories", {"cursor": tampered})
+            assert response.status_code == 400
@@ -0,0 +1,90 @@
+import datetime
+import uuid
+
+import pytest
+from django.test import Client
+from rest_framework.renderers import JSONRenderer
+
+from src.core.category.application.use_cases.common.category_output import (
+    CategoryOutput,
+)
+from src.core.category.application.use_cases.list_categories import (
+    ListCategoriesOutput,
+)
+from src.django_app.category_app.models import CategoryModel
+from src.django_app.category_app.presenters import (
+    CategoryCollectionPresenter,
+    CategoryPresenter,
+)
+from src.django_app.shared_app.renderers import PresenterJSONRenderer
+
+
+def category_output(name: str, microsecond: int = 0) -> CategoryOutput:
+    moment = datetime.datetime(
+        2024, 5, 1, 12, 30, microsecond=microsecond, tzinfo=datetime.timezone.utc
+    )
+    return CategoryOutput(
+        id=uuid.uuid4(),
+        name=name,
+        description=None,
+        is_active=True,
+        created_at=moment,
+        updated_at=moment.astimezone(datetime.timezone(datetime.timedelta(hours=-3))),
+    )
+
+
+def presenters():
+    items = [
+        category_output("Café\u2028lines", microsecond=123456),
+        category_output('Quotes "and" \\slashes'),
+    ]
+    output = ListCategoriesOutput(
+        items=items,
+        total=2,
+        current_page=1,
+        per_page=15,
+        last_page=1,
+        next_cursor="eyJhIjoxfQ",
+    )
+    return [CategoryPresenter.from_output(items[0]), CategoryCollectionPresenter(output)]
+
+
+class TestPresenterJSONRenderer:
+    @pytest.mark.parametrize("presenter", presenters())
+    @pytest.mark.parametrize(
+        "media_type", [None, "application/json; indent=2", "application/json; indent=0"]
+    )
+    def test_should_match_drf_json_renderer(self, presenter, media_type):
+        expected = JSONRenderer().render(presenter.serialize(), media_type)
+
+        assert PresenterJSONRenderer().render(presenter, media_type) == expected
+
+    @pytest.mark.parametrize("presenter", presenters())
+    def test_should_match_drf_json_renderer_with_loose_settings(self, presenter):
+        drf_renderer, renderer = JSONRenderer(), PresenterJSONRenderer()
+        for instance in (drf_renderer, renderer):
+            instance.compact = False
+            instance.ensure_ascii = True
+
+        assert renderer.render(presenter) == drf_renderer.render(presenter.serialize())
+
+    def test_should_render_other_data_like_drf(self):
+        data = {"message": "Not found"}
+
+        assert PresenterJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+@pytest.mark.django_db
+class TestPresenterJSONRendererResponses:
+    def test_should_indent_when_the_accept_header_asks_for_it(self):
+        CategoryModel.objects.create(name="Movies")
+        client = Client()
+
+        compact = client.get("/api/categories", HTTP_ACCEPT="application/json")
+        indented = client.get(
+            "/api/categories", HTTP_ACCEPT="application/json; indent=4"
+        )
+
+        assert compact.content.startswith(b'{"data":[{"id":')
+        assert indented.content.startswith(b'{\n    "data": [\n        {\n')
+        assert indented.json() == compact.json()
@@ -0,0 +1,66 @@
+from django.core.cache import cache
+
+from src.core.shared.domain.repositories.search_params import SearchParams
+from src.django_app.shared_app.result_cache import VersionedResultCache
+
+
+class StubSearchParams(SearchParams[str]):
+    pass
+
+
+class TestVersionedResultCache:
+    def test_should_compute_once_per_version(self):
+        result_cache = VersionedResultCache("stubs")
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return len(calls)
+
+        assert result_cache.get_or_set("page", StubSearchParams(), compute) == 1
+        assert result_cache.get_or_set("page", StubSearchParams(), compute) == 1
+
+        result_cache.bump()
+
+        assert result_cache.get_or_set("page", StubSearchParams(), compute) == 2
+        assert result_cache.stats()["hits"] == 1
+        assert result_cache.stats()["misses"] == 2
+
+    def test_should_cache_falsy_results(self):
+        result_cache = VersionedResultCache("stubs")
+
+        result_cache.get_or_set("page", StubSearchParams(), lambda: None)
+
+        assert result_cache.get_or_set("page", StubSearchParams(), lambda: 1) is None
+
+    def test_should_not_reuse_entries_after_the_version_is_evicted(self):
+        result_cache = VersionedResultCache("stubs")
+        result_cache.get_or_set("page", StubSearchParams(), lambda: "old")
+
+        cache.delete(result_cache.version_key)
+
+        result = result_cache.get_or_set("page", StubSearchParams(), lambda: "new")
+        assert result == "new"
+
+    def test_should_start_a_new_version_when_bumping_an_evicted_one(self):
+        result_cache = VersionedResultCache("stubs")
+        result_cache.get_or_set("page", StubSearchParams(), lambda: "old")
+
+        cache.delete(result_cache.version_key)
+        result_cache.bump()
+
+        result = result_cache.get_or_set("page", StubSearchParams(), lambda: "new")
+        assert result == "new"
+
+    def test_should_reset_stats(self):
+        result_cache = VersionedResultCache("stubs")
+        result_cache.get_or_set("page", StubSearchParams(), lambda: 1)
+
+        result_cache.reset_stats()
+
+        assert result_cache.stats() == {
+            "namespace": "stubs",
+            "hits": 0,
+            "misses": 0,
+            "hit_rate": 0.0,
+        }
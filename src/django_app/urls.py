@@ -23,7 +23,11 @@ from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
 from drf_yasg.generators import OpenAPISchemaGenerator
 
-from src.django_app.authentication_app.views import AuthenticationAPIView
+from src.django_app.authentication_app.views import (
+    AuthCacheStatsAPIView,
+    AuthenticationAPIView,
+    LogoutAPIView,
+)
 
 
 # class CustomSchemaGenerator(OpenAPISchemaGenerator):
@@ -129,6 +133,12 @@ urlpatterns = [
     path("api/", include("src.django_app.category_app.urls")),
     # Rota para AuthenticationAPIView
     path("api/login", AuthenticationAPIView.as_view(), name="login"),
+    path("api/logout", LogoutAPIView.as_view(), name="logout"),
+    path(
+        "api/auth/cache-stats",
+        AuthCacheStatsAPIView.as_view(),
+        name="auth-cache-stats",
+    ),
     path(
         "swagger",
         schema_view.with_ui("swagger", cache_timeout=0),